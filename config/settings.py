@@ -32,9 +32,13 @@ GOLD_DIR = DATA_DIR / "gold"
 RAW_DIR = DATA_DIR / "raw"          # legacy, keep for now
 REFERENCE_DIR = DATA_DIR / "reference"
 DB_PATH = DATA_DIR / "db" / "mlb_betting.duckdb"
+DB_VERSIONS_DIR = DATA_DIR / "db" / "versions"    # published read-only copies (src/database/writer.py)
+DB_WRITER_SOCKET = DATA_DIR / "db" / "writer.sock"
+QUERY_CACHE_DIR = DATA_DIR / "db" / "query_cache"     # Arrow IPC query results (db_manager.cached_query)
 
 # Named subdirectory paths
 BRONZE_ODDS_DIR = BRONZE_DIR / "odds"
+BRONZE_ODDS_DELTA_DIR = BRONZE_DIR / "odds_delta"
 BRONZE_LINEUPS_DIR = BRONZE_DIR / "lineups"
 SILVER_LINEUPS_DIR = SILVER_DIR / "lineups"
 SCHEDULES_DIR = DATA_DIR / "schedules"
@@ -42,6 +46,8 @@ PLAYER_LOGS_DIR = DATA_DIR / "player_logs"
 GAME_BY_GAME_DIR = PLAYER_LOGS_DIR / "game_by_game"
 FANGRAPHS_DIR = PLAYER_LOGS_DIR / "fangraphs_leaderboards"
 SIMULATIONS_DIR = DATA_DIR / "simulations"
+LINE_MOVEMENT_DIR = GOLD_DIR / "line_movement"
+RAW_ARCHIVE_DIR = RAW_DIR / "archive"   # zstd raw API/HTML responses (src/database/raw_archive.py)
 
 # Create directories if missing
 for d in [BRONZE_DIR, SILVER_DIR, GOLD_DIR, RAW_DIR, REFERENCE_DIR, DB_PATH.parent,
@@ -60,6 +66,39 @@ LINEAR_WEIGHTS_PATH = REFERENCE_DIR / "linear_weights.parquet"
 ROT_WIRE_DELAY = 2.0          # seconds between requests
 THE_RUNDOWN_API_KEY = os.getenv("THE_RUNDOWN_API_KEY")
 
+# Legacy BR game-log backfill (player_logs_fetcher --legacy): requests per
+# minute shared by all workers (bursts of at most BR_BURST), and worker threads
+BR_REQUESTS_PER_MINUTE = float(os.getenv("BR_REQUESTS_PER_MINUTE", "15"))
+BR_BURST = int(os.getenv("BR_BURST", "2"))
+BR_BACKFILL_WORKERS = int(os.getenv("BR_BACKFILL_WORKERS", "3"))
+
+# Odds ingest mode: "full" writes every outcome row on every poll to
+# data/bronze/odds/; "delta" writes only changed prices to data/bronze/odds_delta/
+ODDS_INGEST_MODE = os.getenv("ODDS_INGEST_MODE", "full")
+
+# Process-wide in-memory DuckDB (src/database/db_manager.cursor()):
+# worker threads (0 = all cores) and memory cap (DuckDB size string, e.g. "4GB")
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", "0"))
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "4GB")
+
+# Lake views to keep materialized as native t_* tables in mlb_betting.duckdb,
+# refreshed incrementally by writer_connection(): comma-separated view names
+# (e.g. "v_game_logs_batting,v_game_logs_pitching"), "all", or empty (off)
+DB_MATERIALIZE = [v.strip() for v in os.getenv("DB_MATERIALIZE", "").split(",") if v.strip()]
+
+# How long a published database version, and the Parquet files it reads,
+# outlive being replaced by a newer version (readers holding it stay valid)
+LAKE_GRACE_SECONDS = int(os.getenv("LAKE_GRACE_SECONDS", "3600"))
+
+# Longest a latest_odds upsert waits to be published: the writer batches the
+# per-scrape upserts into one published version per interval instead of
+# copying the database after every scrape
+DB_PUBLISH_INTERVAL_SECONDS = int(os.getenv("DB_PUBLISH_INTERVAL_SECONDS", "60"))
+
+# Size cap of the query result cache (db_manager.cached_query); least recently
+# used results are evicted past it. 0 turns the cache off.
+QUERY_CACHE_MAX_MB = int(os.getenv("QUERY_CACHE_MAX_MB", "2048"))
+
 # Matching thresholds
 MATCH_CONFIDENCE_THRESHOLD = 85
 FUZZY_THRESHOLD = 90
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Baseball Reference table parsing, BeautifulSoup vs br_tables.
+
+Times parsing the players_standard_* table out of saved BR pages two ways
+and checks both return exactly the same rows:
+    before   — BeautifulSoup(page, "lxml") over the whole page, then every
+               comment node searched for the table id (the old
+               _scrape_standard_page parser, reproduced below)
+    after    — br_tables.parse_table_rows(): byte search for the table,
+               lxml on that fragment only
+Times are medians in milliseconds.
+
+Pass saved pages (e.g. curl -o 2026-standard-batting.shtml ...); the table
+id comes from the file name. Without pages, a synthetic page shaped like the
+full-season standard batting page is generated: about 4 MB, with the
+1,500-row table inside an HTML comment.
+
+Usage:
+    python scripts/bench_br_parse.py
+    python scripts/bench_br_parse.py pages/2026-standard-batting.shtml pages/2026-standard-pitching.shtml --repeat 5
+"""
+
+import sys
+import argparse
+import random
+import re
+import statistics
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup
+
+from src.data_ingestion.br_tables import parse_table_rows
+
+_HEADERS = ["Rk", "Player", "Age", "Team", "Lg", "WAR", "G", "PA", "AB", "R", "H", "2B", "3B",
+            "HR", "RBI", "SB", "CS", "BB", "SO", "BA", "OBP", "SLG", "OPS", "OPS+", "rOBA",
+            "Rbat+", "TB", "GIDP", "HBP", "SH", "SF", "IBB", "Pos", "Awards"]
+
+
+def parse_before(html: str, table_id: str) -> list[dict] | None:
+    """_scrape_standard_page's BeautifulSoup parser as it was."""
+    soup = BeautifulSoup(html, "lxml")
+    table = soup.find("table", id=table_id)
+    if not table:
+        for comment in soup.find_all(string=lambda t: isinstance(t, str) and table_id in str(t)):
+            comment_soup = BeautifulSoup(str(comment), "lxml")
+            table = comment_soup.find("table", id=table_id)
+            if table:
+                break
+    if not table:
+        return None
+
+    headers = [th.get_text(strip=True) for th in table.find("thead").find_all("th")]
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        if tr.get("class") and ("thead" in tr["class"] or "spacer" in tr["class"]):
+            continue
+        cells = tr.find_all(["th", "td"])
+        if len(cells) < len(headers):
+            continue
+        row = {}
+        for i, cell in enumerate(cells):
+            if i < len(headers):
+                row[headers[i]] = cell.get_text(strip=True)
+        bbref_id = None
+        if tr.get("data-append-csv"):
+            bbref_id = tr["data-append-csv"]
+        if not bbref_id:
+            for cell in cells:
+                if cell.get("data-append-csv"):
+                    bbref_id = cell["data-append-csv"]
+                    break
+        if not bbref_id and "Player-additional" in row:
+            bbref_id = row["Player-additional"]
+        if not bbref_id:
+            link = tr.find("a", href=re.compile(r"/players/"))
+            if link:
+                bbref_id = link["href"].split("/")[-1].replace(".shtml", "")
+        if not bbref_id:
+            continue
+        row["bbref_id"] = bbref_id
+        if "Player" in row:
+            row["Player"] = re.sub(r'[*#†+]', '', row.get("Player", "")).strip()
+        rows.append(row)
+    return rows
+
+
+def synthetic_page(players: int = 1500) -> bytes:
+    """A standard-batting-shaped page: filler markup, then the player table inside a comment."""
+    rng = random.Random(7)
+    filler = "".join(
+        f'<div class="section" id="s{i}"><p>Note {i} &amp; more</p><!-- ad slot {i} -->'
+        f'<ul>{"".join(f"<li><a href=/teams/T{j}/2026.shtml>Team {j}</a></li>" for j in range(30))}</ul></div>\n'
+        for i in range(700))
+    head = "".join(f'<th aria-label="{h}" data-stat="{h}" scope="col">{h}</th>' for h in _HEADERS)
+    body = []
+    for i in range(players):
+        if i and i % 25 == 0:
+            body.append(f'<tr class="thead">{head}</tr>')
+        pid = f"player{i:04d}"
+        cells = [f'<th scope="row" data-stat="ranker">{i + 1}</th>',
+                 f'<td data-append-csv="{pid}" data-stat="name_display" csk="Player,{i}">'
+                 f'<a href="/players/p/{pid}.shtml">Jos&eacute; Player{i}</a>{rng.choice(["", "*", "#"])}</td>']
+        cells += [f'<td data-stat="{h}">{rng.randint(0, 120)}</td>' for h in _HEADERS[2:-2]]
+        cells += ['<td data-stat="pos">*8/H</td>', '<td data-stat="awards"> </td>']
+        body.append(f'<tr>{"".join(cells)}</tr>')
+    body.append(f'<tr><th>{players + 1}</th><td>League Average</td>{"<td></td>" * (len(_HEADERS) - 2)}</tr>')
+    table = (f'<div class="table_container" id="div_players_standard_batting">\n'
+             f'<table class="sortable stats_table" id="players_standard_batting" data-cols-to-freeze=",2">'
+             f'<caption>Player Standard Batting</caption><thead><tr>{head}</tr></thead>'
+             f'<tbody>{"".join(body)}</tbody></table></div>')
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>2026 Standard Batting</title></head>'
+            f'<body>{filler}<div id="all_players_standard_batting"><!--\n{table}\n--></div>'
+            f'{filler}</body></html>').encode("utf-8")
+
+
+def time_parse(fn, repeat: int) -> tuple[float, list[dict] | None]:
+    samples, rows = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BR player-table parsing")
+    parser.add_argument("pages", nargs="*", type=Path,
+                        help="Saved BR standard pages (*-standard-batting/pitching*)")
+    parser.add_argument("--repeat", type=int, default=5, help="Parses per timing (median)")
+    args = parser.parse_args()
+
+    pages = [(p.name, p.read_bytes()) for p in args.pages] or [("synthetic-standard-batting", synthetic_page())]
+
+    print(f"\n{'Page':<34} {'MB':>6} {'rows':>6} {'before ms':>10} {'after ms':>9} {'speedup':>8}  same")
+    print("-" * 86)
+    for name, page in pages:
+        table_id = "players_standard_pitching" if "pitching" in name else "players_standard_batting"
+        ms_before, rows_before = time_parse(lambda: parse_before(page.decode("utf-8"), table_id), args.repeat)
+        ms_after, rows_after = time_parse(lambda: parse_table_rows(page, table_id), args.repeat)
+        same = "yes" if rows_before == rows_after else "NO"
+        print(f"{name[:34]:<34} {len(page) / 1e6:>6.1f} {len(rows_after or []):>6,} "
+              f"{ms_before:>10.1f} {ms_after:>9.1f} {ms_before / ms_after:>7.1f}x  {same}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: db_manager.writer_connection() latency before/after the cached view registry.
+
+Builds a synthetic lake in a temp dir (one season of odds partitions with
+several part files per day, plus the flat datasets) and points db_manager at
+it. Then times opening a connection three ways (plus a bare duckdb.connect for reference):
+    before   — connect + glob all 14 patterns + CREATE OR REPLACE every view
+               and macro (the old register_views, reproduced below)
+    after    — writer_connection() with nothing changed since the last open
+    after+1  — writer_connection() right after a scrape wrote one new part file
+               (one directory signature changed: that view is re-pinned)
+Times are medians in milliseconds.
+
+Usage:
+    python scripts/bench_connection_open.py
+    python scripts/bench_connection_open.py --days 180 --parts 20 --repeat 15
+"""
+
+import sys
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import src.database.db_manager as db_manager
+from src.database.lake import odds_asof_sql
+from src.database.odds_delta import DELTA_KEYS
+
+
+def build_lake(base: Path, days: int, parts: int) -> None:
+    sample = base / "_sample.parquet"
+    pq.write_table(pa.table({"snapshot_timestamp": [1], "game_id": ["g"], "odds": [1.0]}), sample)
+    start = date(2026, 3, 26)
+    for source in ("the_odds_api", "kalshi", "polymarket"):
+        for d in range(days):
+            part_dir = base / f"data/bronze/odds/source={source}/snapshot_date={start + timedelta(days=d)}"
+            part_dir.mkdir(parents=True)
+            for i in range(parts):
+                shutil.copyfile(sample, part_dir / f"part-{i:06d}.parquet")
+    for rel in ("data/bronze/lineups/lineups_2026.parquet", "data/silver/lineups/lineups_2026.parquet",
+                "data/schedules/games_2026.parquet",
+                "data/player_logs/game_by_game/batting_game_logs_2026/game_date=2026-03-26/logs.parquet",
+                "data/player_logs/game_by_game/pitching_game_logs_2026/game_date=2026-03-26/logs.parquet",
+                "data/player_logs/fangraphs_leaderboards/batting_2026.parquet",
+                "data/player_logs/fangraphs_leaderboards/pitching_2026.parquet",
+                "data/reference/linear_weights.parquet"):
+        (base / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(sample, base / rel)
+    (base / "data/db").mkdir(parents=True, exist_ok=True)
+
+
+def register_views_before(con: duckdb.DuckDBPyConnection) -> None:
+    """register_views as it was: glob every pattern, re-create every object."""
+    base = db_manager.BASE_DIR
+    for view_name, rel_pattern in db_manager._VIEWS:
+        if not sorted(base.glob(rel_pattern)):
+            continue
+        con.execute(f"""
+            CREATE OR REPLACE VIEW {view_name} AS
+            SELECT * FROM read_parquet('{base / rel_pattern}', union_by_name=true,
+                                       hive_partitioning=true)
+        """)
+    for source in DELTA_KEYS:
+        if not any(base.glob(f"data/bronze/odds_delta/source={source}/snapshot_date=*/*.parquet")):
+            continue
+        con.execute(f"""
+            CREATE OR REPLACE MACRO odds_asof_{source}(ts) AS TABLE
+            SELECT * FROM {odds_asof_sql(source, "ts")}
+        """)
+
+
+def time_open(open_fn, repeat: int, before_each=None) -> float:
+    samples = []
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        t0 = time.perf_counter()
+        con = open_fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+        con.close()
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DuckDB connection-open latency")
+    parser.add_argument("--days", type=int, default=180, help="Odds partitions per source")
+    parser.add_argument("--parts", type=int, default=20, help="Part files per partition")
+    parser.add_argument("--repeat", type=int, default=11, help="Opens per timing (median)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        build_lake(base, args.days, args.parts)
+        db_manager.BASE_DIR = base
+        db_manager.DB_PATH = base / "data/db/mlb_betting.duckdb"
+        db_path = str(db_manager.DB_PATH)
+
+        def open_before():
+            con = duckdb.connect(db_path)
+            register_views_before(con)
+            return con
+
+        counter = iter(range(10**9))
+        today = base / f"data/bronze/odds/source=kalshi/snapshot_date={date(2026, 3, 26) + timedelta(days=args.days - 1)}"
+
+        def new_part():
+            shutil.copyfile(base / "_sample.parquet", today / f"part-new-{next(counter):06d}.parquet")
+
+        ms_connect = time_open(lambda: duckdb.connect(db_path), args.repeat)
+        ms_before = time_open(open_before, args.repeat)
+        db_manager.writer_connection().close()  # first open populates the manifest
+        ms_after = time_open(db_manager.writer_connection, args.repeat)
+        ms_after_write = time_open(db_manager.writer_connection, args.repeat, before_each=new_part)
+
+    files = 3 * args.days * args.parts
+    print(f"\nLake: {files:,} odds part files in {3 * args.days} partitions + 8 flat files")
+    print(f"{'Open':<34} {'ms':>8}")
+    print("-" * 44)
+    print(f"{'duckdb.connect only':<34} {ms_connect:>8.1f}")
+    print(f"{'before (glob + re-create all)':<34} {ms_before:>8.1f}")
+    print(f"{'after (nothing changed)':<34} {ms_after:>8.1f}")
+    print(f"{'after (one new part file)':<34} {ms_after_write:>8.1f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
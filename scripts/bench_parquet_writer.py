@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark: shared Arrow writer vs the old JSON tempfile round-trip.
+
+The old write path (used by every fetcher before parquet_writer.py) was:
+    json.dump(rows) → read_json_auto() → COPY ... TO parquet
+The new path builds a pyarrow.Table from the declared schema and writes it.
+
+Rows are synthetic but shaped like real scrapes (The Odds API outcome rows and
+Kalshi market rows). Nothing under data/ is touched — output goes to a temp dir.
+
+Usage:
+    python scripts/bench_parquet_writer.py
+    python scripts/bench_parquet_writer.py --rows 2000 20000 --repeat 7
+"""
+
+import sys
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import duckdb
+
+from src.database.parquet_writer import write_rows
+
+_TEAMS = ["Atlanta Braves", "Boston Red Sox", "New York Yankees", "Los Angeles Dodgers",
+          "Chicago Cubs", "Houston Astros", "Seattle Mariners", "San Diego Padres"]
+_BOOKS = ["draftkings", "fanduel", "betmgm", "caesars", "pointsbetus", "betrivers"]
+
+
+def make_odds_rows(n: int) -> list[dict]:
+    """Synthetic The Odds API rows (one per outcome/book/market)."""
+    rng = random.Random(7)
+    ts = datetime.now(timezone.utc).isoformat()
+    rows = []
+    while len(rows) < n:
+        away, home = rng.sample(_TEAMS, 2)
+        commence = (datetime.now(timezone.utc) + timedelta(hours=rng.randint(1, 30)))
+        for book in _BOOKS:
+            for market, outcomes in (("h2h", [(away, None), (home, None)]),
+                                     ("spreads", [(away, 1.5), (home, -1.5)]),
+                                     ("totals", [("Over", 8.5), ("Under", 8.5)])):
+                for name, point in outcomes:
+                    rows.append({
+                        "game_id": f"g{len(rows) // 36}",
+                        "sport_key": "baseball_mlb",
+                        "commence_time": commence.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "home_team": home,
+                        "away_team": away,
+                        "snapshot_timestamp": ts,
+                        "snapshot_date": ts[:10],
+                        "source": "the_odds_api",
+                        "bookmaker": book,
+                        "last_update": commence.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "market": market,
+                        "outcome_name": name,
+                        "odds": rng.choice([-150, -135, -110, 105, 120, 140]),
+                        "point": point,
+                    })
+    return rows[:n]
+
+
+def make_kalshi_rows(n: int) -> list[dict]:
+    """Synthetic Kalshi market rows."""
+    rng = random.Random(11)
+    ts = datetime.now(timezone.utc).isoformat()
+    return [{
+        "ticker": f"KXMLBSTGAME-26MAR261305ATLBOS-{i}",
+        "event_ticker": "KXMLBSTGAME-26MAR261305ATLBOS",
+        "title": "Atlanta vs Boston", "subtitle": None, "status": "active",
+        "yes_bid": rng.random(), "yes_ask": rng.random(),
+        "no_bid": rng.random(), "no_ask": rng.random(),
+        "volume": float(rng.randint(0, 10_000)), "volume_24h": 0.0, "open_interest": 0.0,
+        "close_time": "2026-03-27T03:00:00Z", "market_type": "game_winner",
+        "snapshot_timestamp": ts, "snapshot_date": ts[:10], "source": "kalshi",
+        "away_team": "ATL", "home_team": "BOS", "winner_side": "BOS",
+        "game_date": "2026-03-26", "game_time": "13:05",
+    } for i in range(n)]
+
+
+def legacy_write(rows: list[dict], target: Path) -> None:
+    """The pre-parquet_writer path: JSON tempfile → read_json_auto → COPY."""
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(tmp_fd, "w") as f:
+            json.dump(rows, f, default=str)
+        con = duckdb.connect()
+        con.execute(f"""
+            COPY (
+                SELECT * EXCLUDE (source, snapshot_date) REPLACE (
+                    TRY_CAST(snapshot_timestamp AS TIMESTAMPTZ) AS snapshot_timestamp
+                )
+                FROM read_json_auto('{tmp_path}')
+            ) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
+        """)
+        con.close()
+    finally:
+        os.unlink(tmp_path)
+
+
+def arrow_write(rows: list[dict], target: Path, dataset: str) -> None:
+    write_rows(rows, target, dataset, exclude=("source", "snapshot_date"))
+
+
+def time_it(fn, repeat: int) -> float:
+    """Median wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Arrow writer vs JSON round-trip")
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 5_000, 50_000],
+                        help="Row counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median)")
+    args = parser.parse_args()
+
+    print(f"\n{'Dataset':<20} {'Rows':>8} {'JSON (ms)':>11} {'Arrow (ms)':>11} {'Speedup':>8}")
+    print("-" * 62)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        for dataset, make in (("odds_the_odds_api", make_odds_rows),
+                              ("odds_kalshi", make_kalshi_rows)):
+            for n in args.rows:
+                rows = make(n)
+                legacy_ms = time_it(lambda: legacy_write(rows, out / "legacy.parquet"), args.repeat)
+                arrow_ms = time_it(lambda: arrow_write(rows, out / "arrow.parquet", dataset), args.repeat)
+                print(f"{dataset:<20} {n:>8,} {legacy_ms:>11.1f} {arrow_ms:>11.1f} "
+                      f"{legacy_ms / arrow_ms:>7.1f}x")
+
+        # Sanity: both paths must produce the same values (compared as text,
+        # since the Arrow path pins types the JSON path had to guess)
+        rows = make_odds_rows(1_000)
+        legacy_write(rows, out / "legacy.parquet")
+        arrow_write(rows, out / "arrow.parquet", "odds_the_odds_api")
+        con = duckdb.connect()
+        cols = [r[0] for r in con.execute(
+            f"DESCRIBE SELECT * FROM read_parquet('{out / "arrow.parquet"}')"
+        ).fetchall()]
+        as_text = ", ".join(f'CAST("{c}" AS VARCHAR)' for c in cols)
+        diff = con.execute(f"""
+            SELECT COUNT(*) FROM (
+                SELECT {as_text} FROM read_parquet('{out / "legacy.parquet"}')
+                EXCEPT ALL
+                SELECT {as_text} FROM read_parquet('{out / "arrow.parquet"}')
+            )
+        """).fetchone()[0]
+        con.close()
+        print(f"\n{'✅' if diff == 0 else '⚠️ '} Row-level diff between paths: {diff} rows")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row groups scanned before/after sorted, stats-rich lake writes.
+
+Writes the same synthetic data two ways into a temp dir:
+    before — arrival order, DuckDB COPY defaults (how the writers used to write)
+    after  — parquet_writer.write_table() with the dataset's sort_by,
+             row_group_rows and bloom_filter from config/data_schemas.yaml
+and runs the lookups the pipeline does against them:
+    _load_snapshot(year, stat_type, date)   snapshot_date = ? on a season of
+                                            cumulative batting snapshots
+    per-game odds lookup                    game_id = ? AND market = 'h2h' on a
+                                            day of The Odds API rows (the bronze
+                                            scan behind _load_odds_api before
+                                            latest_odds, and still behind
+                                            latest_odds --rebuild), for a game on
+                                            the slate and for one that isn't
+
+Row groups are counted from the files' own min/max statistics and bloom
+filters (parquet_metadata / parquet_bloom_probe) — the same checks DuckDB
+applies before reading a row group. Query times are medians.
+
+Usage:
+    python scripts/bench_scan_pruning.py
+    python scripts/bench_scan_pruning.py --days 180 --players 1400 --repeat 9
+"""
+
+import sys
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import duckdb
+
+from src.database.parquet_writer import rows_to_table, write_table
+
+_STATS = ["G", "PA", "AB", "R", "H", "2B", "3B", "HR", "RBI", "SB", "CS", "BB", "SO",
+          "TB", "GDP", "HBP", "SH", "SF", "IBB"]
+_BOOKS = ["draftkings", "fanduel", "betmgm", "caesars", "pointsbetus", "betrivers",
+          "bovada", "williamhill_us"]
+
+
+def make_cumulative_rows(days: int, players: int) -> list[dict]:
+    """A season of daily cumulative snapshots, appended day by day."""
+    rng = random.Random(3)
+    rows = []
+    start = date(2026, 3, 26)
+    for d in range(days):
+        snap = (start + timedelta(days=d)).isoformat()
+        for p in range(players):
+            row = {"Rk": p + 1, "Player": f"Player {p}", "Age": 20 + p % 18, "Team": "ATL",
+                   "bbref_id": f"player{p:04d}", "snapshot_date": snap}
+            for s in _STATS:
+                row[s] = rng.randint(0, 3) * (d + 1)
+            row["BA"] = round(rng.random() * 0.4, 3)
+            rows.append(row)
+    return rows
+
+
+def make_odds_day(polls: int, games: int) -> list[dict]:
+    """One day of 10-minute polls, in arrival (snapshot) order."""
+    rng = random.Random(5)
+    base = datetime(2026, 4, 10, 12, tzinfo=timezone.utc)
+    game_ids = [f"{rng.getrandbits(128):032x}" for _ in range(games)]  # API ids are random hex
+    rows = []
+    for i in range(polls):
+        ts = (base + timedelta(minutes=10 * i)).isoformat()
+        for g in range(games):
+            for book in _BOOKS:
+                for market, outcomes in (("h2h", [("Away", None), ("Home", None)]),
+                                         ("spreads", [("Away", 1.5), ("Home", -1.5)]),
+                                         ("totals", [("Over", 8.5), ("Under", 8.5)])):
+                    for name, point in outcomes:
+                        rows.append({
+                            "game_id": game_ids[g],
+                            "sport_key": "baseball_mlb",
+                            "commence_time": "2026-04-10T23:05:00Z",
+                            "home_team": f"Home {g}", "away_team": f"Away {g}",
+                            "snapshot_timestamp": ts, "bookmaker": book,
+                            "last_update": ts, "market": market, "outcome_name": name,
+                            "odds": float(rng.choice([-150, -135, -110, 105, 120, 140])),
+                            "point": point,
+                        })
+    return rows
+
+
+def write_before(rows: list[dict], dataset: str, target: Path) -> None:
+    """Arrival order, DuckDB COPY defaults."""
+    con = duckdb.connect()
+    con.register("_rows", rows_to_table(rows, dataset))
+    con.execute(f"COPY _rows TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
+    con.close()
+
+
+def row_groups(path: Path, column: str, value: str) -> tuple[int, int, int]:
+    """(row groups in file, row groups and rows a `column = value` filter must read).
+
+    A row group is skipped if its min/max excludes the value, or if its bloom
+    filter (when the file has one) says the value is absent.
+    """
+    con = duckdb.connect()
+    stats = con.execute(f"""
+        SELECT row_group_id, row_group_num_rows,
+               stats_min_value <= '{value}' AND stats_max_value >= '{value}'
+        FROM parquet_metadata('{path}')
+        WHERE path_in_schema = '{column}'
+    """).fetchall()
+    try:
+        bloom_excludes = {rg for rg, excl in con.execute(f"""
+            SELECT row_group_id, bloom_filter_excludes
+            FROM parquet_bloom_probe('{path}', '{column}', '{value}')
+        """).fetchall() if excl}
+    except duckdb.Error:
+        bloom_excludes = set()
+    con.close()
+    read = [n for rg, n, overlaps in stats if overlaps and rg not in bloom_excludes]
+    return len(stats), len(read), sum(read)
+
+
+def time_query(sql: str, repeat: int) -> float:
+    con = duckdb.connect()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        con.execute(sql).fetchall()
+        samples.append((time.perf_counter() - t0) * 1000)
+    con.close()
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row-group pruning of lake writes")
+    parser.add_argument("--days", type=int, default=120, help="Cumulative snapshot days")
+    parser.add_argument("--players", type=int, default=1200, help="Players per snapshot")
+    parser.add_argument("--polls", type=int, default=100, help="Odds polls in the day")
+    parser.add_argument("--games", type=int, default=15, help="Games on the slate")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per timing (median)")
+    args = parser.parse_args()
+
+    cases = []
+    cum_rows = make_cumulative_rows(args.days, args.players)
+    probe_date = (date(2026, 3, 26) + timedelta(days=args.days // 2)).isoformat()
+    cases.append(("_load_snapshot", "cumulative_snapshots", cum_rows, "snapshot_date", probe_date,
+                  "SELECT * FROM read_parquet('{f}') WHERE snapshot_date = '" + probe_date + "'"))
+
+    odds_rows = make_odds_day(args.polls, args.games)
+    probe_game = odds_rows[len(odds_rows) // 2]["game_id"]
+    game_sql = ("SELECT outcome_name, arg_max(odds, snapshot_timestamp) FROM read_parquet('{f}') "
+                "WHERE game_id = '%s' AND market = 'h2h' GROUP BY ALL")
+    cases.append(("odds per-game", "odds_the_odds_api", odds_rows, "game_id", probe_game,
+                  game_sql % probe_game))
+    # A game from another day's slate: inside the file's min/max, only a bloom filter rules it out
+    other_game = "7" + probe_game[1:]
+    cases.append(("odds other-day", "odds_the_odds_api", odds_rows, "game_id", other_game,
+                  game_sql % other_game))
+
+    print(f"\n{'Lookup':<16} {'Rows':>9}  {'Row groups read':>17}  {'Rows read':>19}  {'Query (ms)':>15}")
+    print(f"{'':<16} {'':>9}  {'before':>8} {'after':>8}  {'before':>9} {'after':>9}  {'before':>7} {'after':>7}")
+    print("-" * 94)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        for name, dataset, rows, column, value, sql in cases:
+            before, after = out / f"{dataset}_before.parquet", out / f"{dataset}_after.parquet"
+            write_before(rows, dataset, before)
+            write_table(rows_to_table(rows, dataset), after, dataset)
+
+            rg_before = row_groups(before, column, value)
+            rg_after = row_groups(after, column, value)
+            ms_before = time_query(sql.format(f=before), args.repeat)
+            ms_after = time_query(sql.format(f=after), args.repeat)
+            print(f"{name:<16} {len(rows):>9,}  "
+                  f"{f'{rg_before[1]}/{rg_before[0]}':>8} {f'{rg_after[1]}/{rg_after[0]}':>8}  "
+                  f"{rg_before[2]:>9,} {rg_after[2]:>9,}  {ms_before:>7.1f} {ms_after:>7.1f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -176,6 +176,74 @@ def consolidate_odds(dry_run: bool) -> dict:
     }
 
 
+# ============================================================
+# ODDS PARTITIONING (per-year files → Hive partitions)
+# ============================================================
+
+def partition_odds(dry_run: bool) -> dict:
+    """
+    Split data/bronze/odds/SOURCE_YYYY.parquet into the append-only layout
+    data/bronze/odds/source=SOURCE/snapshot_date=YYYY-MM-DD/part-legacy-N.parquet
+    Re-running overwrites the same part-legacy-* files, so it is idempotent.
+    """
+    print("\n" + "=" * 60)
+    print("TASK: Partition bronze odds → source=/snapshot_date=/")
+    print("=" * 60)
+
+    odds_dir = DATA_DIR / "bronze" / "odds"
+    sources = ["the_odds_api", "kalshi", "polymarket", "rundown"]
+    year_files = [
+        (source, pf) for source in sources
+        for pf in sorted(odds_dir.glob(f"{source}_*.parquet"))
+    ]
+    if not year_files:
+        print("   No per-year odds files to partition (already done?)")
+        return {"rows_before": 0, "rows_after": 0, "files_to_delete": []}
+
+    con = duckdb.connect()
+    rows_before = rows_after = 0
+    for source, pf in year_files:
+        n = count_rows(con, str(pf))
+        rows_before += n
+        target_dir = odds_dir / f"source={source}"
+        cols = table_columns(con, str(pf))
+        drop = ", ".join(c for c in ("source", "snapshot_date") if c in cols)
+        exclude_sql = f"EXCLUDE ({drop})" if drop else ""
+
+        if dry_run:
+            n_dates = con.execute(
+                f"SELECT COUNT(DISTINCT snapshot_date) FROM read_parquet('{pf}')"
+            ).fetchone()[0]
+            print(f"   [DRY RUN] Would split {n} rows from {pf.name} "
+                  f"into {n_dates} partition(s) under {target_dir.relative_to(ROOT)}")
+            rows_after += n
+            continue
+
+        # snapshot_date only exists as the partition directory in the new layout
+        con.execute(f"""
+            COPY (
+                SELECT * {exclude_sql},
+                       CAST(snapshot_date AS DATE) AS snapshot_date
+                FROM read_parquet('{pf}')
+            ) TO '{target_dir}' (
+                FORMAT PARQUET, COMPRESSION ZSTD,
+                PARTITION_BY (snapshot_date),
+                FILENAME_PATTERN 'part-legacy-{pf.stem}-{{i}}',
+                OVERWRITE_OR_IGNORE
+            )
+        """)
+        actual = count_rows(con, str(target_dir / "snapshot_date=*" / f"part-legacy-{pf.stem}-*.parquet"))
+        rows_after += actual
+        print(f"   ✅ {pf.name}: {actual} rows → {target_dir.relative_to(ROOT)}")
+
+    con.close()
+    return {
+        "rows_before": rows_before,
+        "rows_after": rows_after,
+        "files_to_delete": [str(pf) for _, pf in year_files],
+    }
+
+
 # ============================================================
 # BRONZE LINEUP CONSOLIDATION
 # ============================================================
@@ -511,6 +579,7 @@ def main():
 
     results = {}
     results["odds"]           = consolidate_odds(dry_run)
+    results["odds_partitions"] = partition_odds(dry_run)
     results["bronze_lineups"] = consolidate_bronze_lineups(dry_run)
     results["silver_lineups"] = consolidate_silver_lineups(dry_run)
     results["schedules"]      = move_schedules(dry_run)
@@ -522,7 +591,7 @@ def main():
     print("SUMMARY")
     print("=" * 60)
 
-    for key in ["odds", "bronze_lineups", "silver_lineups"]:
+    for key in ["odds", "odds_partitions", "bronze_lineups", "silver_lineups"]:
         r = results[key]
         before = r.get("rows_before", 0)
         after  = r.get("rows_after", 0)
@@ -536,6 +605,7 @@ def main():
     for key in ["odds", "bronze_lineups", "silver_lineups", "schedules", "player_logs"]:
         deletable.extend(results[key].get("folders_to_delete", []))
 
+    deletable.extend(results["odds_partitions"].get("files_to_delete", []))
     deletable.extend(results.get("linear_weights", {}).get("files_to_delete", []))
 
     stale_db = DATA_DIR / "mlb_betting.db"
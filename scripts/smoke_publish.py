@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Smoke test: publish a database version, then open an analytics connection on it.
+
+config/settings.py derives every path from the tree it lives in, so this
+copies config/ and src/ into a temp directory, writes a one-partition game-log
+lake there, and in that copy (DB_MATERIALIZE=all):
+    1. submit("publish")                              — the in-process writer path
+    2. analytics_connection(["v_game_logs_batting"])  — reads the published version
+    3. submit("publish") again with nothing changed   — must not write a new version
+and checks that the materialized table is served with the lake's rows.
+Exits non-zero on any failure.
+
+Usage:
+    python scripts/smoke_publish.py
+"""
+
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config.settings import GAME_BY_GAME_DIR
+from src.database.db_manager import analytics_connection, published_db
+from src.database.writer import submit
+
+part = GAME_BY_GAME_DIR / "batting_game_logs_2026" / "game_date=2026-04-01" / "logs.parquet"
+part.parent.mkdir(parents=True)
+pq.write_table(pa.table({"bbref_id": ["a", "b", "c"], "PA": [4, 3, 5]}), part)
+
+submit("publish")
+v1 = published_db()
+assert v1 is not None, "nothing published"
+con, fresh = analytics_connection(["v_game_logs_batting"])
+assert fresh == {"v_game_logs_batting"}, f"materialized table not served: {fresh}"
+rows = con.execute("SELECT count(*), sum(PA) FROM t_game_logs_batting").fetchone()
+assert rows == (3, 12), f"unexpected rows: {rows}"
+con.close()
+
+submit("publish")
+v2 = published_db()
+assert v2 == v1, f"unchanged lake published a new version: {v1.name} -> {v2.name}"
+print(f"published {v1.name}; analytics_connection read {rows[0]} rows; re-publish skipped")
+"""
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("config", "src"):
+            shutil.copytree(ROOT / name, Path(tmp) / name,
+                            ignore=shutil.ignore_patterns("__pycache__"))
+        env = {**os.environ, "DB_MATERIALIZE": "all", "PYTHONPATH": tmp}
+        result = subprocess.run([sys.executable, "-c", CHILD], cwd=tmp, env=env)
+    if result.returncode:
+        print("❌ publish → analytics_connection smoke test failed")
+        sys.exit(result.returncode)
+    print("✅ publish → analytics_connection smoke test passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Baseball Reference table extraction without parsing the whole page.
+
+BR's standard batting/pitching pages are 2-4 MB, and the player table is
+often shipped inside an HTML comment (<!-- <div ...><table id=...> -->)
+that a script un-comments in the browser. Building a full BeautifulSoup
+tree and then searching every comment node for the table id costs seconds
+of CPU per page. Instead:
+
+  1. The raw page bytes are searched for the table's opening tag
+     (<table ... id="TABLE_ID">) and the next </table>. The comment markers
+     are irrelevant to a byte search, so a hidden table is found the same
+     way as a live one.
+  2. Only that fragment is decoded and parsed, with lxml.
+  3. Rows are read with the same rules the BeautifulSoup parser used
+     (header and cell text stripped and joined, thead/spacer rows skipped,
+     bbref_id from data-append-csv, Player-additional or the player link),
+     so the rows are identical.
+
+Usage:
+    from src.data_ingestion.br_tables import parse_table_rows
+    rows = parse_table_rows(resp.content, "players_standard_batting", resp.encoding)
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import re
+
+import lxml.html
+
+_TABLE_END = re.compile(rb"</table\s*>", re.IGNORECASE)
+_PLAYER_HREF = re.compile(r"/players/")
+_HANDEDNESS = re.compile(r'[*#†+]')
+
+
+def extract_table_html(page: bytes, table_id: str) -> bytes | None:
+    """The <table id=table_id>...</table> fragment of a page (live or inside a comment)."""
+    start_tag = re.compile(rb"<table\b[^>]*\bid\s*=\s*[\"']?" + re.escape(table_id.encode())
+                           + rb"[\"'\s>]", re.IGNORECASE)
+    start = start_tag.search(page)
+    if start is None:
+        return None
+    end = _TABLE_END.search(page, start.end())
+    if end is None:
+        return None
+    return page[start.start():end.end()]
+
+
+def _strings(el):
+    """Text nodes under an element in document order, skipping comment text."""
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str):  # an element, not a comment / processing instruction
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el) -> str:
+    """Element text like BeautifulSoup's get_text(strip=True): each string stripped, then joined."""
+    return "".join(s.strip() for s in _strings(el))
+
+
+def parse_table_rows(page: bytes, table_id: str, encoding: str | None = "utf-8") -> list[dict] | None:
+    """Player rows of a BR stats table: {header: cell text, ..., "bbref_id"}.
+
+    Returns None if the page has no such table. Rows without a player ID
+    (league average, totals) are left out.
+    """
+    fragment = extract_table_html(page, table_id)
+    if fragment is None:
+        return None
+    table = lxml.html.fragment_fromstring(fragment.decode(encoding or "utf-8", errors="replace"))
+
+    thead = next(table.iter("thead"), None)
+    tbody = next(table.iter("tbody"), None)
+    if thead is None or tbody is None:
+        return None
+    headers = [_text(th) for th in thead.iter("th")]
+
+    rows = []
+    for tr in tbody.iter("tr"):
+        classes = (tr.get("class") or "").split()
+        if "thead" in classes or "spacer" in classes:
+            continue
+
+        cells = [c for c in tr.iterdescendants() if c.tag in ("th", "td")]
+        if len(cells) < len(headers):
+            continue
+        row = {headers[i]: _text(cell) for i, cell in enumerate(cells[:len(headers)])}
+
+        # data-append-csv on the row, then on a cell, then Player-additional, then the player link
+        bbref_id = tr.get("data-append-csv")
+        if not bbref_id:
+            bbref_id = next((c.get("data-append-csv") for c in cells if c.get("data-append-csv")), None)
+        if not bbref_id and "Player-additional" in row:
+            bbref_id = row["Player-additional"]
+        if not bbref_id:
+            link = next((a for a in tr.iter("a") if _PLAYER_HREF.search(a.get("href") or "")), None)
+            if link is not None:
+                # /players/a/arandjo01.shtml → arandjo01
+                bbref_id = link.get("href").split("/")[-1].replace(".shtml", "")
+        if not bbref_id:
+            continue
+        row["bbref_id"] = bbref_id
+
+        # Clean player name — remove handedness markers (*, #, +)
+        if "Player" in row:
+            row["Player"] = _HANDEDNESS.sub("", row.get("Player", "")).strip()
+        rows.append(row)
+    return rows
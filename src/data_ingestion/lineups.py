@@ -10,15 +10,19 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+import os
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 import re
-import duckdb
 
 from config.settings import BRONZE_DIR, SILVER_DIR, BASE_DIR
 from src.data_ingestion.player_id_matching import PlayerMatcher
+from src.database.db_manager import cursor
+from src.database.game_keys import stamp_game_pk
+from src.database.raw_archive import archive_response
 
 # Paths
 BRONZE_LINEUPS_DIR = BASE_DIR / "data" / "bronze" / "lineups"
@@ -41,13 +45,32 @@ def fetch_lineups(live=True, test_html=None) -> pd.DataFrame | None:
             print(f"❌ HTTP {resp.status_code} from Rotowire")
             return None
         html = resp.text
+        # Archived so parse_rotowire() changes can be re-applied to past pages
+        archive_response("rotowire_lineups", resp.content,
+                         fetch_timestamp.replace(tzinfo=timezone.utc).isoformat(), ext="html")
         print("✅ Fetched live Rotowire daily lineups")
 
     df = parse_rotowire(html, fetch_timestamp)
     if not df.empty:
+        df = add_game_pk(df)
         df = add_bbref_matching(df)
     return df
 
+def parse_archived(pages: list[tuple[dict, bytes]], snapshot_ts: str) -> list[dict]:
+    """Rebuild one scrape's lineup rows from its archived Rotowire page.
+
+    Same steps as fetch_lineups(): parse_rotowire(), game_pk, BBRef ids.
+    fetch_timestamp is the scrape's snapshot_timestamp (naive UTC, as fetched).
+    """
+    fetch_timestamp = datetime.fromisoformat(snapshot_ts).astimezone(timezone.utc).replace(tzinfo=None)
+    frames = [parse_rotowire(body.decode("utf-8"), fetch_timestamp) for _, body in pages]
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return []
+    df = add_game_pk(pd.concat(frames, ignore_index=True))
+    df = add_bbref_matching(df)
+    return df.to_dict("records")
+
 def parse_float(text):
     if not text or text.strip() in ["–", "-", ""]:
         return None
@@ -172,6 +195,21 @@ def parse_rotowire(html: str, fetch_timestamp: datetime) -> pd.DataFrame:
     print(f"✅ Parsed {len(df)} games")
     return df
 
+def add_game_pk(df: pd.DataFrame) -> pd.DataFrame:
+    """Stamp each game with its MLB game_pk (see src/database/game_keys.py)."""
+    if df.empty:
+        return df
+    df = df.copy()
+    # Rotowire lists the Eastern-time slate; fetch_timestamp is naive UTC
+    et_dates = [ts.replace(tzinfo=timezone.utc).astimezone(ZoneInfo("America/New_York")).date()
+                for ts in df["fetch_timestamp"]]
+    games = [{"game_date": d, "game_time": t, "away_team": a, "home_team": h}
+             for d, t, a, h in zip(et_dates, df["game_time"], df["away_team"], df["home_team"])]
+    resolved = stamp_game_pk("lineups", games)
+    df["game_pk"] = pd.array([g["game_pk"] for g in games], dtype="Int64")
+    print(f"✅ Resolved game_pk for {resolved}/{len(df)} games")
+    return df
+
 def add_bbref_matching(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
@@ -205,7 +243,7 @@ def save_lineups(df: pd.DataFrame):
     bronze_target = BRONZE_LINEUPS_DIR / f"lineups_{year}.parquet"
     silver_target = SILVER_LINEUPS_DIR / f"lineups_{year}.parquet"
 
-    con = duckdb.connect()
+    con = cursor()
     con.register("_df", df)
 
     # Bronze: append all raw rows
@@ -234,7 +272,7 @@ def save_lineups(df: pd.DataFrame):
         SELECT *
         FROM ({combined})
         QUALIFY row_number() OVER (
-            PARTITION BY game_date, away_team, home_team
+            PARTITION BY game_date, away_team, home_team, game_pk
             ORDER BY fetch_timestamp DESC
         ) = 1
     """
@@ -244,6 +282,52 @@ def save_lineups(df: pd.DataFrame):
 
     con.close()
 
+def replace_scrapes(rows: list[dict], scrape_ts: list[str], year: int) -> dict:
+    """Swap the rows of the given scrapes in a year's lineup files for `rows` (their re-parse).
+
+    Bronze keeps the rows of every other scrape (including ones fetched
+    before the archive existed); silver is re-derived from the new bronze
+    with save_lineups()' dedup. Each file is replaced atomically. Used by
+    src/scripts/reparse_archive.py.
+    """
+    bronze_target = BRONZE_LINEUPS_DIR / f"lineups_{year}.parquet"
+    silver_target = SILVER_LINEUPS_DIR / f"lineups_{year}.parquet"
+    scrapes = [datetime.fromisoformat(ts).astimezone(timezone.utc).replace(tzinfo=None)
+               for ts in scrape_ts]
+
+    con = cursor()
+    try:
+        parts = []
+        if bronze_target.exists():
+            con.register("_archived", pd.DataFrame({"ts": pd.to_datetime(scrapes)}))
+            path = str(bronze_target).replace("'", "''")
+            parts.append(f"""
+                SELECT * FROM read_parquet('{path}', union_by_name=true)
+                WHERE fetch_timestamp NOT IN (SELECT ts FROM _archived)
+            """)
+        if rows:
+            con.register("_df", pd.DataFrame(rows).astype({"game_pk": "Int64"}))
+            parts.append("SELECT * FROM _df")
+        if not parts:
+            return {"rows_kept": 0, "rows": 0}
+        bronze = con.execute(" UNION ALL BY NAME ".join(parts)).to_arrow_table()
+        con.register("_bronze", bronze)
+        silver_sql = """
+            SELECT * FROM _bronze
+            QUALIFY row_number() OVER (
+                PARTITION BY game_date, away_team, home_team, game_pk
+                ORDER BY fetch_timestamp DESC
+            ) = 1
+        """
+        for sql, target in (("SELECT * FROM _bronze", bronze_target), (silver_sql, silver_target)):
+            tmp = target.with_name(f".{target.name}.tmp")
+            tmp_path = str(tmp).replace("'", "''")
+            con.execute(f"COPY ({sql}) TO '{tmp_path}' (FORMAT PARQUET, COMPRESSION ZSTD)")
+            os.replace(tmp, target)
+    finally:
+        con.close()
+    return {"rows_kept": bronze.num_rows - len(rows), "rows": bronze.num_rows}
+
 if __name__ == "__main__":
     print("🚀 Fetching live Rotowire daily lineups...")
     df = fetch_lineups(live=True)
@@ -5,9 +5,12 @@ Fetches two market types:
   - KXMLBSTGAME: single game head-to-head winner markets
   - KXMLBWINS:   season win total markets
 
-Appends to data/bronze/odds/kalshi_YYYY.parquet (one file per year).
+Appends one part file per scrape to
+data/bronze/odds/source=kalshi/snapshot_date=YYYY-MM-DD/.
 Each row = one market with a snapshot_timestamp and market_type column.
 
+Each page of the raw REST response is archived (see src/database/raw_archive.py).
+
 No auth required for public market data reads.
 """
 
@@ -16,17 +19,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 import json
-import os
-import tempfile
 import time
-import duckdb
 import requests
 from datetime import datetime, timezone
 
-from config.settings import BASE_DIR
+from src.database.game_keys import stamp_game_pk
+from src.database.lake import write_odds_part
+from src.database.raw_archive import archive_response
+from src.database.latest_odds import upsert_latest_odds
+from src.database.line_movement import append_quotes
 
 PRODUCTION_HOST = "https://api.elections.kalshi.com/trade-api/v2"
-BRONZE_ODDS_DIR = BASE_DIR / "data" / "bronze" / "odds"
+SOURCE = "kalshi"
 
 _MONTH_MAP = {
     'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
@@ -118,21 +122,36 @@ def _market_to_row(market: dict, market_type: str, snapshot_ts: str, extra: dict
         "market_type":        market_type,
         "snapshot_timestamp": snapshot_ts,
         "snapshot_date":      snapshot_ts[:10],
-        "source":             "kalshi",
+        "source":             SOURCE,
         **extra,
     }
 
 
+def _page_rows(data: dict, series_ticker: str, snapshot_ts: str) -> list[dict]:
+    """Flat row dicts for one page of /markets."""
+    market_type = "game_winner" if series_ticker == "KXMLBSTGAME" else "win_total"
+    parser = _parse_game_ticker if series_ticker == "KXMLBSTGAME" else _parse_win_total_ticker
+    return [_market_to_row(market, market_type, snapshot_ts, parser(market.get("ticker", "")))
+            for market in data.get("markets", [])]
+
+
+def parse_archived(pages: list[tuple[dict, bytes]], snapshot_ts: str) -> list[dict]:
+    """Rebuild one scrape's rows from its archived (params, body) responses."""
+    rows = []
+    for params, body in pages:
+        rows.extend(_page_rows(json.loads(body), params["series_ticker"], snapshot_ts))
+    return rows
+
+
 def _fetch_series(session: requests.Session, series_ticker: str,
                   snapshot_ts: str) -> list[dict]:
     """Paginate through all markets for a series and return flat row dicts."""
-    market_type = "game_winner" if series_ticker == "KXMLBSTGAME" else "win_total"
-    parser = _parse_game_ticker if series_ticker == "KXMLBSTGAME" else _parse_win_total_ticker
     # Game markets are status=open; win totals are unopened pre-season so fetch without filter
     status = "open" if series_ticker == "KXMLBSTGAME" else None
 
     rows = []
     cursor = None
+    page = 0
     while True:
         params: dict = {
             "limit": 1000,
@@ -145,11 +164,11 @@ def _fetch_series(session: requests.Session, series_ticker: str,
 
         resp = session.get(f"{PRODUCTION_HOST}/markets", params=params, timeout=30)
         resp.raise_for_status()
+        archive_response(SOURCE, resp.content, snapshot_ts,
+                         {"series_ticker": series_ticker, "page": page})
         data = resp.json()
-
-        for market in data.get("markets", []):
-            rows.append(_market_to_row(market, market_type, snapshot_ts,
-                                       parser(market.get("ticker", ""))))
+        rows.extend(_page_rows(data, series_ticker, snapshot_ts))
+        page += 1
 
         cursor = data.get("cursor")
         if not cursor:
@@ -159,40 +178,18 @@ def _fetch_series(session: requests.Session, series_ticker: str,
     return rows
 
 
-def _append_to_parquet(rows: list[dict], year: int) -> None:
-    """Append rows to the per-year bronze parquet file via DuckDB."""
+def _append_to_parquet(rows: list[dict]) -> None:
+    """Write rows as a new part file in the bronze odds partition for their snapshot date."""
     if not rows:
         return
-    BRONZE_ODDS_DIR.mkdir(parents=True, exist_ok=True)
-    target = BRONZE_ODDS_DIR / f"kalshi_{year}.parquet"
-
-    # Write JSON to a temp file — avoids SQL quoting issues with inline JSON strings
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f, default=str)
-        con = duckdb.connect()
-        new_rows_sql = f"""
-            SELECT * REPLACE (
-                TRY_CAST(snapshot_timestamp AS TIMESTAMPTZ) AS snapshot_timestamp,
-                TRY_CAST(snapshot_date AS DATE) AS snapshot_date
-            )
-            FROM read_json_auto('{tmp_path}')
-        """
-        if target.exists():
-            final_sql = f"""
-                SELECT * FROM read_parquet('{target}', union_by_name=true)
-                UNION ALL BY NAME
-                ({new_rows_sql})
-            """
-        else:
-            final_sql = new_rows_sql
-        con.execute(f"COPY ({final_sql}) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-        n = con.execute(f"SELECT COUNT(*) FROM read_parquet('{target}')").fetchone()[0]
-        con.close()
-        print(f"   ✅ {target.name}: {n:,} total rows")
-    finally:
-        os.unlink(tmp_path)
+    stamp_game_pk(SOURCE, rows)
+    target = write_odds_part(rows, SOURCE)
+    append_quotes(SOURCE, rows)
+    upsert_latest_odds(SOURCE, rows)  # raises if the writer fails; the lake has the scrape
+    if target is None:
+        print("   ⏸️  No price changes since last poll")
+        return
+    print(f"   ✅ {target.parent.name}/{target.name}")
 
 
 def fetch_kalshi_mlb() -> list[dict] | None:
@@ -200,7 +197,6 @@ def fetch_kalshi_mlb() -> list[dict] | None:
     try:
         session = _make_session()
         snapshot_ts = datetime.now(timezone.utc).isoformat()
-        year = datetime.now(timezone.utc).year
 
         game_rows = _fetch_series(session, "KXMLBSTGAME", snapshot_ts)
         print(f"✅ Kalshi KXMLBSTGAME: {len(game_rows)} game winner markets")
@@ -215,7 +211,7 @@ def fetch_kalshi_mlb() -> list[dict] | None:
             print("⚠️  Kalshi: no markets returned")
             return None
 
-        _append_to_parquet(all_rows, year)
+        _append_to_parquet(all_rows)
         print(f"✅ Kalshi: {len(all_rows)} total rows appended")
         return all_rows
     except Exception as e:
@@ -1,11 +1,14 @@
 """
 Polymarket odds fetcher — uses Gamma Events API with tag_slug=mlb.
-Appends to data/bronze/odds/polymarket_YYYY.parquet (one file per year).
+Appends one part file per scrape to
+data/bronze/odds/source=polymarket/snapshot_date=YYYY-MM-DD/.
 Each row = one market with a snapshot_timestamp.
 
 Market types captured:
   game_winner  — moneyline, spread, or O/U from "Team A vs. Team B" events
   win_total    — "Will X win more than N.5 games" from the season win totals event
+
+Each page of the raw Gamma response is archived (see src/database/raw_archive.py).
 """
 
 import sys
@@ -13,24 +16,25 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 import json
-import os
 import re
-import tempfile
 import requests
-import duckdb
 from datetime import datetime, timezone
 
-from config.settings import BASE_DIR
+from src.database.game_keys import stamp_game_pk
+from src.database.lake import write_odds_part
+from src.database.raw_archive import archive_response
+from src.database.latest_odds import upsert_latest_odds
+from src.database.line_movement import append_quotes
 
 EVENTS_URL    = "https://gamma-api.polymarket.com/events"
-BRONZE_ODDS_DIR = BASE_DIR / "data" / "bronze" / "odds"
+SOURCE        = "polymarket"
 
 
 # ---------------------------------------------------------------------------
 # Fetching
 # ---------------------------------------------------------------------------
 
-def _fetch_mlb_events() -> list[dict]:
+def _fetch_mlb_events(snapshot_ts: str) -> list[dict]:
     """Fetch all active MLB events via tag_slug=mlb. Paginates if needed."""
     all_events: list[dict] = []
     offset = 0
@@ -49,6 +53,7 @@ def _fetch_mlb_events() -> list[dict]:
             timeout=30,
         )
         resp.raise_for_status()
+        archive_response(SOURCE, resp.content, snapshot_ts, {"offset": offset})
         batch = resp.json()
         if not batch:
             break
@@ -142,7 +147,7 @@ def _build_game_rows(event: dict, snapshot_ts: str) -> list[dict]:
             "accepting_orders":  m.get("acceptingOrders"),
             "snapshot_timestamp": snapshot_ts,
             "snapshot_date":     snapshot_ts[:10],
-            "source":            "polymarket",
+            "source":            SOURCE,
         })
     return rows
 
@@ -177,50 +182,43 @@ def _build_win_total_rows(event: dict, snapshot_ts: str) -> list[dict]:
             "accepting_orders":  m.get("acceptingOrders"),
             "snapshot_timestamp": snapshot_ts,
             "snapshot_date":     snapshot_ts[:10],
-            "source":            "polymarket",
+            "source":            SOURCE,
         })
     return rows
 
 
+def _events_to_rows(events: list[dict], snapshot_ts: str) -> list[dict]:
+    rows: list[dict] = []
+    for event in events:
+        if _is_game_event(event):
+            rows.extend(_build_game_rows(event, snapshot_ts))
+        elif _is_win_total_event(event):
+            rows.extend(_build_win_total_rows(event, snapshot_ts))
+    return rows
+
+
+def parse_archived(pages: list[tuple[dict, bytes]], snapshot_ts: str) -> list[dict]:
+    """Rebuild one scrape's rows from its archived (params, body) responses."""
+    events = [e for _params, body in pages for e in json.loads(body)]
+    return _events_to_rows(events, snapshot_ts)
+
+
 # ---------------------------------------------------------------------------
 # Storage
 # ---------------------------------------------------------------------------
 
-def _append_to_parquet(rows: list[dict], year: int) -> None:
-    """Append rows to the per-year bronze parquet file via DuckDB."""
+def _append_to_parquet(rows: list[dict]) -> None:
+    """Write rows as a new part file in the bronze odds partition for their snapshot date."""
     if not rows:
         return
-
-    BRONZE_ODDS_DIR.mkdir(parents=True, exist_ok=True)
-    target = BRONZE_ODDS_DIR / f"polymarket_{year}.parquet"
-
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f)
-        con = duckdb.connect()
-        new_rows_sql = f"""
-            SELECT * REPLACE (
-                TRY_CAST(snapshot_timestamp AS TIMESTAMPTZ) AS snapshot_timestamp,
-                TRY_CAST(snapshot_date AS DATE) AS snapshot_date,
-                TRY_CAST(volume AS DOUBLE) AS volume
-            )
-            FROM read_json_auto('{tmp_path}')
-        """
-        if target.exists():
-            final_sql = f"""
-                SELECT * FROM read_parquet('{target}', union_by_name=true)
-                UNION ALL BY NAME
-                ({new_rows_sql})
-            """
-        else:
-            final_sql = new_rows_sql
-        con.execute(f"COPY ({final_sql}) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-        n = con.execute(f"SELECT COUNT(*) FROM read_parquet('{target}')").fetchone()[0]
-        con.close()
-        print(f"   ✅ {target.name}: {n:,} total rows")
-    finally:
-        os.unlink(tmp_path)
+    stamp_game_pk(SOURCE, rows)
+    target = write_odds_part(rows, SOURCE)
+    append_quotes(SOURCE, rows)
+    upsert_latest_odds(SOURCE, rows)  # raises if the writer fails; the lake has the scrape
+    if target is None:
+        print("   ⏸️  No price changes since last poll")
+        return
+    print(f"   ✅ {target.parent.name}/{target.name}")
 
 
 # ---------------------------------------------------------------------------
@@ -230,16 +228,9 @@ def _append_to_parquet(rows: list[dict], year: int) -> None:
 def fetch_polymarket_mlb() -> list[dict] | None:
     """Fetch active Polymarket MLB markets and append to bronze parquet."""
     try:
-        events = _fetch_mlb_events()
         snapshot_ts = datetime.now(timezone.utc).isoformat()
-        year = datetime.now(timezone.utc).year
-
-        rows: list[dict] = []
-        for event in events:
-            if _is_game_event(event):
-                rows.extend(_build_game_rows(event, snapshot_ts))
-            elif _is_win_total_event(event):
-                rows.extend(_build_win_total_rows(event, snapshot_ts))
+        events = _fetch_mlb_events(snapshot_ts)
+        rows = _events_to_rows(events, snapshot_ts)
 
         if not rows:
             print("⚠️  Polymarket: no markets after filtering")
@@ -249,7 +240,7 @@ def fetch_polymarket_mlb() -> list[dict] | None:
         wt_rows   = [r for r in rows if r["market_type"] == "win_total"]
         print(f"✅ Polymarket: {len(game_rows)} game markets, {len(wt_rows)} win total markets")
 
-        _append_to_parquet(rows, year)
+        _append_to_parquet(rows)
         return rows
     except Exception as e:
         print(f"⚠️  Polymarket skipped: {e}")
@@ -1,7 +1,9 @@
 """
 TheRundown odds fetcher (dormant — no active subscription).
-Appends to data/bronze/odds/rundown_YYYY.parquet (one file per year).
+Appends one part file per scrape to
+data/bronze/odds/source=rundown/snapshot_date=YYYY-MM-DD/.
 Each row = one event with a snapshot_timestamp.
+The raw JSON response is archived first (see src/database/raw_archive.py).
 """
 
 import sys
@@ -9,46 +11,43 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 import json
-import os
-import tempfile
 import requests
-import duckdb
 from datetime import datetime, timezone
 
-from config.settings import THE_RUNDOWN_API_KEY, BASE_DIR
+from config.settings import THE_RUNDOWN_API_KEY
+from src.database.lake import write_odds_part
+from src.database.raw_archive import archive_response
 
 BASE_URL = "https://api.therundown.io/api/v2"
-BRONZE_ODDS_DIR = BASE_DIR / "data" / "bronze" / "odds"
+SOURCE = "rundown"
 
 
-def _append_to_parquet(rows: list[dict], year: int) -> None:
-    """Append rows to the per-year bronze parquet file via DuckDB."""
-    if not rows:
-        return
+def _events_to_rows(events: list[dict], snapshot_ts: str) -> list[dict]:
+    return [{
+        **event,
+        "snapshot_timestamp": snapshot_ts,
+        "snapshot_date": snapshot_ts[:10],
+        "source": SOURCE,
+    } for event in events]
 
-    BRONZE_ODDS_DIR.mkdir(parents=True, exist_ok=True)
-    target = BRONZE_ODDS_DIR / f"rundown_{year}.parquet"
 
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f)
-        con = duckdb.connect()
-        new_rows_sql = f"SELECT * FROM read_json_auto('{tmp_path}')"
-        if target.exists():
-            final_sql = f"""
-                SELECT * FROM read_parquet('{target}', union_by_name=true)
-                UNION ALL BY NAME
-                ({new_rows_sql})
-            """
-        else:
-            final_sql = new_rows_sql
-        con.execute(f"COPY ({final_sql}) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-        n = con.execute(f"SELECT COUNT(*) FROM read_parquet('{target}')").fetchone()[0]
-        con.close()
-        print(f"   ✅ {target.name}: {n:,} total rows")
-    finally:
-        os.unlink(tmp_path)
+def parse_archived(pages: list[tuple[dict, bytes]], snapshot_ts: str) -> list[dict]:
+    """Rebuild one scrape's rows from its archived (params, body) responses."""
+    rows = []
+    for _params, body in pages:
+        rows.extend(_events_to_rows(json.loads(body).get("events", []), snapshot_ts))
+    return rows
+
+
+def _append_to_parquet(rows: list[dict]) -> None:
+    """Write rows as a new part file in the bronze odds partition for their snapshot date."""
+    if not rows:
+        return
+    target = write_odds_part(rows, SOURCE)
+    if target is None:
+        print("   ⏸️  No price changes since last poll")
+        return
+    print(f"   ✅ {target.parent.name}/{target.name}")
 
 
 def fetch_rundown_mlb() -> list[dict] | None:
@@ -62,23 +61,17 @@ def fetch_rundown_mlb() -> list[dict] | None:
     try:
         resp = requests.get(url, headers=headers, timeout=15)
         resp.raise_for_status()
+        snapshot_ts = datetime.now(timezone.utc).isoformat()
+        archive_response(SOURCE, resp.content, snapshot_ts)
         events = resp.json().get("events", [])
 
         if not events:
             print("⚠️  TheRundown: no events returned")
             return None
 
-        snapshot_ts = datetime.now(timezone.utc).isoformat()
-        year = datetime.now(timezone.utc).year
-
-        rows = [{
-            **event,
-            "snapshot_timestamp": snapshot_ts,
-            "snapshot_date": snapshot_ts[:10],
-            "source": "rundown",
-        } for event in events]
+        rows = _events_to_rows(events, snapshot_ts)
 
-        _append_to_parquet(rows, year)
+        _append_to_parquet(rows)
         print(f"✅ TheRundown: {len(rows)} events appended")
         return rows
     except Exception as e:
@@ -1,7 +1,9 @@
 """
 The Odds API fetcher.
-Appends to data/bronze/odds/the_odds_api_YYYY.parquet (one file per year).
+Appends one part file per scrape to
+data/bronze/odds/source=the_odds_api/snapshot_date=YYYY-MM-DD/.
 Each row = one outcome/book/market combination with a snapshot_timestamp.
+The raw JSON response is archived first (see src/database/raw_archive.py).
 """
 
 import sys
@@ -9,16 +11,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent))
 
 import json
-import os
-import tempfile
 import requests
-import duckdb
 from datetime import datetime, timezone
 
-from config.settings import THE_ODDS_API_KEY, BASE_DIR
+from config.settings import THE_ODDS_API_KEY
+from src.database.game_keys import stamp_game_pk
+from src.database.lake import write_odds_part
+from src.database.raw_archive import archive_response
+from src.database.latest_odds import upsert_latest_odds
+from src.database.line_movement import append_quotes
 
 BASE_URL = "https://api.the-odds-api.com/v4/sports"
-BRONZE_ODDS_DIR = BASE_DIR / "data" / "bronze" / "odds"
+SOURCE = "the_odds_api"
 
 
 def _normalize_response(data: list, snapshot_ts: str) -> list[dict]:
@@ -33,7 +37,7 @@ def _normalize_response(data: list, snapshot_ts: str) -> list[dict]:
             "away_team":     game.get("away_team"),
             "snapshot_timestamp": snapshot_ts,
             "snapshot_date": snapshot_ts[:10],
-            "source":        "the_odds_api",
+            "source":        SOURCE,
         }
         for book in game.get("bookmakers", []):
             for market in book.get("markets", []):
@@ -50,40 +54,27 @@ def _normalize_response(data: list, snapshot_ts: str) -> list[dict]:
     return rows
 
 
-def _append_to_parquet(rows: list[dict], year: int) -> None:
-    """Append rows to the per-year bronze parquet file via DuckDB."""
-    if not rows:
-        return
+def parse_archived(pages: list[tuple[dict, bytes]], snapshot_ts: str) -> list[dict]:
+    """Rebuild one scrape's rows from its archived (params, body) responses."""
+    rows = []
+    for _params, body in pages:
+        rows.extend(_normalize_response(json.loads(body), snapshot_ts))
+    return rows
 
-    BRONZE_ODDS_DIR.mkdir(parents=True, exist_ok=True)
-    target = BRONZE_ODDS_DIR / f"the_odds_api_{year}.parquet"
 
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f)
-        con = duckdb.connect()
-        new_rows_sql = f"""
-            SELECT * REPLACE (
-                TRY_CAST(snapshot_timestamp AS TIMESTAMPTZ) AS snapshot_timestamp,
-                TRY_CAST(snapshot_date AS DATE) AS snapshot_date
-            )
-            FROM read_json_auto('{tmp_path}')
-        """
-        if target.exists():
-            final_sql = f"""
-                SELECT * FROM read_parquet('{target}', union_by_name=true)
-                UNION ALL BY NAME
-                ({new_rows_sql})
-            """
-        else:
-            final_sql = new_rows_sql
-        con.execute(f"COPY ({final_sql}) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-        n = con.execute(f"SELECT COUNT(*) FROM read_parquet('{target}')").fetchone()[0]
-        con.close()
-        print(f"   ✅ {target.name}: {n:,} total rows")
-    finally:
-        os.unlink(tmp_path)
+def _append_to_parquet(rows: list[dict], stream: str | None = None) -> None:
+    """Write rows as a new part file in the bronze odds partition for their snapshot date.
+    stream separates independent polls (one per sport_key) for delta mode."""
+    if not rows:
+        return
+    stamp_game_pk(SOURCE, rows)
+    target = write_odds_part(rows, SOURCE, stream)
+    append_quotes(SOURCE, rows)
+    upsert_latest_odds(SOURCE, rows)  # raises if the writer fails; the lake has the scrape
+    if target is None:
+        print("   ⏸️  No price changes since last poll")
+        return
+    print(f"   ✅ {target.parent.name}/{target.name}")
 
 
 def fetch_odds(sport_key: str = "baseball_mlb", markets: str = "h2h,spreads,totals") -> list[dict] | None:
@@ -98,11 +89,12 @@ def fetch_odds(sport_key: str = "baseball_mlb", markets: str = "h2h,spreads,tota
     try:
         resp = requests.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
         snapshot_ts = datetime.now(timezone.utc).isoformat()
+        archive_response(SOURCE, resp.content, snapshot_ts,
+                         {"sport_key": sport_key, "markets": markets})
+        data = resp.json()
         rows = _normalize_response(data, snapshot_ts)
-        year = datetime.now(timezone.utc).year
-        _append_to_parquet(rows, year)
+        _append_to_parquet(rows, stream=f"{SOURCE}-{sport_key}")
         print(f"✅ The Odds API ({sport_key}): {len(rows)} rows appended")
         remaining = resp.headers.get("x-requests-remaining", "?")
         print(f"   API credits remaining: {remaining}")
@@ -9,35 +9,82 @@ Two modes:
 The modern approach is needed because BR restructured their daily stats page in 2026,
 breaking pybaseball's HTML parser.
 
+The legacy backfill runs a few worker threads behind one shared token bucket
+(BR_REQUESTS_PER_MINUTE), writes each date as its own game_date partition
+under data/raw/player_logs/game_by_game/, and records every finished date in
+_backfill_checkpoint.parquet, so an interrupted multi-season backfill resumes
+exactly where it stopped.
+
 Output paths:
-  data/player_logs/game_by_game/batting_game_logs_{year}.parquet
-  data/player_logs/game_by_game/pitching_game_logs_{year}.parquet
-  data/bronze/player_logs/cumulative/batting_cumulative_{year}.parquet   (snapshots)
-  data/bronze/player_logs/cumulative/pitching_cumulative_{year}.parquet  (snapshots)
+  data/player_logs/game_by_game/batting_game_logs_{year}/game_date=YYYY-MM-DD/*.parquet
+  data/player_logs/game_by_game/pitching_game_logs_{year}/game_date=YYYY-MM-DD/*.parquet
+  data/bronze/player_logs/cumulative/batting_cumulative_{year}/snapshot_date=YYYY-MM-DD/*.parquet
+  data/bronze/player_logs/cumulative/pitching_cumulative_{year}/snapshot_date=YYYY-MM-DD/*.parquet
+
+Cumulative snapshots are stored one partition per snapshot_date, next to a
+_dates.json index of the dates present. Saving or replacing a snapshot writes
+only its partition; existence checks and previous-date lookups read only the
+index. A pre-partitioning {stat_type}_cumulative_{year}.parquet is split into
+partitions the first time its season is accessed.
+
+Both kinds of date partition follow the lake's compaction protocol (lake.py).
+Re-ingesting a date writes one new file that supersedes the date's old one,
+and deleting a date writes an empty tombstone file, so neither costs more
+than the date itself. Readers list live files only, and the writer reclaims
+the superseded files (and spent tombstones) at a later publish.
+
+Daily game logs are partitioned by game_date the same way (the game_date
+column lives in the directory name). The first write of a season pins its
+column types in _schema.parquet, and every later partition is cast to them,
+so the season's files always read back as one schema. Saving a day swaps
+that day's partition only; the rest of the season is never re-read. A
+pre-partitioning {prefix}_game_logs_{year}.parquet is split on first access.
 """
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+import bisect
 import json
 import os
 import re
-import tempfile
 import time
 import random
-import duckdb
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timezone, date, timedelta
 
-from config.settings import BASE_DIR, PLAYER_LOGS_DIR, GAME_BY_GAME_DIR
+from config.settings import (BASE_DIR, PLAYER_LOGS_DIR, GAME_BY_GAME_DIR, BR_BACKFILL_WORKERS,
+                             BR_BURST, BR_REQUESTS_PER_MINUTE)
+from src.data_ingestion.br_tables import parse_table_rows
+from src.database import queries
+from src.database.compaction import stage_partition, stage_tombstone
+from src.database.db_manager import cursor
+from src.database.lake import live_files, parquet_list_sql
+from src.database.parquet_writer import rows_to_table, write_rows, write_table
+from src.database.writer import submit
 
 # ========================= PATHS =========================
 
 CUMULATIVE_DIR = BASE_DIR / "data" / "bronze" / "player_logs" / "cumulative"
 CUMULATIVE_DIR.mkdir(parents=True, exist_ok=True)
+_DATE_INDEX = "_dates.json"
+# index file → (mtime_ns, sorted dates)
+_date_index_cache: dict[Path, tuple[int, list[str]]] = {}
 GAME_BY_GAME_DIR.mkdir(parents=True, exist_ok=True)
+_GAME_LOG_SCHEMA = "_schema.parquet"
+
+# Legacy (pybaseball) backfill output, and its per-date checkpoint table
+# (rewritten every LEGACY_CHECKPOINT_EVERY finished dates and at the end of a run)
+LEGACY_GAME_BY_GAME_DIR = BASE_DIR / "data" / "raw" / "player_logs" / "game_by_game"
+LEGACY_CHECKPOINT = LEGACY_GAME_BY_GAME_DIR / "_backfill_checkpoint.parquet"
+LEGACY_CHECKPOINT_EVERY = 25
 
 BR_BASE_URL = "https://www.baseball-reference.com/leagues/majors"
 BR_HEADERS = {
@@ -86,79 +133,13 @@ def _scrape_standard_page(year: int, stat_type: str = "batting") -> list[dict] |
         print(f"   ❌ Failed to fetch {url} after 3 attempts")
         return None
 
-    soup = BeautifulSoup(resp.text, "lxml")
-
-    # Find the player-level table
+    # Only the table's own bytes are parsed, whether it is live or inside a comment
     table_id = f"players_standard_{stat_type}"
-    table = soup.find("table", id=table_id)
-    if not table:
-        # Fallback: try to find any table with matching comment-wrapped HTML
-        # BR sometimes hides tables inside HTML comments
-        for comment in soup.find_all(string=lambda t: isinstance(t, str) and table_id in str(t)):
-            comment_soup = BeautifulSoup(str(comment), "lxml")
-            table = comment_soup.find("table", id=table_id)
-            if table:
-                break
-
-    if not table:
+    rows = parse_table_rows(resp.content, table_id, resp.encoding)
+    if rows is None:
         print(f"   ❌ Could not find table '{table_id}' on page")
         return None
 
-    # Extract headers
-    thead = table.find("thead")
-    headers = [th.get_text(strip=True) for th in thead.find_all("th")]
-
-    # Extract rows
-    tbody = table.find("tbody")
-    rows = []
-    for tr in tbody.find_all("tr"):
-        # Skip spacer/header rows
-        if tr.get("class") and ("thead" in tr["class"] or "spacer" in tr["class"]):
-            continue
-
-        cells = tr.find_all(["th", "td"])
-        if len(cells) < len(headers):
-            continue
-
-        row = {}
-        for i, cell in enumerate(cells):
-            if i < len(headers):
-                col_name = headers[i]
-                text = cell.get_text(strip=True)
-                row[col_name] = text
-
-        # Extract bbref_id from data-append-csv or Player-additional column
-        bbref_id = None
-        # Method 1: data-append-csv on the row
-        if tr.get("data-append-csv"):
-            bbref_id = tr["data-append-csv"]
-        # Method 2: data-append-csv on the player cell
-        if not bbref_id:
-            for cell in cells:
-                if cell.get("data-append-csv"):
-                    bbref_id = cell["data-append-csv"]
-                    break
-        # Method 3: Player-additional column (from CSV export)
-        if not bbref_id and "Player-additional" in row:
-            bbref_id = row["Player-additional"]
-        # Method 4: player link href
-        if not bbref_id:
-            link = tr.find("a", href=re.compile(r"/players/"))
-            if link:
-                # /players/a/arandjo01.shtml → arandjo01
-                bbref_id = link["href"].split("/")[-1].replace(".shtml", "")
-
-        if not bbref_id:
-            continue  # Skip rows without player ID (League Average, totals, etc.)
-
-        row["bbref_id"] = bbref_id
-
-        # Clean player name — remove handedness markers (*, #, +)
-        if "Player" in row:
-            row["Player"] = re.sub(r'[*#†+]', '', row.get("Player", "")).strip()
-
-        rows.append(row)
-
     print(f"   ✅ Parsed {len(rows)} player rows from {stat_type} page")
     return rows
 
@@ -195,307 +176,404 @@ def _cast_row(row: dict, count_cols: list[str]) -> dict:
     return cleaned
 
 
-# ========================= CUMULATIVE SNAPSHOTS =========================
+# ========================= DATE PARTITIONS =========================
 
 
-def _save_cumulative_snapshot(rows: list[dict], year: int, stat_type: str,
-                              snapshot_date: str) -> None:
-    """Append a dated cumulative snapshot to the bronze parquet."""
-    if not rows:
-        return
+def _write_date_index(root: Path, dates) -> list[str]:
+    """Replace a season's date index (dates whose partition has rows)."""
+    dates = sorted(dates)
+    tmp = root / f".{_DATE_INDEX}.tmp"
+    tmp.write_text(json.dumps(dates), encoding="utf-8")
+    os.replace(tmp, root / _DATE_INDEX)
+    index = root / _DATE_INDEX
+    _date_index_cache[index] = (index.stat().st_mtime_ns, dates)
+    return dates
 
-    for r in rows:
-        r["snapshot_date"] = snapshot_date
 
-    target = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
+def _partition_dates(root: Path, key: str) -> list[str]:
+    """Sorted dates of a season that have rows, from its index file (cached by mtime).
 
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
+    Without an index, it is rebuilt from the partitions' live file footers.
+    """
+    index = root / _DATE_INDEX
     try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f, default=str)
-        con = duckdb.connect()
-        new_sql = f"SELECT * FROM read_json_auto('{tmp_path}')"
-        if target.exists():
-            final_sql = f"""
-                SELECT * FROM read_parquet('{target}', union_by_name=true)
-                UNION ALL BY NAME
-                ({new_sql})
-            """
-        else:
-            final_sql = new_sql
-        con.execute(f"COPY ({final_sql}) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-        n = con.execute(f"SELECT COUNT(*) FROM read_parquet('{target}')").fetchone()[0]
-        con.close()
-        print(f"   💾 Cumulative snapshot saved: {target.name} ({n:,} total rows)")
-    finally:
-        os.unlink(tmp_path)
+        mtime = index.stat().st_mtime_ns
+    except OSError:
+        if not root.exists():
+            return []
+        return _write_date_index(root, [
+            d.name.removeprefix(f"{key}=") for d in root.glob(f"{key}=*")
+            if any(pq.read_metadata(f).num_rows for f in live_files(d / "*.parquet"))])
+    cached = _date_index_cache.get(index)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, json.loads(index.read_text(encoding="utf-8")))
+        _date_index_cache[index] = cached
+    return cached[1]
+
+
+def _partition_files(root: Path, key: str, d: str) -> list[Path]:
+    """Live files of one date partition ([] if it has none)."""
+    return live_files(root / f"{key}={d}" / "*.parquet")
+
+
+def _stage_date_partitions(root: Path, key: str, parts: dict[str, pa.Table | None],
+                           dataset: str | None) -> list[tuple]:
+    """Write each date's new file hidden next to its partition, for _commit_staged().
+
+    A date mapped to None or no rows gets a tombstone. Each new file
+    supersedes the partition's live files, so only those dates are written
+    and nothing is rewritten in place. Returns (staged, target, root, key,
+    date, has_rows) per date; target is None for a date with nothing to
+    tombstone.
+    """
+    staged = []
+    try:
+        for d, table in parts.items():
+            part_dir = root / f"{key}={d}"
+            inputs = live_files(part_dir / "*.parquet")
+            if table is not None and table.num_rows:
+                staged.append((*stage_partition(part_dir, table, dataset, inputs), root, key, d, True))
+            else:
+                staged.append((*(stage_tombstone(part_dir, inputs) or (None, None)), root, key, d, False))
+    except BaseException:
+        _discard_staged(staged)
+        raise
+    return staged
 
 
-def _load_snapshot(year: int, stat_type: str, snapshot_date: str) -> dict[str, dict] | None:
-    """Load a cumulative snapshot for a given date. Returns {bbref_id: row_dict}."""
-    target = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
-    if not target.exists():
-        return None
+def _discard_staged(staged: list[tuple]) -> None:
+    for path, *_ in staged:
+        if path is not None:
+            path.unlink(missing_ok=True)
 
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT * FROM read_parquet('{target}')
-            WHERE snapshot_date = '{snapshot_date}'
-        """).fetchall()
-        if not rows:
-            return None
-        cols = [d[0] for d in con.description]
-        result = {}
-        for row in rows:
-            d = dict(zip(cols, row))
-            bid = d.get("bbref_id")
-            if bid:
-                result[bid] = d
-        return result
-    finally:
-        con.close()
 
+def _commit_staged(staged: list[tuple]) -> None:
+    """Rename staged partition files into place in one pass, then update each season's date index once."""
+    for path, target, *_ in staged:
+        if path is not None:
+            os.replace(path, target)
+    changes: dict[tuple[Path, str], tuple[set, set]] = {}
+    for _, _, root, key, d, has_rows in staged:
+        kept, deleted = changes.setdefault((root, key), (set(), set()))
+        (kept if has_rows else deleted).add(d)
+    for (root, key), (kept, deleted) in changes.items():
+        if root.exists():
+            _write_date_index(root, (set(_partition_dates(root, key)) | kept) - deleted)
 
-def _get_latest_snapshot_date(year: int, stat_type: str, before_date: str) -> str | None:
-    """Find the most recent snapshot date strictly before the given date."""
-    target = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
-    if not target.exists():
-        return None
 
-    con = duckdb.connect()
-    try:
-        result = con.execute(f"""
-            SELECT MAX(snapshot_date) FROM read_parquet('{target}')
-            WHERE snapshot_date < '{before_date}'
-        """).fetchone()
-        val = result[0] if result else None
-        return str(val) if val else None
-    finally:
-        con.close()
+def _write_date_partitions(root: Path, key: str, parts: dict[str, pa.Table | None],
+                           dataset: str | None) -> None:
+    """Swap each date's partition for its table; a date mapped to None or no rows is tombstoned."""
+    _commit_staged(_stage_date_partitions(root, key, parts, dataset))
 
 
-def _snapshot_exists(year: int, stat_type: str, snapshot_date: str) -> bool:
-    """Check if a cumulative snapshot already exists for this date."""
-    target = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
-    if not target.exists():
-        return False
+# ========================= CUMULATIVE SNAPSHOTS =========================
 
-    con = duckdb.connect()
-    try:
-        n = con.execute(f"""
-            SELECT COUNT(*) FROM read_parquet('{target}')
-            WHERE snapshot_date = '{snapshot_date}'
-        """).fetchone()[0]
-        return n > 0
-    finally:
-        con.close()
 
+def _snapshot_root(year: int, stat_type: str) -> Path:
+    """Directory of one season's cumulative snapshots, one partition per snapshot_date."""
+    root = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}"
+    _migrate_legacy_snapshots(year, stat_type, root)
+    return root
 
-# ========================= DAILY STATS DIFFING =========================
 
+def _snapshot_files(year: int, stat_type: str, snapshot_date: str) -> list[Path]:
+    """Live files of one snapshot partition."""
+    return _partition_files(_snapshot_root(year, stat_type), "snapshot_date", snapshot_date)
 
-def _compute_daily_batting(today: dict[str, dict],
-                           yesterday: dict[str, dict] | None,
-                           game_date: str, year: int) -> list[dict]:
-    """Diff today's cumulative batting snapshot against yesterday's to get daily stats."""
-    daily_rows = []
 
-    for bbref_id, t_row in today.items():
-        d = {"bbref_id": bbref_id, "game_date": game_date, "game_year": year}
+def _snapshot_dates(year: int, stat_type: str) -> list[str]:
+    """Sorted snapshot dates of a season, from its index file."""
+    return _partition_dates(_snapshot_root(year, stat_type), "snapshot_date")
 
-        # Copy non-counting columns directly from today
-        for col in ("Player", "Age", "Team", "Lg", "Pos", "Awards", "Rk"):
-            if col in t_row:
-                d[col] = t_row[col]
 
-        # Diff counting stats
-        y_row = yesterday.get(bbref_id, {}) if yesterday else {}
-        for col in _BATTING_COUNT_COLS:
-            t_val = t_row.get(col)
-            y_val = y_row.get(col)
-            if t_val is None:
-                d[col] = None
-                continue
-            t_num = _to_num(t_val)
-            y_num = _to_num(y_val) if y_val is not None else 0
-            diff = t_num - y_num
-            # If diff is 0 or negative and player existed yesterday, they didn't play
-            # (negative can happen with stat corrections — treat as 0)
-            d[col] = max(0, int(diff)) if diff == int(diff) else max(0.0, diff)
-
-        # Skip players who didn't play today (0 PA)
-        if d.get("PA", 0) == 0 and d.get("G", 0) == 0:
-            continue
+def _migrate_legacy_snapshots(year: int, stat_type: str, root: Path) -> None:
+    """Split a pre-partitioning {stat_type}_cumulative_{year}.parquet into date partitions."""
+    legacy = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
+    if not legacy.exists():
+        return
+    table = pq.read_table(legacy)
+    dates = pc.unique(table["snapshot_date"]).to_pylist()
+    _write_date_partitions(root, "snapshot_date", {
+        str(d): table.filter(pc.equal(table["snapshot_date"], d)).drop_columns(["snapshot_date"])
+        for d in dates}, "cumulative_snapshots")
+    legacy.unlink()
+    print(f"   🔁 Split {legacy.name} into {len(dates)} snapshot partition(s)")
 
-        # Recalculate rate stats from daily counting stats
-        ab = d.get("AB", 0) or 0
-        h = d.get("H", 0) or 0
-        bb = d.get("BB", 0) or 0
-        hbp = d.get("HBP", 0) or 0
-        sf = d.get("SF", 0) or 0
-        tb = d.get("TB", 0) or 0
-
-        d["BA"] = round(h / ab, 3) if ab > 0 else None
-        denom_obp = ab + bb + hbp + sf
-        d["OBP"] = round((h + bb + hbp) / denom_obp, 3) if denom_obp > 0 else None
-        d["SLG"] = round(tb / ab, 3) if ab > 0 else None
-        if d["OBP"] is not None and d["SLG"] is not None:
-            d["OPS"] = round(d["OBP"] + d["SLG"], 3)
-        else:
-            d["OPS"] = None
 
-        daily_rows.append(d)
+def _snapshot_table(rows: list[dict]) -> pa.Table:
+    """A snapshot's rows as stored in its partition (snapshot_date is the directory)."""
+    return rows_to_table(rows, "cumulative_snapshots", exclude=("snapshot_date",))
+
+
+def _save_cumulative_snapshot(rows: list[dict], year: int, stat_type: str,
+                              snapshot_date: str) -> None:
+    """Write a dated cumulative snapshot as its own partition (replacing any previous one)."""
+    if not rows:
+        return
 
-    return daily_rows
+    table = _snapshot_table(rows)
+    _write_date_partitions(_snapshot_root(year, stat_type), "snapshot_date",
+                           {snapshot_date: table}, "cumulative_snapshots")
+    print(f"   💾 Cumulative snapshot saved: snapshot_date={snapshot_date} ({table.num_rows:,} rows)")
 
 
-def _compute_daily_pitching(today: dict[str, dict],
-                            yesterday: dict[str, dict] | None,
-                            game_date: str, year: int) -> list[dict]:
-    """Diff today's cumulative pitching snapshot against yesterday's."""
-    daily_rows = []
+def _delete_snapshot(year: int, stat_type: str, snapshot_date: str) -> None:
+    """Hide a dated snapshot from readers with a tombstone (its file is reclaimed later)."""
+    _write_date_partitions(_snapshot_root(year, stat_type), "snapshot_date",
+                           {snapshot_date: None}, None)
 
-    for bbref_id, t_row in today.items():
-        d = {"bbref_id": bbref_id, "game_date": game_date, "game_year": year}
 
-        for col in ("Player", "Age", "Team", "Lg", "Awards", "Rk"):
-            if col in t_row:
-                d[col] = t_row[col]
+def _prev_snapshot_files(year: int, stat_type: str, prev_date: str | None) -> list[Path] | None:
+    """Live files of the previous snapshot to diff against (None if there is none)."""
+    return _snapshot_files(year, stat_type, prev_date) if prev_date else None
 
-        y_row = yesterday.get(bbref_id, {}) if yesterday else {}
 
-        # IP needs special handling — BR stores as innings.outs (6.1 = 6 innings + 1 out)
-        t_ip = _ip_to_outs(t_row.get("IP"))
-        y_ip = _ip_to_outs(y_row.get("IP")) if y_row else 0
-        daily_outs = t_ip - y_ip
-        d["IP"] = _outs_to_ip(max(0, daily_outs))
+def _get_latest_snapshot_date(year: int, stat_type: str, before_date: str) -> str | None:
+    """Find the most recent snapshot date strictly before the given date."""
+    dates = _snapshot_dates(year, stat_type)
+    i = bisect.bisect_left(dates, str(before_date))
+    return dates[i - 1] if i else None
 
-        for col in _PITCHING_COUNT_COLS:
-            t_val = t_row.get(col)
-            y_val = y_row.get(col)
-            if t_val is None:
-                d[col] = None
-                continue
-            t_num = _to_num(t_val)
-            y_num = _to_num(y_val) if y_val is not None else 0
-            d[col] = max(0, int(t_num - y_num))
 
-        # Skip pitchers who didn't pitch today
-        if daily_outs <= 0 and d.get("G", 0) == 0:
-            continue
+def _snapshot_exists(year: int, stat_type: str, snapshot_date: str) -> bool:
+    """Check if a cumulative snapshot already exists for this date."""
+    dates = _snapshot_dates(year, stat_type)
+    i = bisect.bisect_left(dates, str(snapshot_date))
+    return i < len(dates) and dates[i] == str(snapshot_date)
 
-        # Recalculate rate stats
-        ip = max(daily_outs / 3.0, 0)
-        er = d.get("ER", 0) or 0
-        h = d.get("H", 0) or 0
-        bb = d.get("BB", 0) or 0
 
-        d["ERA"] = round(er * 9.0 / ip, 2) if ip > 0 else None
-        d["WHIP"] = round((h + bb) / ip, 3) if ip > 0 else None
+# ========================= DAILY STATS DIFFING =========================
 
-        daily_rows.append(d)
 
-    return daily_rows
+# Columns carried over from today's snapshot unchanged
+_BATTING_KEEP_COLS = ("Player", "Age", "Team", "Lg", "Pos", "Awards", "Rk")
+_PITCHING_KEEP_COLS = ("Player", "Age", "Team", "Lg", "Awards", "Rk")
 
 
-def _to_num(val) -> float:
-    """Convert a value to float, handling None/empty/string."""
-    if val is None or val == "" or val == "—":
-        return 0.0
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
+def _snapshot_sql(con, source: pa.Table | list[Path] | None,
+                  name: str) -> tuple[str, set[str], dict[str, str]]:
+    """One row per bbref_id (the last one, as a dict lookup would keep) of a snapshot.
 
+    source: a snapshot partition's live files, its rows as an Arrow table, or
+    None (no snapshot). Returns (relation SQL, its columns, {column: DuckDB type}).
+    """
+    if source is None:
+        return "(SELECT NULL::VARCHAR AS bbref_id WHERE false)", {"bbref_id"}, {"bbref_id": "VARCHAR"}
+    if isinstance(source, pa.Table):
+        con.register(name, source.append_column("_ord", pa.array(range(source.num_rows), pa.int64())))
+        rel = name
+    else:
+        rel = (f"(SELECT * EXCLUDE (file_row_number), file_row_number AS _ord FROM "
+               f"read_parquet({parquet_list_sql(source)}, hive_partitioning=false, file_row_number=true))")
+    types = {col: typ for col, typ, *_ in con.execute(f"DESCRIBE SELECT * FROM {rel}").fetchall()}
+    sql = f"""(
+        SELECT * FROM {rel}
+        WHERE bbref_id IS NOT NULL AND bbref_id <> ''
+        QUALIFY row_number() OVER (PARTITION BY bbref_id ORDER BY _ord DESC) = 1
+    )"""
+    return sql, set(types), types
+
+
+def _num(alias: str, col: str, cols: set[str]) -> str:
+    """A stat as DOUBLE (NULL if the column is missing or not numeric)."""
+    return f'TRY_CAST({alias}."{col}" AS DOUBLE)' if col in cols else "NULL"
+
+
+def _outs(alias: str, cols: set[str]) -> str:
+    """IP in innings.outs notation (6.1 = 6 innings + 1 out) → total outs, 0 if missing."""
+    ip = _num(alias, "IP", cols)
+    return f"COALESCE(CAST(trunc({ip}) * 3 + round(({ip} - trunc({ip})) * 10) AS BIGINT), 0)"
+
+
+def _compute_daily(today: pa.Table | list[Path], prev: pa.Table | list[Path] | None, game_date: str,
+                   year: int, stat_type: str) -> pa.Table:
+    """Diff a cumulative snapshot against the previous one into one day's stats, in one query.
+
+    today / prev: a snapshot partition's live files, or snapshot rows already in memory as
+    an Arrow table (a fresh scrape, a batch of CSVs). prev None: cumulative =
+    daily. Counting stats are today minus previous (a player new today
+    counts from 0), floored at 0 (stat corrections); pitching IP is diffed in
+    outs. Players with no playing time that day are dropped, and the rate
+    stats are recomputed from the daily counts (round_even, as Python's round() does).
+    """
+    batting = stat_type == "batting"
+    count_cols = _BATTING_COUNT_COLS if batting else _PITCHING_COUNT_COLS
+    keep_cols = _BATTING_KEEP_COLS if batting else _PITCHING_KEEP_COLS
 
-def _ip_to_outs(ip_val) -> int:
-    """Convert IP (e.g., 6.1 = 6 innings + 1 out) to total outs."""
-    if ip_val is None or ip_val == "" or ip_val == "—":
-        return 0
+    con = cursor()
     try:
-        ip = float(ip_val)
-        full = int(ip)
-        frac = round((ip - full) * 10)  # .1 = 1 out, .2 = 2 outs
-        return full * 3 + frac
-    except (ValueError, TypeError):
-        return 0
+        t_sql, t_cols, t_types = _snapshot_sql(con, today, "_today")
+        y_sql, y_cols, _ = _snapshot_sql(con, prev, "_prev")
+
+        lead = ["bbref_id", "game_date", "game_year"] + [c for c in keep_cols if c in t_cols]
+        select = ["t.bbref_id", "CAST($game_date AS DATE) AS game_date",
+                  "CAST($year AS BIGINT) AS game_year"]
+        select += [f't."{c}"' for c in lead[3:]]
+        for c in count_cols:
+            if c not in t_cols:
+                select.append(f'NULL AS "{c}"')
+                continue
+            diff = f"COALESCE({_num('t', c, t_cols)}, 0) - COALESCE({_num('y', c, y_cols)}, 0)"
+            if batting:
+                # Integral diffs stay integers, as the snapshot's counting columns are
+                integral = t_types[c] in ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT")
+                expr = f"CAST(GREATEST({diff}, 0) AS {'BIGINT' if integral else 'DOUBLE'})"
+            else:
+                expr = f"GREATEST(CAST(trunc({diff}) AS BIGINT), 0)"
+            select.append(f'CASE WHEN t."{c}" IS NOT NULL THEN {expr} END AS "{c}"')
+        outs = f", {_outs('t', t_cols)} - {_outs('y', y_cols)} AS _outs" if not batting else ""
+        sql = _daily_stats_sql(
+            f"SELECT {', '.join(select)}{outs} FROM {t_sql} t LEFT JOIN {y_sql} y USING (bbref_id)",
+            lead, count_cols, batting)
+        return con.execute(sql, {"game_date": game_date, "year": year}).to_arrow_table()
+    finally:
+        con.close()
 
 
-def _outs_to_ip(outs: int) -> float:
-    """Convert total outs to IP notation (e.g., 19 outs = 6.1)."""
-    full = outs // 3
-    remainder = outs % 3
-    return float(f"{full}.{remainder}")
+def _daily_stats_sql(source_sql: str, lead: list[str], count_cols: list[str], batting: bool) -> str:
+    """Query turning per-player daily counts into game log rows.
 
+    source_sql selects the lead columns and the counting stats (pitching:
+    plus _outs, the day's outs pitched, in place of IP). Players with no
+    playing time are dropped, and the rate stats are recomputed from the
+    counts (round_even, as Python's round() does).
+    """
+    if batting:
+        return f"""
+            WITH d AS ({source_sql}),
+            c AS (
+                SELECT *, COALESCE("AB", 0) AS _ab,
+                       COALESCE("AB", 0) + COALESCE("BB", 0) + COALESCE("HBP", 0)
+                           + COALESCE("SF", 0) AS _obp_denom
+                FROM d
+                WHERE NOT COALESCE("PA" = 0 AND "G" = 0, false)   -- didn't play
+            ),
+            r AS (
+                SELECT * EXCLUDE (_ab, _obp_denom),
+                       CASE WHEN _ab > 0 THEN round_even(COALESCE("H", 0) / _ab, 3) END AS "BA",
+                       CASE WHEN _obp_denom > 0 THEN round_even((COALESCE("H", 0) + COALESCE("BB", 0)
+                           + COALESCE("HBP", 0)) / _obp_denom, 3) END AS "OBP",
+                       CASE WHEN _ab > 0 THEN round_even(COALESCE("TB", 0) / _ab, 3) END AS "SLG"
+                FROM c
+            )
+            SELECT *, round_even("OBP" + "SLG", 3) AS "OPS" FROM r
+        """
+    lead_sql = ", ".join(f'"{c}"' for c in lead)
+    counts_sql = ", ".join(f'"{c}"' for c in count_cols)
+    return f"""
+        WITH d AS ({source_sql}),
+        c AS (
+            SELECT {lead_sql},
+                   round_even(GREATEST(_outs, 0) // 3 + GREATEST(_outs, 0) % 3 / 10, 1) AS "IP",
+                   {counts_sql},
+                   GREATEST(_outs / 3.0, 0) AS _ip
+            FROM d
+            WHERE NOT COALESCE(_outs <= 0 AND "G" = 0, false)   -- didn't pitch
+        )
+        SELECT * EXCLUDE (_ip),
+               CASE WHEN _ip > 0 THEN round_even(COALESCE("ER", 0) * 9.0 / _ip, 2) END AS "ERA",
+               CASE WHEN _ip > 0 THEN round_even((COALESCE("H", 0) + COALESCE("BB", 0)) / _ip, 3) END AS "WHIP"
+        FROM c
+    """
 
-# ========================= SAVE DAILY GAME LOGS =========================
 
+# ========================= SAVE DAILY GAME LOGS =========================
 
-def _save_daily_game_logs(rows: list[dict], year: int, stat_type: str) -> None:
-    """Append daily stats rows to the game-by-game parquet file."""
-    if not rows:
-        return
 
+def _game_logs_root(year: int, stat_type: str, base_dir: Path = GAME_BY_GAME_DIR) -> Path:
+    """Directory of one season's daily game logs, one partition per game_date."""
     prefix = "batting" if stat_type == "batting" else "pitching"
-    target = GAME_BY_GAME_DIR / f"{prefix}_game_logs_{year}.parquet"
+    root = base_dir / f"{prefix}_game_logs_{year}"
+    _migrate_legacy_game_logs(root)
+    return root
 
-    # Write new rows to a temp parquet, then UNION ALL BY NAME with existing.
-    # Use DuckDB table insert to avoid JSON type inference mismatches.
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(tmp_fd, "w") as f:
-            json.dump(rows, f, default=str)
-        con = duckdb.connect()
-
-        if target.exists():
-            # Load existing data into a table, then INSERT new rows with matching types
-            con.execute(f"""
-                CREATE TABLE existing AS
-                SELECT * FROM read_parquet('{target}')
-            """)
-            # Get column names and types from existing table
-            cols_info = con.execute("DESCRIBE existing").fetchall()
-            # Build cast expressions for each column in the new data
-            cast_exprs = []
-            for col_name, col_type, *_ in cols_info:
-                cast_exprs.append(f'CAST("{col_name}" AS {col_type}) AS "{col_name}"')
-            cast_sql = ", ".join(cast_exprs)
-            # Insert new rows with types matching existing schema
-            con.execute(f"""
-                INSERT INTO existing
-                SELECT {cast_sql}
-                FROM read_json_auto('{tmp_path}')
-            """)
-            con.execute(f"""
-                COPY existing TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
-            """)
-            n = con.execute(f"SELECT COUNT(*) FROM existing").fetchone()[0]
-        else:
-            # No existing file — cast all string-like cols to VARCHAR to avoid JSON type
-            con.execute(f"""
-                CREATE TABLE new_data AS
-                SELECT * FROM read_json_auto('{tmp_path}')
-            """)
-            # Cast any JSON columns to VARCHAR
-            cols_info = con.execute("DESCRIBE new_data").fetchall()
-            cast_exprs = []
-            for col_name, col_type, *_ in cols_info:
-                if col_type == "JSON":
-                    cast_exprs.append(f'CAST("{col_name}" AS VARCHAR) AS "{col_name}"')
-                else:
-                    cast_exprs.append(f'"{col_name}"')
-            cast_sql = ", ".join(cast_exprs)
-            con.execute(f"""
-                COPY (SELECT {cast_sql} FROM new_data)
-                TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
-            """)
-            n = con.execute(f"SELECT COUNT(*) FROM new_data").fetchone()[0]
 
-        con.close()
-        print(f"   ✅ {prefix}_game_logs_{year}.parquet: {n:,} total rows")
+def _game_log_schema(root: Path, table: pa.Table) -> pa.Schema:
+    """The season's pinned partition schema. The first write pins it from its own columns."""
+    path = root / _GAME_LOG_SCHEMA
+    if path.exists():
+        return pq.read_schema(path).remove_metadata()
+    schema = table.drop_columns([c for c in ("game_date",) if c in table.column_names]).schema
+    write_table(schema.remove_metadata().empty_table(), path)
+    return schema.remove_metadata()
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast rows to the pinned schema: missing columns become NULL, unknown ones are dropped."""
+    con = cursor()
+    try:
+        con.register("_new", table)
+        con.register("_pinned", schema.empty_table())
+        exprs = []
+        for col, typ, *_ in con.execute("DESCRIBE _pinned").fetchall():
+            src = f'"{col}"' if col in table.column_names else "NULL"
+            exprs.append(f'CAST({src} AS {typ}) AS "{col}"')
+        out = con.execute(f"SELECT {', '.join(exprs)} FROM _new").to_arrow_table()
     finally:
-        os.unlink(tmp_path)
+        con.close()
+    return out.cast(schema)
+
+
+def _migrate_legacy_game_logs(root: Path) -> None:
+    """Split a pre-partitioning {prefix}_game_logs_{year}.parquet into game_date partitions."""
+    legacy = root.with_name(f"{root.name}.parquet")
+    if not legacy.exists():
+        return
+    table = pq.read_table(legacy)
+    dates = pc.unique(table["game_date"].cast(pa.date32())).to_pylist()
+    by_date = table["game_date"].cast(pa.date32())
+    _write_date_partitions(root, "game_date", {
+        str(d): table.filter(pc.equal(by_date, d)).drop_columns(["game_date"]) for d in dates}, "game_logs")
+    _game_log_schema(root, table)
+    legacy.unlink()
+    print(f"   🔁 Split {legacy.name} into {len(dates)} game_date partition(s)")
+
+
+def _stage_game_log_partitions(root: Path, rows: pa.Table, game_dates: list[str]) -> list[tuple]:
+    """_stage_date_partitions() for the game_date partitions of game_dates, from rows' rows of each date.
+
+    Rows are cast to the season's pinned schema. A date without rows is
+    tombstoned; no other partition is read or written.
+    """
+    if not rows.num_rows:
+        return _stage_date_partitions(root, "game_date", dict.fromkeys(game_dates), None)
+    schema = _game_log_schema(root, rows)
+    by_date = rows["game_date"].cast(pa.date32())
+    parts = {}
+    for gd in game_dates:
+        part = rows.filter(pc.equal(by_date, date.fromisoformat(gd)))
+        parts[gd] = _conform(part, schema) if part.num_rows else None
+    return _stage_date_partitions(root, "game_date", parts, "game_logs")
+
+
+def _write_game_log_partitions(root: Path, rows: pa.Table, game_dates: list[str]) -> None:
+    """Swap the game_date partitions of game_dates for rows' rows of each date."""
+    _commit_staged(_stage_game_log_partitions(root, rows, game_dates))
+
+
+def _save_daily_game_logs(rows: pa.Table, year: int, stat_type: str,
+                          game_dates: list[str] | None = None) -> None:
+    """Write daily stats rows as game_date partitions, replacing those dates.
+
+    Each date's partition is swapped atomically and no other partition is
+    read or written. game_dates: the dates being replaced (default: the dates
+    in rows); one left without rows is tombstoned. Readers of the published
+    views see the change only after the caller's submit("publish").
+    """
+    if game_dates is None:
+        if not rows.num_rows:
+            return
+        game_dates = [str(d) for d in pc.unique(rows["game_date"].cast(pa.date32())).to_pylist()]
+
+    root = _game_logs_root(year, stat_type)
+    _write_game_log_partitions(root, rows, game_dates)
+    print(f"   ✅ {root.name}: {rows.num_rows:,} rows in {len(game_dates)} game_date partition(s)")
+
+
+def _delete_daily_logs(year: int, stat_type: str, game_dates: list[str]) -> None:
+    """Hide the daily game logs of game_dates from readers with tombstones (reclaimed later)."""
+    _write_date_partitions(_game_logs_root(year, stat_type), "game_date", dict.fromkeys(game_dates), None)
 
 
 # ========================= INTERPOLATION =========================
@@ -513,77 +591,54 @@ def _get_game_dates_in_range(year: int, after_date: date, through_date: date) ->
     else:
         return []
 
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT DISTINCT game_date::DATE AS gd
-            FROM read_parquet('{sched_path}')
-            WHERE game_type = 'R'
-              AND game_date::DATE > '{after_date}'
-              AND game_date::DATE <= '{through_date}'
-            ORDER BY gd
-        """).fetchall()
-        return [r[0] for r in rows]
-    finally:
-        con.close()
+    return queries.schedule_game_dates(sched_path, through_date, after_date=after_date)
 
 
-def _interpolate_rows(total_daily: list[dict], n_days: int,
-                      game_date: str, year: int, stat_type: str) -> list[dict]:
-    """Split total diff rows evenly across n_days for a single game_date.
+def _split(expr: str, n_days: int) -> str:
+    """Day _k's share of a total split over n_days: the floor of total / n_days,
+    plus one on the first (total mod n_days) days, so the shares add up to the total."""
+    return (f"(floor(({expr}) / {n_days}) + "
+            f"CASE WHEN _k < ({expr}) - floor(({expr}) / {n_days}) * {n_days} THEN 1 ELSE 0 END)")
 
-    Counting stats are divided by n_days (floored to int, with remainders
-    distributed round-robin to earlier days). Rate stats are recalculated
-    from the split counting stats.
-    """
-    count_cols = _BATTING_COUNT_COLS if stat_type == "batting" else _PITCHING_COUNT_COLS
-    interpolated = []
-
-    for row in total_daily:
-        d = {}
-        # Copy non-counting columns
-        for k, v in row.items():
-            if k not in count_cols and k not in ("BA", "OBP", "SLG", "OPS", "ERA", "WHIP"):
-                d[k] = v
-        d["game_date"] = game_date
-        d["game_year"] = year
-
-        # Split counting stats evenly
-        for col in count_cols:
-            total_val = row.get(col)
-            if total_val is None:
-                d[col] = None
-            else:
-                d[col] = round(total_val / n_days, 2)
-
-        # Recalculate rate stats
-        if stat_type == "batting":
-            ab = d.get("AB", 0) or 0
-            h = d.get("H", 0) or 0
-            bb = d.get("BB", 0) or 0
-            hbp = d.get("HBP", 0) or 0
-            sf = d.get("SF", 0) or 0
-            tb = d.get("TB", 0) or 0
-            d["BA"] = round(h / ab, 3) if ab > 0 else None
-            denom_obp = ab + bb + hbp + sf
-            d["OBP"] = round((h + bb + hbp) / denom_obp, 3) if denom_obp > 0 else None
-            d["SLG"] = round(tb / ab, 3) if ab > 0 else None
-            if d["OBP"] is not None and d["SLG"] is not None:
-                d["OPS"] = round(d["OBP"] + d["SLG"], 3)
-            else:
-                d["OPS"] = None
-        else:
-            ip_val = d.get("IP", 0) or 0
-            ip_innings = ip_val if isinstance(ip_val, (int, float)) else 0
-            er = d.get("ER", 0) or 0
-            h = d.get("H", 0) or 0
-            bb = d.get("BB", 0) or 0
-            d["ERA"] = round(er * 9.0 / ip_innings, 2) if ip_innings > 0 else None
-            d["WHIP"] = round((h + bb) / ip_innings, 3) if ip_innings > 0 else None
 
-        interpolated.append(d)
+def _interpolate_daily(total: pa.Table, game_dates: list[date], year: int, stat_type: str) -> pa.Table:
+    """Split a multi-day diff (from _compute_daily) evenly across game_dates, in one query.
+
+    Returns the rows of every day for every player as one table. Counting
+    stats (pitching: outs, for IP) are split as whole numbers, with the
+    remainder going to the earliest days. Rate stats are recalculated from
+    the split counts, and players with nothing on a day are dropped for it.
+    """
+    batting = stat_type == "batting"
+    count_cols = _BATTING_COUNT_COLS if batting else _PITCHING_COUNT_COLS
+    keep_cols = _BATTING_KEEP_COLS if batting else _PITCHING_KEEP_COLS
+    n_days = len(game_dates)
 
-    return interpolated
+    con = cursor()
+    try:
+        con.register("_total", total)
+        con.register("_days", pa.table({"_k": pa.array(range(n_days), pa.int64()),
+                                        "game_date": pa.array(game_dates, pa.date32())}))
+        types = {col: typ for col, typ, *_ in con.execute("DESCRIBE _total").fetchall()}
+
+        lead = ["bbref_id", "game_date", "game_year"] + [c for c in keep_cols if c in types]
+        select = ["t.bbref_id", "g.game_date", "CAST($year AS BIGINT) AS game_year"]
+        select += [f't."{c}"' for c in lead[3:]]
+        for c in count_cols:
+            if c not in types:
+                select.append(f'NULL AS "{c}"')
+                continue
+            integral = types[c] in ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT")
+            share = _split(f't."{c}"', n_days)
+            select.append(f'CAST({share} AS {"BIGINT" if integral else "DOUBLE"}) AS "{c}"')
+        if not batting:
+            select.append(f"CAST({_split(_outs('t', set(types)), n_days)} AS BIGINT) AS _outs")
+
+        sql = _daily_stats_sql(f"SELECT {', '.join(select)} FROM _total t CROSS JOIN _days g",
+                               lead, count_cols, batting)
+        return con.execute(sql, {"year": year}).to_arrow_table()
+    finally:
+        con.close()
 
 
 # ========================= MAIN ORCHESTRATOR =========================
@@ -602,35 +657,59 @@ def _get_game_dates_from_schedule(year: int) -> list[date]:
         print(f"   ❌ No schedule file for {year}")
         return []
 
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT DISTINCT game_date::DATE AS gd
-            FROM read_parquet('{sched_path}')
-            WHERE game_type = 'R'
-              AND game_date::DATE <= CURRENT_DATE
-            ORDER BY gd
-        """).fetchall()
-        return [r[0] for r in rows]
-    finally:
-        con.close()
+    return queries.schedule_game_dates(sched_path, date.today())
 
 
 def _get_processed_dates(year: int, stat_type: str) -> set[str]:
-    """Find which dates already have daily game logs saved."""
-    prefix = "batting" if stat_type == "batting" else "pitching"
-    target = GAME_BY_GAME_DIR / f"{prefix}_game_logs_{year}.parquet"
-    if not target.exists():
-        return set()
+    """Find which dates already have daily game logs saved (from the season's date index)."""
+    return set(_partition_dates(_game_logs_root(year, stat_type), "game_date"))
 
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT DISTINCT game_date::VARCHAR FROM read_parquet('{target}')
-        """).fetchall()
-        return {str(r[0])[:10] for r in rows}
-    finally:
-        con.close()
+
+class _SeasonCalendar:
+    """A season's game, snapshot and processed dates, held in memory for fetch_daily_logs.
+
+    Loaded once: game dates from the schedule (through `through`), snapshot
+    and processed dates from the seasons' _dates.json indexes. The save_*
+    methods write a partition and record its date, so every lookup after
+    that is a set test or a bisect over sorted ISO date strings.
+    """
+
+    def __init__(self, year: int, through: date):
+        self.year = year
+        self.game_dates = [str(d) for d in _get_game_dates_from_schedule(year) if d <= through]
+        self.last_game_date = self.game_dates[-1] if self.game_dates else None
+        stat_types = ("batting", "pitching")
+        self._snapshots = {st: list(_snapshot_dates(year, st)) for st in stat_types}
+        self._processed = {st: _get_processed_dates(year, st) for st in stat_types}
+
+    def processed_count(self, stat_type: str) -> int:
+        return len(self._processed[stat_type])
+
+    def remaining(self, stat_type: str) -> list[str]:
+        """Game dates without daily logs yet, in order."""
+        return [d for d in self.game_dates if d not in self._processed[stat_type]]
+
+    def has_snapshot(self, stat_type: str, snapshot_date: str) -> bool:
+        dates = self._snapshots[stat_type]
+        i = bisect.bisect_left(dates, snapshot_date)
+        return i < len(dates) and dates[i] == snapshot_date
+
+    def prev_snapshot(self, stat_type: str, before_date: str) -> str | None:
+        """The most recent snapshot date strictly before before_date."""
+        dates = self._snapshots[stat_type]
+        i = bisect.bisect_left(dates, before_date)
+        return dates[i - 1] if i else None
+
+    def save_snapshot(self, rows: list[dict], stat_type: str, snapshot_date: str) -> None:
+        _save_cumulative_snapshot(rows, self.year, stat_type, snapshot_date)
+        if rows and not self.has_snapshot(stat_type, snapshot_date):
+            bisect.insort(self._snapshots[stat_type], snapshot_date)
+
+    def save_daily(self, daily: pa.Table, stat_type: str) -> None:
+        _save_daily_game_logs(daily, self.year, stat_type)
+        if daily.num_rows:
+            self._processed[stat_type].update(
+                str(d) for d in pc.unique(daily["game_date"].cast(pa.date32())).to_pylist())
 
 
 def fetch_daily_logs(year: int = 2026) -> None:
@@ -641,27 +720,29 @@ def fetch_daily_logs(year: int = 2026) -> None:
       2. Store the cumulative snapshot
       3. Diff against the previous snapshot to extract single-day stats
       4. Save daily stats to the game-by-game parquet
+    and finally publishes one database version, so v_game_logs_* readers see them.
 
     Note: Since BR only shows the CURRENT cumulative, this must be run daily to capture
     each day's diff. For the first day (or if no previous snapshot exists), the cumulative
     stats ARE the daily stats.
+
+    Which dates to process and which snapshot precedes each come from a
+    _SeasonCalendar loaded once up front, so the loop itself only reads the
+    snapshots it diffs.
     """
     print(f"📥 Fetching daily logs for {year} (cumulative snapshot method)...")
 
-    game_dates = _get_game_dates_from_schedule(year)
-    if not game_dates:
+    today = date.today()
+    calendar = _SeasonCalendar(year, today)
+    if not calendar.game_dates:
         print("   No game dates found (check schedule parquet)")
         return
-
-    today = date.today()
-    game_dates = [d for d in game_dates if d <= today]
-    print(f"   → {len(game_dates)} game dates up to today")
+    print(f"   → {len(calendar.game_dates)} game dates up to today")
 
     for stat_type in ("batting", "pitching"):
         print(f"\n--- {stat_type.upper()} ---")
-        processed = _get_processed_dates(year, stat_type)
-        remaining = [d for d in game_dates if str(d) not in processed]
-        print(f"   Already processed: {len(processed)} days")
+        remaining = calendar.remaining(stat_type)
+        print(f"   Already processed: {calendar.processed_count(stat_type)} days")
         print(f"   Remaining: {len(remaining)} days")
 
         if not remaining:
@@ -686,88 +767,67 @@ def fetch_daily_logs(year: int = 2026) -> None:
         snapshot_date = str(today)
 
         # Save cumulative snapshot for today
-        if not _snapshot_exists(year, stat_type, snapshot_date):
-            _save_cumulative_snapshot(cast_rows, year, stat_type, snapshot_date)
+        if not calendar.has_snapshot(stat_type, snapshot_date):
+            calendar.save_snapshot(cast_rows, stat_type, snapshot_date)
         else:
             print(f"   ⏭️  Snapshot for {snapshot_date} already exists")
 
-        # Build {bbref_id: row} lookup for today
-        today_lookup = {r["bbref_id"]: r for r in cast_rows if r.get("bbref_id")}
+        today_table = rows_to_table(cast_rows, "cumulative_snapshots")
 
         # Process each remaining date
-        for gd in remaining:
-            gd_str = str(gd)
-
-            if gd == today or gd == max(d for d in game_dates if d <= today):
-                # For today (or the most recent game day), use the snapshot we just scraped
-                prev_date = _get_latest_snapshot_date(year, stat_type, snapshot_date)
-                prev_lookup = _load_snapshot(year, stat_type, prev_date) if prev_date else None
-
-                if stat_type == "batting":
-                    daily = _compute_daily_batting(today_lookup, prev_lookup, gd_str, year)
-                else:
-                    daily = _compute_daily_pitching(today_lookup, prev_lookup, gd_str, year)
-
-                _save_daily_game_logs(daily, year, stat_type)
-                print(f"   📅 {gd_str}: {len(daily)} {stat_type} rows")
+        for gd_str in remaining:
+            if gd_str == calendar.last_game_date:
+                # For the most recent game day (today, if there are games), use the snapshot we just scraped
+                prev_date = calendar.prev_snapshot(stat_type, snapshot_date)
+                daily = _compute_daily(today_table, _prev_snapshot_files(year, stat_type, prev_date),
+                                       gd_str, year, stat_type)
             else:
                 # Past dates require pre-existing consecutive snapshots
-                snap_today = _load_snapshot(year, stat_type, gd_str)
-                if not snap_today:
+                if not calendar.has_snapshot(stat_type, gd_str):
                     print(f"   ⚠️  No snapshot for {gd_str} — cannot compute daily stats. "
                           f"Need to have scraped on that date.")
                     continue
 
-                prev_date = _get_latest_snapshot_date(year, stat_type, gd_str)
-                prev_lookup = _load_snapshot(year, stat_type, prev_date) if prev_date else None
-
-                if stat_type == "batting":
-                    daily = _compute_daily_batting(snap_today, prev_lookup, gd_str, year)
-                else:
-                    daily = _compute_daily_pitching(snap_today, prev_lookup, gd_str, year)
+                prev_date = calendar.prev_snapshot(stat_type, gd_str)
+                daily = _compute_daily(_snapshot_files(year, stat_type, gd_str),
+                                       _prev_snapshot_files(year, stat_type, prev_date),
+                                       gd_str, year, stat_type)
 
-                _save_daily_game_logs(daily, year, stat_type)
-                print(f"   📅 {gd_str}: {len(daily)} {stat_type} rows")
+            calendar.save_daily(daily, stat_type)
+            print(f"   📅 {gd_str}: {daily.num_rows} {stat_type} rows")
 
         time.sleep(random.uniform(3, 6))  # Be polite between batting/pitching
 
+    # Published views are pinned to file lists: re-pin them to the new partitions
+    submit("publish")
     print(f"\n🎉 Done! Check {GAME_BY_GAME_DIR}")
 
 
-def ingest_csv(csv_path: str, game_date: str, year: int = 2026) -> None:
-    """Ingest a manually downloaded BR standard batting/pitching CSV.
+def _csv_date(csv_path: Path) -> str | None:
+    """Snapshot date from a CSV's name: MMDDYYYY or YYYY-MM-DD, e.g. 03272026.csv or
+    batting_2026-03-27.csv (None if it has no date)."""
+    m = re.search(r'(?<!\d)(\d{4}-\d{2}-\d{2}|\d{8})(?!\d)', csv_path.stem)
+    if not m:
+        return None
+    try:
+        return datetime.strptime(m.group(1), "%Y-%m-%d" if "-" in m.group(1) else "%m%d%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
 
-    Daily workflow:
-      1. Download CSV from BR (standard batting or pitching page)
-      2. Save it anywhere (e.g., data/raw/player_logs/game_by_game/player/)
-      3. Run: python player_logs_fetcher.py --csv PATH --date YYYY-MM-DD
 
-    The function:
-      - Reads the CSV
-      - Stores it as a cumulative snapshot for the given date
-      - Loads the previous day's snapshot (if any) and diffs to get single-day stats
-      - Appends the daily stats to the game-by-game parquet
+def _read_br_csv(csv_path: Path) -> tuple[str, list[dict]] | None:
+    """Parse a BR standard batting/pitching CSV into (stat_type, cast player rows).
 
-    If no previous snapshot exists, cumulative = daily (correct for day 1,
-    and also a reasonable approximation for a missed day).
+    Returns None if the file has no player rows. Runs in worker processes
+    for ingest_csv_dir.
     """
-    csv_file = Path(csv_path)
-    if not csv_file.exists():
-        print(f"   ❌ File not found: {csv_file}")
-        return
-
-    print(f"📥 Ingesting {csv_file.name} as cumulative stats through {game_date}...")
-
-    con = duckdb.connect()
+    con = cursor()
     try:
-        rows = con.execute(f"""
-            SELECT * FROM read_csv_auto('{csv_file}')
-        """).fetchall()
+        rows = con.execute("SELECT * FROM read_csv_auto($path)", {"path": str(csv_path)}).fetchall()
         cols = [d[0] for d in con.description]
     finally:
         con.close()
 
-    # Convert to list of dicts
     data = []
     for row in rows:
         d = dict(zip(cols, row))
@@ -783,8 +843,7 @@ def ingest_csv(csv_path: str, game_date: str, year: int = 2026) -> None:
         data.append(d)
 
     if not data:
-        print("   ❌ No player rows found in CSV")
-        return
+        return None
 
     # Detect stat type from columns
     stat_type = "batting"
@@ -792,139 +851,253 @@ def ingest_csv(csv_path: str, game_date: str, year: int = 2026) -> None:
         stat_type = "pitching"
 
     count_cols = _BATTING_COUNT_COLS if stat_type == "batting" else _PITCHING_COUNT_COLS
-    cast_data = [_cast_row(r, count_cols) for r in data]
+    return stat_type, [_cast_row(r, count_cols) for r in data]
+
+
+def _diff_snapshot(today: pa.Table | list[Path], prev: pa.Table | list[Path] | None, prev_date: str | None,
+                   game_date: str, year: int, stat_type: str) -> tuple[pa.Table, list[date]]:
+    """Daily game log rows from a snapshot and the previous one, and the game dates they cover.
+
+    A diff spanning more than one day is split evenly across the game dates
+    in between (schedule, or every day if there is none).
+    """
+    prev_dt = date.fromisoformat(prev_date) if prev_date else None
+    curr_dt = date.fromisoformat(game_date)
+    daily = _compute_daily(today, prev, game_date, year, stat_type)
+    if not prev_dt or (curr_dt - prev_dt).days <= 1:
+        return daily, [curr_dt]
+
+    # Multi-day gap — find game dates in between (inclusive of current)
+    game_dates_in_range = _get_game_dates_in_range(year, prev_dt, curr_dt)
+    if not game_dates_in_range:
+        # No schedule data — fall back to assuming every day was a game day
+        game_dates_in_range = [
+            prev_dt + timedelta(days=i)
+            for i in range(1, (curr_dt - prev_dt).days + 1)
+        ]
+    print(f"   📅 Gap detected before {game_date}: {(curr_dt - prev_dt).days} days, "
+          f"{len(game_dates_in_range)} game day(s) to interpolate")
+    return _interpolate_daily(daily, game_dates_in_range, year, stat_type), game_dates_in_range
+
+
+def ingest_csv(csv_path: str, game_date: str, year: int = 2026) -> None:
+    """Ingest a manually downloaded BR standard batting/pitching CSV.
+
+    Daily workflow:
+      1. Download CSV from BR (standard batting or pitching page)
+      2. Save it anywhere (e.g., data/raw/player_logs/game_by_game/player/)
+      3. Run: python player_logs_fetcher.py --csv PATH --date YYYY-MM-DD
+
+    The function:
+      - Reads the CSV
+      - Stores it as a cumulative snapshot for the given date
+      - Loads the previous day's snapshot (if any) and diffs to get single-day stats
+      - Writes the daily stats as game_date partitions
+      - Publishes a database version, so readers see the new partitions
+
+    If no previous snapshot exists, cumulative = daily (correct for day 1,
+    and also a reasonable approximation for a missed day).
+    """
+    csv_file = Path(csv_path)
+    if not csv_file.exists():
+        print(f"   ❌ File not found: {csv_file}")
+        return
+
+    print(f"📥 Ingesting {csv_file.name} as cumulative stats through {game_date}...")
+
+    parsed = _read_br_csv(csv_file)
+    if parsed is None:
+        print("   ❌ No player rows found in CSV")
+        return
+    stat_type, cast_data = parsed
 
     # 1. Save cumulative snapshot
-    if not _snapshot_exists(year, stat_type, game_date):
-        _save_cumulative_snapshot(cast_data, year, stat_type, game_date)
-    else:
+    if _snapshot_exists(year, stat_type, game_date):
+        # Supersedes only that date's partition file
         print(f"   ⏭️  Snapshot for {game_date} already exists — overwriting")
-        # Delete existing snapshot for this date and re-save
-        _delete_snapshot(year, stat_type, game_date)
-        _save_cumulative_snapshot(cast_data, year, stat_type, game_date)
+    _save_cumulative_snapshot(cast_data, year, stat_type, game_date)
 
-    # 2. Load previous snapshot for diffing
+    # 2. Previous snapshot for diffing
     prev_date = _get_latest_snapshot_date(year, stat_type, game_date)
-    prev_lookup = _load_snapshot(year, stat_type, prev_date) if prev_date else None
 
-    if prev_lookup:
+    if prev_date:
         print(f"   📊 Diffing against previous snapshot ({prev_date})")
     else:
         print(f"   📊 No previous snapshot — treating cumulative as daily stats")
 
     # 3. Compute daily stats — with interpolation for missed days
-    today_lookup = {r["bbref_id"]: r for r in cast_data if r.get("bbref_id")}
-
-    # Determine how many game days this diff covers
-    prev_dt = date.fromisoformat(prev_date) if prev_date else None
-    curr_dt = date.fromisoformat(game_date)
-
-    if prev_dt and (curr_dt - prev_dt).days > 1:
-        # Multi-day gap — find game dates in between (inclusive of current)
-        game_dates_in_range = _get_game_dates_in_range(year, prev_dt, curr_dt)
-        if not game_dates_in_range:
-            # No schedule data — fall back to assuming every day was a game day
-            game_dates_in_range = [
-                prev_dt + timedelta(days=i)
-                for i in range(1, (curr_dt - prev_dt).days + 1)
-            ]
-        n_days = len(game_dates_in_range)
-        print(f"   📅 Gap detected: {(curr_dt - prev_dt).days} days, "
-              f"{n_days} game day(s) to interpolate")
-
-        # Compute total diff once, then split across days
-        if stat_type == "batting":
-            total_daily = _compute_daily_batting(today_lookup, prev_lookup, game_date, year)
-        else:
-            total_daily = _compute_daily_pitching(today_lookup, prev_lookup, game_date, year)
+    daily, game_dates = _diff_snapshot(_snapshot_files(year, stat_type, game_date),
+                                       _prev_snapshot_files(year, stat_type, prev_date),
+                                       prev_date, game_date, year, stat_type)
+
+    processed = _get_processed_dates(year, stat_type)
+    replaced = [str(gd) for gd in game_dates if str(gd) in processed]
+    if replaced:
+        print(f"   ⚠️  Daily game logs for {', '.join(replaced)} already exist — replacing")
+
+    _save_daily_game_logs(daily, year, stat_type, [str(gd) for gd in game_dates])
+    if len(game_dates) > 1:
+        print(f"   ✅ {daily.num_rows} {stat_type} rows over {len(game_dates)} game day(s) "
+              f"through {game_date} (interpolated)")
+    else:
+        print(f"   ✅ {daily.num_rows} {stat_type} rows for {game_dates[0]}")
 
-        processed = _get_processed_dates(year, stat_type)
-        for day_idx, gd in enumerate(game_dates_in_range):
-            gd_str = str(gd)
-            interpolated = _interpolate_rows(total_daily, n_days, gd_str, year, stat_type)
+    # Published views are pinned to file lists: re-pin them to the new partitions
+    submit("publish")
 
-            if gd_str in processed:
-                print(f"   ⚠️  Daily game logs for {gd_str} already exist — replacing")
-                _delete_daily_logs(year, stat_type, gd_str)
 
-            _save_daily_game_logs(interpolated, year, stat_type)
-            print(f"   ✅ {len(interpolated)} {stat_type} rows for {gd_str} (interpolated)")
-    else:
-        # Normal case: single day diff
-        if stat_type == "batting":
-            daily = _compute_daily_batting(today_lookup, prev_lookup, game_date, year)
-        else:
-            daily = _compute_daily_pitching(today_lookup, prev_lookup, game_date, year)
+def ingest_csv_dir(csv_dir: str, year: int = 2026, workers: int | None = None) -> None:
+    """Ingest a directory of dated BR standard CSVs (batting and/or pitching) in one pass.
 
-        processed = _get_processed_dates(year, stat_type)
-        if game_date in processed:
-            print(f"   ⚠️  Daily game logs for {game_date} already exist — replacing")
-            _delete_daily_logs(year, stat_type, game_date)
+    The CSVs are parsed in parallel, one spawned process per file. Then,
+    per stat type, the snapshots are sorted by date and each is diffed
+    against the one before it in memory (the first against the latest
+    stored snapshot before it), with gaps interpolated as in ingest_csv.
 
-        _save_daily_game_logs(daily, year, stat_type)
-        print(f"   ✅ {len(daily)} {stat_type} rows for {game_date}")
+    Every cumulative and daily partition is written once, to a hidden staged
+    file. Only when all of them are written are they renamed into place, in
+    one pass, and one database version is published. Readers of the
+    published views switch to the whole backfill at once. Code that lists
+    live files directly can see part of it only during the rename pass,
+    never during the parsing and diffing. A failure before that pass leaves
+    the lake untouched.
+    """
+    dated = []
+    for csv_file in sorted(Path(csv_dir).glob("*.csv")):
+        csv_date = _csv_date(csv_file)
+        if csv_date is None:
+            print(f"   ⚠️  Skipping {csv_file.name}: no MMDDYYYY or YYYY-MM-DD date in its name")
+            continue
+        dated.append((csv_date, csv_file))
+    if not dated:
+        print(f"   ❌ No dated CSVs in {csv_dir}")
+        return
 
+    print(f"📥 Ingesting {len(dated)} CSV(s) from {csv_dir}...")
+    # spawn, not fork: a forked child would inherit this process's DuckDB instance (cursor())
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        parsed = list(pool.map(_read_br_csv, [f for _, f in dated]))
+
+    # stat_type → {snapshot_date: snapshot table}; a later file for the same date wins
+    snapshots: dict[str, dict[str, pa.Table]] = {}
+    for (csv_date, csv_file), result in zip(dated, parsed):
+        if result is None:
+            print(f"   ❌ No player rows found in {csv_file.name}")
+            continue
+        stat_type, cast_data = result
+        snapshots.setdefault(stat_type, {})[csv_date] = _snapshot_table(cast_data)
 
-def _delete_snapshot(year: int, stat_type: str, snapshot_date: str) -> None:
-    """Remove a specific date's snapshot from the cumulative parquet."""
-    target = CUMULATIVE_DIR / f"{stat_type}_cumulative_{year}.parquet"
-    if not target.exists():
-        return
-    con = duckdb.connect()
+    staged = []
     try:
-        con.execute(f"""
-            COPY (
-                SELECT * FROM read_parquet('{target}')
-                WHERE snapshot_date != '{snapshot_date}'
-            ) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
-        """)
-    finally:
-        con.close()
+        for stat_type, by_date in snapshots.items():
+            staged += _stage_csv_snapshots(stat_type, by_date, year)
+    except BaseException:
+        _discard_staged(staged)
+        raise
+    _commit_staged(staged)
+
+    submit("publish")
+    print(f"\n🎉 Done! {len(dated)} CSV(s) ingested")
+
+
+def _stage_csv_snapshots(stat_type: str, by_date: dict[str, pa.Table], year: int) -> list[tuple]:
+    """Diff one stat type's batch of snapshots and stage their snapshot and game_date partitions."""
+    dates = sorted(by_date)
+    print(f"\n--- {stat_type.upper()}: {len(dates)} snapshot(s), {dates[0]} → {dates[-1]} ---")
+
+    prev_date = _get_latest_snapshot_date(year, stat_type, dates[0])
+    prev = _prev_snapshot_files(year, stat_type, prev_date)
+    daily_tables, game_dates = [], []
+    for snapshot_date in dates:
+        daily, covered = _diff_snapshot(by_date[snapshot_date], prev, prev_date,
+                                        snapshot_date, year, stat_type)
+        daily_tables.append(daily)
+        game_dates.extend(str(gd) for gd in covered)
+        prev, prev_date = by_date[snapshot_date], snapshot_date
+
+    staged = _stage_date_partitions(_snapshot_root(year, stat_type), "snapshot_date", by_date,
+                                    "cumulative_snapshots")
+    print(f"   💾 {len(dates)} cumulative snapshot partition(s) staged")
+    try:
+        daily = pa.concat_tables(daily_tables, promote_options="permissive")
+        staged += _stage_game_log_partitions(_game_logs_root(year, stat_type), daily, game_dates)
+    except BaseException:
+        _discard_staged(staged)
+        raise
+    print(f"   ✅ {daily.num_rows:,} daily rows in {len(game_dates)} game_date partition(s) staged")
+    return staged
 
 
-def _delete_daily_logs(year: int, stat_type: str, game_date: str) -> None:
-    """Remove a specific date's rows from the daily game logs parquet."""
-    prefix = "batting" if stat_type == "batting" else "pitching"
-    target = GAME_BY_GAME_DIR / f"{prefix}_game_logs_{year}.parquet"
-    if not target.exists():
-        return
-    con = duckdb.connect()
-    try:
-        con.execute(f"""
-            COPY (
-                SELECT * FROM read_parquet('{target}')
-                WHERE game_date::VARCHAR NOT LIKE '{game_date}%'
-            ) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
-        """)
-    finally:
-        con.close()
+def delete_date(game_date: str, year: int = 2026) -> None:
+    """Drop one date's cumulative snapshots and daily game logs (batting and pitching).
+
+    Each partition gets a tombstone, so this costs the same on the last day
+    of a season as on the first. Readers stop seeing the rows at the publish
+    below; the files are deleted once no retained version reads them.
+    """
+    for stat_type in ("batting", "pitching"):
+        had_snapshot = _snapshot_exists(year, stat_type, game_date)
+        had_logs = game_date in _get_processed_dates(year, stat_type)
+        _delete_snapshot(year, stat_type, game_date)
+        _delete_daily_logs(year, stat_type, [game_date])
+        print(f"   🗑️  {stat_type} {game_date}: "
+              f"snapshot {'deleted' if had_snapshot else 'not found'}, "
+              f"daily logs {'deleted' if had_logs else 'not found'}")
+    submit("publish")
 
 
 # ========================= LEGACY MODE (pre-2026) =========================
 
 
-def fetch_game_logs_legacy(year: int) -> None:
-    """Original pybaseball-based fetcher for years where it still works (2017-2025).
+class _TokenBucket:
+    """Thread-safe token bucket: `per_minute` requests on average, at most `burst` back to back."""
 
-    Kept as-is for backward compatibility — only use for historical years
-    where data is already partially fetched.
-    """
-    import pandas as pd
-    import pybaseball as pb_legacy
-    from tqdm import tqdm as tqdm_legacy
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = per_minute / 60.0
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _load_backfill_checkpoint() -> dict[str, dict]:
+    """game_date → its checkpoint row (status 'done' / 'empty' / 'failed')."""
+    if not LEGACY_CHECKPOINT.exists():
+        return {}
+    return {str(r["game_date"]): r for r in pq.read_table(LEGACY_CHECKPOINT).to_pylist()}
 
-    print(f"📥 Starting / resuming daily BR logs fetch for {year} (legacy mode)...")
+
+def _save_backfill_checkpoint(checkpoint: dict[str, dict]) -> None:
+    write_rows(sorted(checkpoint.values(), key=lambda r: r["game_date"]), LEGACY_CHECKPOINT)
+
+
+def _legacy_schedule_dates(year: int) -> list[date]:
+    """Regular-season game dates of a past season (from its schedule parquet)."""
+    import pandas as pd
 
     flat_path = BASE_DIR / "data" / "schedules" / f"games_{year}.parquet"
     sub_path = BASE_DIR / "data" / "raw" / "schedules" / f"games_{year}.parquet"
-
     if flat_path.exists():
         schedule_path = flat_path
     elif sub_path.exists():
         schedule_path = sub_path
     else:
         print(f"❌ No schedule file for {year}")
-        return
+        return []
 
     schedule = pd.read_parquet(schedule_path)
     schedule['game_date'] = pd.to_datetime(schedule['game_date'])
@@ -932,24 +1105,93 @@ def fetch_game_logs_legacy(year: int) -> None:
         regular = schedule[schedule['game_type'] == 'R'].copy()
     else:
         regular = schedule[schedule['game_date'] >= f'{year}-03-20'].copy()
-    all_dates = sorted(regular['game_date'].dt.date.unique())
-    print(f"   → {len(all_dates)} regular-season days total")
+    return sorted(regular['game_date'].dt.date.unique())
+
+
+def _fetch_legacy_date(game_date: date, bucket: _TokenBucket, team_info) -> dict:
+    """Fetch and enrich one date's BR batting + pitching logs. Runs in a worker thread.
+
+    Every request (retries included) takes a token from the shared bucket.
+    Returns {"batting": pa.Table | None, "pitching": pa.Table | None, "attempts": n},
+    or "error" set if every attempt failed.
+    """
+    import pandas as pd
+    import pybaseball as pb_legacy
+
+    date_str = game_date.strftime('%Y-%m-%d')
+    year = game_date.year
+    attempts, error = 0, None
+    for attempts in range(1, 6):
+        try:
+            bucket.acquire()
+            bat = pb_legacy.batting_stats_range(date_str, date_str)
+            bucket.acquire()
+            pit = pb_legacy.pitching_stats_range(date_str, date_str)
+            break
+        except Exception as e:
+            error = e
+            if attempts < 5:
+                time.sleep(12 * (2 ** (attempts - 1)))
+    else:
+        return {"batting": None, "pitching": None, "attempts": attempts, "error": str(error)}
 
-    out_dir = BASE_DIR / "data" / "raw" / "player_logs" / "game_by_game"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    batting_path = out_dir / f"batting_game_logs_{year}.parquet"
-    pitching_path = out_dir / f"pitching_game_logs_{year}.parquet"
+    out = {"attempts": attempts}
+    for stat_type, df in (("batting", bat), ("pitching", pit)):
+        if df.empty:
+            out[stat_type] = None
+            continue
+        df = df.copy()
+        df['game_date'] = pd.to_datetime(date_str)
+        df['game_year'] = year
+        df[['Lg', 'full_team_name']] = df.apply(
+            lambda r: pd.Series(team_info(year, r['Tm'])), axis=1)
+        df['Lg'] = df.Lev.str.split('-').str[1]
+        out[stat_type] = pa.Table.from_pandas(df, preserve_index=False)
+    return out
+
+
+def fetch_game_logs_legacy(year: int, through_year: int | None = None,
+                           workers: int = BR_BACKFILL_WORKERS,
+                           requests_per_minute: float = BR_REQUESTS_PER_MINUTE) -> None:
+    """Original pybaseball-based fetcher for years where it still works (2017-2025).
 
-    batting_dfs, pitching_dfs, processed_dates = [], [], set()
-    if batting_path.exists():
-        existing = pd.read_parquet(batting_path)
-        if 'game_date' in existing.columns:
-            processed_dates = set(existing['game_date'].dt.date.unique())
-            batting_dfs.append(existing)
-            print(f"   Already done: {len(processed_dates)} days")
+    Backfills every regular-season date of year..through_year with
+    batting_stats_range / pitching_stats_range. A small pool of worker threads
+    shares one token bucket, so the combined request rate never exceeds
+    requests_per_minute however many workers run. Each finished date is
+    written as its own game_date partition
+    (data/raw/player_logs/game_by_game/{prefix}_game_logs_{year}/) and then
+    recorded in the checkpoint table (done / empty / failed). The table is
+    saved every LEGACY_CHECKPOINT_EVERY dates and when the run ends. A
+    restart skips the dates it records as finished and the dates whose
+    batting and pitching partitions are both on disk; failed dates, and a
+    date only half written, are fetched again.
+    """
+    import pandas as pd
+    from tqdm import tqdm as tqdm_legacy
 
-    remaining = [d for d in all_dates if d not in processed_dates]
-    print(f"   → {len(remaining)} days still needed\n")
+    years = list(range(year, (through_year or year) + 1))
+    print(f"📥 Starting / resuming daily BR logs backfill for {years[0]}–{years[-1]} (legacy mode)...")
+
+    checkpoint = _load_backfill_checkpoint()
+    remaining = []
+    for yr in years:
+        all_dates = _legacy_schedule_dates(yr)
+        # A date with both partitions on disk is done even if the checkpoint
+        # doesn't say so (split from a pre-partitioning year file, or written
+        # after the last checkpoint save); a day without games is only in the checkpoint
+        on_disk = set.intersection(*(
+            set(_partition_dates(_game_logs_root(yr, stat_type, LEGACY_GAME_BY_GAME_DIR), "game_date"))
+            for stat_type in ("batting", "pitching")
+        ))
+        finished = {d for d, r in checkpoint.items() if r["status"] != "failed"} | on_disk
+        pending = [d for d in all_dates if str(d) not in finished]
+        print(f"   {yr}: {len(all_dates)} regular-season days, {len(all_dates) - len(pending)} done, "
+              f"{len(pending)} still needed")
+        remaining.extend(pending)
+    if not remaining:
+        print("✅ Nothing left to fetch")
+        return
 
     # Lahman reference for team enrichment
     lahman_dir = BASE_DIR / "data" / "reference" / "lahman_files"
@@ -966,49 +1208,48 @@ def fetch_game_logs_legacy(year: int) -> None:
             return r['lgID'], r['name']
         return pd.NA, f"Unknown ({tm})"
 
-    for i, game_date in enumerate(tqdm_legacy(remaining, desc="Fetching")):
-        date_str = game_date.strftime('%Y-%m-%d')
-        success = False
-        for attempt in range(5):
-            try:
-                bat = pb_legacy.batting_stats_range(date_str, date_str)
-                pit = pb_legacy.pitching_stats_range(date_str, date_str)
-                time.sleep(random.uniform(4.5, 8.5))
-                success = True
-                break
-            except Exception:
-                time.sleep(12 * (2 ** attempt))
+    bucket = _TokenBucket(requests_per_minute, BR_BURST)
+    print(f"   → {len(remaining)} days with {workers} worker(s) at ≤{requests_per_minute:g} requests/min "
+          f"(~{len(remaining) * 2 / requests_per_minute / 60:.1f} h)\n")
 
-        if not success:
-            print(f"   ❌ Failed {date_str}")
-            continue
+    failed = unsaved = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_fetch_legacy_date, d, bucket, _team_info): d for d in remaining}
+            for future in tqdm_legacy(as_completed(futures), total=len(futures), desc="Fetching"):
+                game_date = futures[future]
+                date_str = str(game_date)
+                try:
+                    result = future.result()
+                except Exception as e:  # enrichment / conversion failed: record it, keep going
+                    result = {"batting": None, "pitching": None, "attempts": 0, "error": str(e)}
+
+                entry = {"game_date": game_date, "status": "failed",
+                         "batting_rows": 0, "pitching_rows": 0, "attempts": result["attempts"],
+                         "error": result.get("error"), "updated_at": datetime.now(timezone.utc)}
+                if result.get("error") is None:
+                    for stat_type in ("batting", "pitching"):
+                        table = result[stat_type]
+                        if table is not None:
+                            root = _game_logs_root(game_date.year, stat_type, LEGACY_GAME_BY_GAME_DIR)
+                            _write_game_log_partitions(root, table, [date_str])
+                            entry[f"{stat_type}_rows"] = table.num_rows
+                    has_rows = entry["batting_rows"] or entry["pitching_rows"]
+                    entry["status"] = "done" if has_rows else "empty"
+                else:
+                    failed += 1
+                    print(f"   ❌ Failed {date_str}: {result['error']}")
+                checkpoint[date_str] = entry
+                unsaved += 1
+                if unsaved >= LEGACY_CHECKPOINT_EVERY:
+                    _save_backfill_checkpoint(checkpoint)
+                    unsaved = 0
+    finally:
+        if unsaved:
+            _save_backfill_checkpoint(checkpoint)
 
-        if not bat.empty:
-            bat = bat.copy()
-            bat['game_date'] = pd.to_datetime(date_str)
-            bat['game_year'] = year
-            bat[['Lg', 'full_team_name']] = bat.apply(
-                lambda r: pd.Series(_team_info(year, r['Tm'])), axis=1)
-            bat['Lg'] = bat.Lev.str.split('-').str[1]
-            batting_dfs.append(bat)
-
-        if not pit.empty:
-            pit = pit.copy()
-            pit['game_date'] = pd.to_datetime(date_str)
-            pit['game_year'] = year
-            pit[['Lg', 'full_team_name']] = pit.apply(
-                lambda r: pd.Series(_team_info(year, r['Tm'])), axis=1)
-            pit['Lg'] = pit.Lev.str.split('-').str[1]
-            pitching_dfs.append(pit)
-
-        if (i + 1) % 10 == 0 or (i + 1) == len(remaining):
-            print(f"   💾 Checkpoint after {i+1} days...")
-            if batting_dfs:
-                pd.concat(batting_dfs, ignore_index=True).to_parquet(batting_path, index=False)
-            if pitching_dfs:
-                pd.concat(pitching_dfs, ignore_index=True).to_parquet(pitching_path, index=False)
-
-    print(f"\n🎉 {year} complete!")
+    print(f"\n🎉 Backfill complete! {len(remaining) - failed} day(s) fetched, {failed} failed"
+          + (" — re-run to retry them" if failed else ""))
 
 
 # ========================= ENTRY POINT =========================
@@ -1023,41 +1264,57 @@ Examples:
   # Ingest a manually downloaded CSV (daily workflow for 2026+):
   python player_logs_fetcher.py --csv data/raw/.../sb_1.csv --date 2026-03-27
 
+  # Backfill a directory of dated CSVs (03272026.csv, pitching_03272026.csv, ...) in one pass:
+  python player_logs_fetcher.py --csv-dir data/raw/.../missed/
+
+  # Drop a bad day's snapshots and daily logs (re-ingest it with --csv afterwards):
+  python player_logs_fetcher.py --delete 2026-04-02
+
   # Auto-scrape today's cumulative and diff (requires BR access):
   python player_logs_fetcher.py 2026
 
-  # Legacy pybaseball mode for historical years:
+  # Legacy pybaseball mode for historical years (resumable, rate-limited):
   python player_logs_fetcher.py 2025 --legacy
+  python player_logs_fetcher.py 2017 --legacy --through-year 2025 --workers 4
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("year", type=int, nargs="?", default=2026, help="Season year")
     parser.add_argument("--csv", type=str,
                         help="Path to a BR standard batting/pitching CSV to ingest")
+    parser.add_argument("--csv-dir", type=str,
+                        help="Directory of BR CSVs with a MMDDYYYY or YYYY-MM-DD date in their names, ingested in one pass")
+    parser.add_argument("--workers", type=int,
+                        help="Parser processes for --csv-dir (default: all cores), "
+                             "or fetch threads for --legacy")
     parser.add_argument("--date", type=str,
                         help="Game date for the CSV snapshot (YYYY-MM-DD)")
+    parser.add_argument("--delete", type=str, metavar="DATE",
+                        help="Delete one date's snapshots and daily game logs (YYYY-MM-DD)")
     parser.add_argument("--legacy", action="store_true",
                         help="Use legacy pybaseball mode (for pre-2026 years)")
+    parser.add_argument("--through-year", type=int,
+                        help="Legacy mode: backfill every season from year through this one")
     args = parser.parse_args()
 
-    if args.csv:
+    if args.delete:
+        delete_date(args.delete, args.year)
+    elif args.csv_dir:
+        ingest_csv_dir(args.csv_dir, args.year, args.workers)
+    elif args.csv:
         csv_date = args.date
         if not csv_date:
             # Try to parse date from MMDDYYYY filename
-            stem = Path(args.csv).stem
-            if re.match(r'^\d{8}$', stem):
-                try:
-                    parsed = datetime.strptime(stem, "%m%d%Y")
-                    csv_date = parsed.strftime("%Y-%m-%d")
-                    print(f"   📅 Parsed date from filename: {csv_date}")
-                except ValueError:
-                    pass
+            csv_date = _csv_date(Path(args.csv))
+            if csv_date:
+                print(f"   📅 Parsed date from filename: {csv_date}")
         if not csv_date:
             print("❌ --date is required (or name your CSV as MMDDYYYY.csv)")
             print("   Example: --date 2026-03-27  or  03272026.csv")
             sys.exit(1)
         ingest_csv(args.csv, csv_date, args.year)
     elif args.legacy or args.year < 2026:
-        fetch_game_logs_legacy(args.year)
+        fetch_game_logs_legacy(args.year, args.through_year,
+                               workers=args.workers or BR_BACKFILL_WORKERS)
     else:
         fetch_daily_logs(args.year)
@@ -7,8 +7,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 import time
 
-RAW_SCHEDULE_PATH = Path("data/raw/schedules")
-RAW_SCHEDULE_PATH.mkdir(parents=True, exist_ok=True)
+from config.settings import SCHEDULES_DIR
 
 def fetch_schedules(start_year=2000, end_year=None):
     if end_year is None:
@@ -37,6 +36,8 @@ def fetch_schedules(start_year=2000, end_year=None):
                     year_games.append({
                         "game_id": game["game_id"],
                         "game_date": game["game_date"],
+                        "game_datetime": game.get("game_datetime"),
+                        "game_num": game.get("game_num"),
                         "year": year,
                         "away_team": game["away_name"],
                         "home_team": game["home_name"],
@@ -60,10 +61,12 @@ def fetch_schedules(start_year=2000, end_year=None):
             for col in ["away_score", "home_score"]:
                 df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
             
+            # game_datetime (UTC) tells the two games of a doubleheader apart
+            # when other sources' rows are resolved to game_id (src/database/game_keys.py)
+            df["game_datetime"] = pd.to_datetime(df["game_datetime"], utc=True, errors="coerce")
+
             # Save this year immediately
-            path = RAW_SCHEDULE_PATH
-            path.mkdir(parents=True, exist_ok=True)
-            filename = path / f"games_{year}.parquet"
+            filename = SCHEDULES_DIR / f"games_{year}.parquet"
             df.to_parquet(filename, compression="snappy")
             print(f"   ✅ Saved {len(df):,} games for {year} → {filename}")
 
@@ -0,0 +1,219 @@
+"""
+Bronze lake compactor — merges the small per-scrape part files of a
+(source, snapshot_date) partition into one file of large, sorted row groups.
+
+Every scrape appends a new part file (see lake.py), so a season of 10-minute
+polling leaves ~100 files per source per day. DuckDB opens and reads the footer
+of every file a view touches; compaction keeps that cost proportional to the
+number of days rather than the number of scrapes.
+
+How a partition is compacted:
+  1. Snapshot the list of part files currently in the partition.
+  2. DuckDB reads exactly those files and writes them, ordered by the dataset's
+     sort_by keys (config/data_schemas.yaml), to a hidden temp file with
+     the dataset's row_group_rows per row group. The input file names are stored
+     in the output's Parquet key/value metadata.
+  3. Row counts are checked, then the temp file is renamed into place
+     (atomic). From that moment lake.live_files() lists the compacted file
+     instead of its inputs.
+  4. A new database version is published (writer.py), with views over the
+     compacted file.
+
+Readers never see a partial file: the temp file is dot-prefixed, so globs skip
+it until the rename. The inputs are not deleted here. Published versions from
+before the compaction still read them, so the writer removes them once no
+retained version does. Part files that land in the partition after step 1 are
+left alone and picked up by the next run.
+
+By default only closed partitions (snapshot_date before today, UTC) are
+compacted, so the scraper is never writing into a partition being merged.
+
+Usage:
+    python src/database/compaction.py                  # all sources, closed days
+    python src/database/compaction.py --source kalshi --dry-run
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import argparse
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.database.db_manager import cursor
+from src.database.lake import (COMPACTED_FROM_KEY, COMPACTED_PREFIX, ODDS_SOURCES, TOMBSTONE_PREFIX,
+                               live_files, odds_source_dir)
+from src.database.parquet_writer import dataset_row_group_rows, dataset_sort_keys, write_table
+from src.database.writer import submit
+
+# Used when a dataset declares no row_group_rows (DuckDB's default)
+TARGET_ROW_GROUP_ROWS = 122_880
+
+# Leave a partition alone until it has at least this many part files
+MIN_FILES = 4
+
+
+def compact_partition(part_dir: Path, dataset: str, dry_run: bool = False) -> dict | None:
+    """Compact one partition directory. Returns stats, or None if skipped."""
+    inputs = live_files(part_dir / "*.parquet")
+    if len(inputs) < MIN_FILES:
+        return None
+
+    rows_in = sum(pq.read_metadata(p).num_rows for p in inputs)
+    stats = {"partition": f"{part_dir.parent.name}/{part_dir.name}",
+             "files_before": len(inputs), "rows": rows_in}
+    if dry_run:
+        return stats
+
+    names = [p.name for p in inputs]
+    digest = hashlib.sha1("\n".join(names).encode()).hexdigest()[:12]
+    target = part_dir / f"{COMPACTED_PREFIX}{digest}.parquet"
+    tmp = part_dir / f".{target.name}.tmp"
+
+    file_list = ", ".join("'{}'".format(str(p).replace("'", "''")) for p in inputs)
+    tmp_sql = str(tmp).replace("'", "''")
+    con = cursor()
+    try:
+        # hive_partitioning=false: partition columns stay in the directory names
+        source_sql = (f"read_parquet([{file_list}], union_by_name=true, "
+                      f"hive_partitioning=false)")
+        present = {r[0] for r in con.execute(f"DESCRIBE SELECT * FROM {source_sql}").fetchall()}
+        order = [f'"{c}"' for c in dataset_sort_keys(dataset) if c in present]
+        order_sql = f"ORDER BY {', '.join(order)}" if order else ""
+        inputs_json = json.dumps(names).replace("'", "''")
+        row_group_rows = dataset_row_group_rows(dataset) or TARGET_ROW_GROUP_ROWS
+        con.execute(f"""
+            COPY (SELECT * FROM {source_sql} {order_sql})
+            TO '{tmp_sql}' (FORMAT PARQUET, COMPRESSION ZSTD,
+                            ROW_GROUP_SIZE {row_group_rows},
+                            KV_METADATA {{compacted_from: '{inputs_json}'}})
+        """)
+    finally:
+        con.close()
+
+    try:
+        rows_out = pq.read_metadata(tmp).num_rows
+        if rows_out != rows_in:
+            raise RuntimeError(f"{stats['partition']}: wrote {rows_out:,} rows, expected {rows_in:,}")
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    stats["files_after"] = len(live_files(part_dir / "*.parquet"))
+    return stats
+
+
+def stage_partition(part_dir: Path, table: pa.Table, dataset: str | None, inputs: list[Path],
+                    tombstone: bool = False) -> tuple[Path, Path]:
+    """Write the file that will replace a partition's `inputs`, without committing it.
+
+    The file is written hidden (dot-prefixed) next to its target, so globs
+    skip it. Returns (staged, target); os.replace(staged, target) commits
+    it. Lets a caller write many partitions first and then commit them all
+    in one quick pass of renames.
+    """
+    names = [p.name for p in inputs]
+    digest = hashlib.sha1(("\n".join(names) or uuid.uuid4().hex).encode()).hexdigest()[:12]
+    prefix = TOMBSTONE_PREFIX if tombstone else COMPACTED_PREFIX
+    target = part_dir / f"{prefix}{digest}.parquet"
+    staged = part_dir / f".{target.name}.staged"
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           COMPACTED_FROM_KEY: json.dumps(names)})
+    write_table(table, staged, dataset)
+    return staged, target
+
+
+def replace_partition(part_dir: Path, table: pa.Table, dataset: str | None, inputs: list[Path],
+                      tombstone: bool = False) -> Path:
+    """Atomically swap a partition's `inputs` for one file holding `table`.
+
+    Same commit protocol as compaction: the inputs are recorded in the new
+    file's metadata, which retires them from live_files() at the rename.
+    Used by the archive re-parse and the player-log date partitions; publish
+    a new version afterwards.
+    """
+    staged, target = stage_partition(part_dir, table, dataset, inputs, tombstone)
+    os.replace(staged, target)
+    return target
+
+
+def stage_tombstone(part_dir: Path, inputs: list[Path]) -> tuple[Path, Path] | None:
+    """stage_partition() for a tombstone: the inputs' schema, no rows (None if no inputs)."""
+    if not inputs:
+        return None
+    schema = pq.read_schema(inputs[-1]).remove_metadata()
+    return stage_partition(part_dir, schema.empty_table(), None, inputs, tombstone=True)
+
+
+def tombstone_partition(part_dir: Path, inputs: list[Path]) -> Path | None:
+    """Logically delete a partition: supersede `inputs` with an empty tombstone file.
+
+    Nothing is rewritten. The tombstone has the inputs' schema and no rows,
+    so readers see the partition as empty from the rename on. The writer's
+    garbage collection removes the inputs, then the tombstone and its
+    directory. Returns None if there was nothing live to delete.
+    """
+    staged = stage_tombstone(part_dir, inputs)
+    if staged is None:
+        return None
+    os.replace(*staged)
+    return staged[1]
+
+
+def compact_lake(sources: tuple[str, ...] = ODDS_SOURCES, include_open: bool = False,
+                 dry_run: bool = False) -> list[dict]:
+    """Compact every eligible partition of the given odds sources.
+
+    include_open=True also compacts today's (UTC) partition, which the scraper
+    may still be appending to; new parts written during the run are kept.
+    """
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    results = []
+    for source in sources:
+        src_dir = odds_source_dir(source)
+        if not src_dir.exists():
+            continue
+        for part_dir in sorted(src_dir.glob("snapshot_date=*")):
+            snapshot_date = part_dir.name.split("=", 1)[1]
+            if snapshot_date >= today and not include_open:
+                continue
+            stats = compact_partition(part_dir, f"odds_{source}", dry_run=dry_run)
+            if stats:
+                results.append(stats)
+    if results and not dry_run:
+        submit("publish")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact bronze odds part files")
+    parser.add_argument("--source", choices=ODDS_SOURCES, action="append",
+                        help="Source to compact (repeatable; default: all)")
+    parser.add_argument("--include-today", action="store_true",
+                        help="Also compact today's partition")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List partitions that would be compacted")
+    args = parser.parse_args()
+
+    sources = tuple(args.source) if args.source else ODDS_SOURCES
+    results = compact_lake(sources, include_open=args.include_today, dry_run=args.dry_run)
+
+    if not results:
+        print("✅ Nothing to compact")
+        return
+    for r in results:
+        after = "(dry run)" if args.dry_run else f"→ {r['files_after']} file(s)"
+        print(f"   🗜️  {r['partition']}: {r['files_before']} files {after}, {r['rows']:,} rows")
+    print(f"✅ {'Would compact' if args.dry_run else 'Compacted'} {len(results)} partition(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,542 @@
 """
 Central DuckDB manager.
 
-Every connection registers views over all Parquet data directories so any
+Views over all Parquet data directories live in mlb_betting.duckdb, so any
 script or notebook can query the full data lake without knowing file paths.
 
 Views created automatically:
-    v_odds_the_odds_api   — data/bronze/odds/the_odds_api_*.parquet
-    v_odds_kalshi         — data/bronze/odds/kalshi_*.parquet
-    v_odds_polymarket     — data/bronze/odds/polymarket_*.parquet
+    v_odds_the_odds_api   — data/bronze/odds/source=the_odds_api/snapshot_date=*/*.parquet
+    v_odds_kalshi         — data/bronze/odds/source=kalshi/snapshot_date=*/*.parquet
+    v_odds_polymarket     — data/bronze/odds/source=polymarket/snapshot_date=*/*.parquet
+    v_odds_delta_*        — data/bronze/odds_delta/source=*/snapshot_date=*/*.parquet (same three sources)
     v_bronze_lineups      — data/bronze/lineups/lineups_*.parquet
     v_silver_lineups      — data/silver/lineups/lineups_*.parquet
     v_schedules           — data/schedules/*.parquet
-    v_game_logs_batting   — data/player_logs/game_by_game/batting_*.parquet
-    v_game_logs_pitching  — data/player_logs/game_by_game/pitching_*.parquet
+    v_game_logs_batting   — data/player_logs/game_by_game/batting_game_logs_*/game_date=*/*.parquet
+    v_game_logs_pitching  — data/player_logs/game_by_game/pitching_game_logs_*/game_date=*/*.parquet
     v_fangraphs_batting   — data/player_logs/fangraphs_leaderboards/batting_*.parquet
     v_fangraphs_pitching  — data/player_logs/fangraphs_leaderboards/pitching_*.parquet
     v_linear_weights      — data/reference/linear_weights.parquet
+
+The odds views are Hive-partitioned (source=/snapshot_date=), so filters on
+snapshot_date skip whole partitions instead of scanning the season. The game
+log views are partitioned by game_date the same way.
+
+Table macros rebuild full snapshots from the delta-encoded odds (ODDS_INGEST_MODE=delta):
+    SELECT * FROM odds_asof_the_odds_api(TIMESTAMPTZ '2026-03-26 18:00:00+00')
+    SELECT * FROM odds_asof_kalshi(now())
+    SELECT * FROM odds_asof_polymarket(now())
+
+View registry: the views and macros persist in the database, each pinned to
+an explicit list of its live files (lake.live_files(): part files already
+replaced by a compacted file are left out). A published version (writer.py)
+therefore reads exactly the files it was published with. The
+_view_manifest table records, per object, a hash of its definition, whether
+files existed, and a signature over the modification times of the
+directories its files live in (adding, removing or atomically replacing a
+file changes its directory's mtime); _view_files holds the pinned lists.
+A refresh only stats those directories. It globs only when a signature has
+changed, and runs CREATE/DROP only when the live file list differs.
+
+Connections: only the single writer (writer.py) opens the working database
+read-write (writer_connection()); changes go through writer.submit().
+get_connection() opens the latest published version read-only, which never
+blocks the writer.
+
+Materialized mode (optional): any view can also be kept as a native table in
+mlb_betting.duckdb, named t_* instead of v_* (v_game_logs_batting →
+t_game_logs_batting), so analytical queries scan DuckDB's columnar storage
+instead of decoding Parquet. Each row carries its _source_file; the
+_materialized_files table is the watermark: the (size, mtime) of every file
+loaded. A refresh stats the view's files and only touches the difference:
+new files are inserted, files that changed or disappeared (rewritten per-year
+files, part files merged by the compactor) have their rows deleted and are
+re-read if still present. New columns are added to the table as they appear.
+Enable with DB_MATERIALIZE (refreshed with the views before every publish),
+or run the CLI below. analytics_connection() serves a table only while its
+watermark still matches the files on disk, so a stale table is never read.
+
+    python src/database/db_manager.py --materialize v_game_logs_batting v_game_logs_pitching
+    python src/database/db_manager.py --materialize all --full     # rebuild from scratch
+
+Lake reads: cursor() hands out cursors on one long-lived in-memory DuckDB
+per process (threads/memory capped by DUCKDB_THREADS / DUCKDB_MEMORY_LIMIT).
+Cursors share the database's thread pool, buffer manager and Parquet
+metadata cache, so re-reading the same files skips the footer parse. Each
+cursor has its own registered objects and transaction, so one per call (or
+per thread) is safe; closing it leaves the database open. Use it for
+read_parquet()/COPY work; get_connection() is for the persisted views and
+tables in mlb_betting.duckdb.
+
+    from src.database.db_manager import cursor
+    con = cursor()
+    con.execute("SELECT ... FROM read_parquet(...)")
+
+Query cache: cached_query() stores a query's result as an Arrow IPC file
+under data/db/query_cache/, keyed by the normalized SQL, its parameters and
+the (size, mtime) of every Parquet file it reads: files named in
+read_parquet(...), and the files behind any lake view, t_* table or
+odds_asof_* macro it mentions. Re-running it over unchanged files memory-maps
+the stored result instead of scanning; any added, rewritten or removed file
+changes the key. Least recently used results are evicted beyond
+QUERY_CACHE_MAX_MB. Inputs the SQL doesn't show (temp tables, registered
+Arrow data) must be derived from files passed as depends_on, or the query
+must not be cached.
+
+    from src.database.db_manager import cached_query, cursor
+    woba = cached_query(cursor(), "SELECT ... FROM read_parquet('.../batting_*.parquet') ...")
+    python src/database/db_manager.py --clear-cache
 """
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
 import duckdb
+import pyarrow as pa
 from datetime import datetime, timezone
-from config.settings import DB_PATH, BASE_DIR
+from functools import partial
+from typing import Callable
+from config.settings import (DB_PATH, BASE_DIR, DB_MATERIALIZE, DB_VERSIONS_DIR,
+                             DUCKDB_THREADS, DUCKDB_MEMORY_LIMIT, QUERY_CACHE_DIR,
+                             QUERY_CACHE_MAX_MB)
+from src.database.lake import live_files, odds_asof_sql, parquet_list_sql
+from src.database.odds_delta import DELTA_KEYS
+from src.database.parquet_writer import rows_to_table
 
 # ---------------------------------------------------------------------------
 # View definitions: (view_name, glob_pattern_relative_to_BASE_DIR)
 # Only created if at least one matching file exists.
 # ---------------------------------------------------------------------------
 _VIEWS = [
-    ("v_odds_the_odds_api",  "data/bronze/odds/the_odds_api_*.parquet"),
-    ("v_odds_kalshi",        "data/bronze/odds/kalshi_*.parquet"),
-    ("v_odds_polymarket",    "data/bronze/odds/polymarket_*.parquet"),
+    ("v_odds_the_odds_api",  "data/bronze/odds/source=the_odds_api/snapshot_date=*/*.parquet"),
+    ("v_odds_kalshi",        "data/bronze/odds/source=kalshi/snapshot_date=*/*.parquet"),
+    ("v_odds_polymarket",    "data/bronze/odds/source=polymarket/snapshot_date=*/*.parquet"),
+    ("v_odds_delta_the_odds_api", "data/bronze/odds_delta/source=the_odds_api/snapshot_date=*/*.parquet"),
+    ("v_odds_delta_kalshi",       "data/bronze/odds_delta/source=kalshi/snapshot_date=*/*.parquet"),
+    ("v_odds_delta_polymarket",   "data/bronze/odds_delta/source=polymarket/snapshot_date=*/*.parquet"),
     ("v_bronze_lineups",     "data/bronze/lineups/lineups_*.parquet"),
     ("v_silver_lineups",     "data/silver/lineups/lineups_*.parquet"),
     ("v_schedules",          "data/schedules/*.parquet"),
-    ("v_game_logs_batting",  "data/player_logs/game_by_game/batting_*.parquet"),
-    ("v_game_logs_pitching", "data/player_logs/game_by_game/pitching_*.parquet"),
+    ("v_game_logs_batting",  "data/player_logs/game_by_game/batting_game_logs_*/game_date=*/*.parquet"),
+    ("v_game_logs_pitching", "data/player_logs/game_by_game/pitching_game_logs_*/game_date=*/*.parquet"),
     ("v_fangraphs_batting",  "data/player_logs/fangraphs_leaderboards/batting_*.parquet"),
     ("v_fangraphs_pitching", "data/player_logs/fangraphs_leaderboards/pitching_*.parquet"),
     ("v_linear_weights",     "data/reference/linear_weights.parquet"),
 ]
 
 
-def register_views(con: duckdb.DuckDBPyConnection) -> None:
-    """Register all data-lake views on an open connection. Skips missing files silently."""
-    for view_name, rel_pattern in _VIEWS:
-        abs_pattern = str(BASE_DIR / rel_pattern)
-        # Only create the view if at least one matching file exists
-        matching = sorted(BASE_DIR.glob(rel_pattern))
-        if not matching:
+_MANIFEST = "_view_manifest"
+_VIEW_FILES = "_view_files"
+_FILES = "_materialized_files"
+
+
+def _view_sql(view_name: str, files: list[Path]) -> str:
+    return f"""
+        CREATE OR REPLACE VIEW {view_name} AS
+        SELECT * FROM read_parquet({parquet_list_sql(files)}, union_by_name=true,
+                                   hive_partitioning=true)
+    """
+
+
+def _macro_sql(source: str, files: list[Path]) -> str:
+    return f"""
+        CREATE OR REPLACE MACRO odds_asof_{source}(ts) AS TABLE
+        SELECT * FROM {odds_asof_sql(source, "ts", files)}
+    """
+
+
+def _registry() -> list[tuple[str, str, str, Callable[[list[Path]], str]]]:
+    """Every managed object: (name, kind, rel_pattern of its files, files → create SQL)."""
+    objects = [(name, "VIEW", rel, partial(_view_sql, name)) for name, rel in _VIEWS]
+    for source in DELTA_KEYS:
+        rel = f"data/bronze/odds_delta/source={source}/snapshot_date=*/*.parquet"
+        objects.append((f"odds_asof_{source}", "MACRO TABLE", rel, partial(_macro_sql, source)))
+    return objects
+
+
+def _signature(rel_pattern: str) -> str:
+    """Hash of the mtime of every directory that can hold a file matching the pattern."""
+    parent = rel_pattern.rsplit("/", 1)[0]
+    dirs = sorted(BASE_DIR.glob(parent)) if any(c in parent for c in "*?[") else [BASE_DIR / parent]
+    h = hashlib.sha1()
+    for d in dirs:
+        try:
+            h.update(f"{d}:{d.stat().st_mtime_ns};".encode())
+        except OSError:
+            continue
+    return h.hexdigest()
+
+
+def register_views(con: duckdb.DuckDBPyConnection, force: bool = False) -> list[str]:
+    """Bring the persisted data-lake views and macros up to date. Returns the names re-created or dropped.
+
+    Objects whose directories are unchanged since the manifest was written are
+    skipped without globbing (force=True re-creates everything). An object
+    whose files are all gone is dropped.
+    """
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {_MANIFEST} (
+            name VARCHAR PRIMARY KEY,
+            signature VARCHAR,
+            sql_hash VARCHAR,
+            present BOOLEAN,
+            registered_at TIMESTAMPTZ
+        )
+    """)
+    con.execute(f"CREATE TABLE IF NOT EXISTS {_VIEW_FILES} (name VARCHAR, file VARCHAR)")
+    manifest = {r[0]: r[1:] for r in con.execute(
+        f"SELECT name, signature, sql_hash, present FROM {_MANIFEST}"
+    ).fetchall()}
+
+    changed = []
+    for name, kind, rel_pattern, build_sql in _registry():
+        signature = _signature(rel_pattern)
+        sql_hash = hashlib.sha1(build_sql([]).encode()).hexdigest()  # the definition, minus its files
+        prev = manifest.get(name)
+        if not force and prev and prev[:2] == (signature, sql_hash):
             continue
+        files = live_files(BASE_DIR / rel_pattern)
+        pinned = [r[0] for r in con.execute(
+            f"SELECT file FROM {_VIEW_FILES} WHERE name = ? ORDER BY file", [name]
+        ).fetchall()]
+        present = bool(files)
         try:
-            con.execute(f"""
-                CREATE OR REPLACE VIEW {view_name} AS
-                SELECT * FROM read_parquet('{abs_pattern}', union_by_name=true)
-            """)
+            con.begin()
+            if present and (force or not prev or prev[1] != sql_hash or pinned != sorted(map(str, files))):
+                con.execute(build_sql(files))
+                changed.append(name)
+            elif not present and (not prev or prev[2]):
+                con.execute(f"DROP {kind} IF EXISTS {name}")
+                changed.append(name)
+            if name in changed:
+                con.execute(f"DELETE FROM {_VIEW_FILES} WHERE name = ?", [name])
+                con.execute(f"INSERT INTO {_VIEW_FILES} SELECT ?, unnest(?)",
+                            [name, [str(f) for f in files]])
+            con.execute(f"INSERT OR REPLACE INTO {_MANIFEST} VALUES (?, ?, ?, ?, ?)",
+                        [name, signature, sql_hash, present, datetime.now(timezone.utc)])
+            con.commit()
         except Exception as e:
-            print(f"   ⚠️  Could not create view {view_name}: {e}")
+            con.rollback()
+            print(f"   ⚠️  Could not create {kind.split()[0].lower()} {name}: {e}")
+    return changed
 
 
-def get_connection(read_only: bool = False) -> duckdb.DuckDBPyConnection:
-    """Return a DuckDB connection with all data-lake views registered."""
-    con = duckdb.connect(str(DB_PATH), read_only=read_only)
-    if not read_only:
-        register_views(con)
+def refresh_lake(con: duckdb.DuckDBPyConnection) -> bool:
+    """Views, then the DB_MATERIALIZE tables. The writer runs this before every publish.
+
+    Returns True if any view, macro or materialized table changed.
+    """
+    changed = bool(register_views(con))
+    if DB_MATERIALIZE:
+        changed |= bool(refresh_materialized(con, None if "all" in DB_MATERIALIZE else DB_MATERIALIZE))
+    return changed
+
+
+def pinned_files(con: duckdb.DuckDBPyConnection) -> list[str]:
+    """Every Parquet file the registered views and macros read."""
+    return [r[0] for r in con.execute(
+        f"SELECT DISTINCT file FROM {_VIEW_FILES} ORDER BY file"
+    ).fetchall()]
+
+
+def table_name(view_name: str) -> str:
+    """Materialized table of a lake view: v_game_logs_batting → t_game_logs_batting."""
+    return "t_" + view_name.removeprefix("v_")
+
+
+def _file_state(rel_pattern: str) -> dict[str, tuple[int, int]]:
+    """{path: (size, mtime_ns)} of every live file matching the pattern."""
+    state = {}
+    for path in live_files(BASE_DIR / rel_pattern):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        state[str(path)] = (st.st_size, st.st_mtime_ns)
+    return state
+
+
+def _loaded_state(con: duckdb.DuckDBPyConnection, table: str) -> dict[str, tuple[int, int]] | None:
+    """Watermark of a materialized table, or None if the table doesn't exist."""
+    exists = con.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND NOT temporary", [table]
+    ).fetchone()[0]
+    has_files = con.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [_FILES]
+    ).fetchone()[0]
+    if not exists or not has_files:
+        return None
+    return {f: (size, mtime) for f, size, mtime in con.execute(
+        f"SELECT file, size, mtime_ns FROM {_FILES} WHERE table_name = ?", [table]
+    ).fetchall()}
+
+
+def _files_sql(files: list[str]) -> str:
+    file_list = ", ".join("'{}'".format(f.replace("'", "''")) for f in files)
+    return (f"read_parquet([{file_list}], union_by_name=true, hive_partitioning=true, "
+            f"filename='_source_file')")
+
+
+def _add_new_columns(con: duckdb.DuckDBPyConnection, table: str, files: list[str]) -> None:
+    """ALTER the table to hold every column of the files (runs outside the load transaction:
+    DuckDB won't alter a table that the same transaction has already deleted from)."""
+    existing = {r[0] for r in con.execute(f"DESCRIBE {table}").fetchall()}
+    for col, col_type, *_ in con.execute(f"DESCRIBE SELECT * FROM {_files_sql(files)}").fetchall():
+        if col not in existing:
+            con.execute(f'ALTER TABLE {table} ADD COLUMN "{col}" {col_type}')
+
+
+def refresh_materialized(con: duckdb.DuckDBPyConnection, views: list[str] | None = None,
+                         full: bool = False) -> dict[str, tuple[int, int]]:
+    """Bring the t_* tables of the given views (default: all) up to date with their files.
+
+    Only files added, changed or removed since the last refresh are read.
+    Returns {table: (files_loaded, files_dropped)} for every table touched.
+    full=True rebuilds each table from scratch.
+    """
+    patterns = dict(_VIEWS)
+    unknown = [v for v in views or () if v not in patterns]
+    if unknown:
+        raise ValueError(f"Unknown views: {', '.join(unknown)}")
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {_FILES} (
+            table_name VARCHAR,
+            file VARCHAR,
+            size BIGINT,
+            mtime_ns BIGINT,
+            loaded_at TIMESTAMPTZ,
+            PRIMARY KEY (table_name, file)
+        )
+    """)
+
+    changed = {}
+    for view_name in views or list(patterns):
+        table = table_name(view_name)
+        current = _file_state(patterns[view_name])
+        loaded = None if full else _loaded_state(con, table)
+        if loaded is None:
+            dropped = []
+            new = sorted(current)
+            if not new:  # no files (yet): nothing to materialize
+                con.execute(f"DROP TABLE IF EXISTS {table}")
+                continue
+        else:
+            dropped = sorted(f for f, st in loaded.items() if current.get(f) != st)
+            new = sorted(f for f, st in current.items() if loaded.get(f) != st)
+            if not dropped and not new:
+                continue
+
+        try:
+            if loaded is not None and new:
+                _add_new_columns(con, table, new)
+            con.begin()
+            if loaded is None:
+                con.execute(f"DELETE FROM {_FILES} WHERE table_name = ?", [table])
+                con.execute(f"DROP TABLE IF EXISTS {table}")
+            elif dropped:
+                con.execute(f"DELETE FROM {table} WHERE _source_file IN (SELECT unnest(?))", [dropped])
+                con.execute(f"DELETE FROM {_FILES} WHERE table_name = ? AND file IN (SELECT unnest(?))",
+                            [table, dropped])
+            if new:
+                verb = f"CREATE TABLE {table} AS" if loaded is None else f"INSERT INTO {table} BY NAME"
+                con.execute(f"{verb} SELECT * FROM {_files_sql(new)}")
+                now = datetime.now(timezone.utc)
+                con.executemany(f"INSERT INTO {_FILES} VALUES (?, ?, ?, ?, ?)",
+                                [[table, f, *current[f], now] for f in new])
+            con.commit()
+        except duckdb.Error as e:
+            try:
+                con.rollback()
+            except duckdb.Error:
+                pass  # failed before begin(), or the failed commit already rolled back
+            print(f"   ⚠️  Could not refresh {table}: {e}")
+            continue
+        changed[table] = (len(new), len(dropped))
+    return changed
+
+
+def analytics_connection(views: list[str]) -> tuple[duckdb.DuckDBPyConnection, set[str]]:
+    """Connection for analytical reads, and which of the views to read from their t_* table.
+
+    When any of the views has a materialized table whose watermark matches the
+    files on disk, returns a read-only connection to the published version and
+    those views. Otherwise (mode off, table stale, nothing published yet)
+    returns a cursor() and an empty set: read the Parquet files instead.
+    """
+    db = published_db()
+    if db is not None:
+        try:
+            con = duckdb.connect(str(db), read_only=True)
+        except duckdb.Error:
+            con = None
+        if con is not None:
+            patterns = dict(_VIEWS)
+            fresh = {v for v in views
+                     if _loaded_state(con, table_name(v)) == _file_state(patterns[v])}
+            if fresh:
+                return con, fresh
+            con.close()
+    return cursor(), set()
+
+
+_DB: duckdb.DuckDBPyConnection | None = None
+_DB_PID: int | None = None
+_DB_LOCK = threading.Lock()
+
+
+def _database() -> duckdb.DuckDBPyConnection:
+    """The process's in-memory DuckDB, created on first use (and again after a fork)."""
+    global _DB, _DB_PID
+    with _DB_LOCK:
+        if _DB is None or _DB_PID != os.getpid():
+            config = {"memory_limit": DUCKDB_MEMORY_LIMIT}
+            if DUCKDB_THREADS > 0:
+                config["threads"] = DUCKDB_THREADS
+            _DB = duckdb.connect(config=config)
+            # GLOBAL so every cursor sees it. Cached footers are re-validated
+            # against the file's mtime, so rewritten files are re-read.
+            _DB.execute("SET GLOBAL parquet_metadata_cache = true")
+            _DB_PID = os.getpid()
+        return _DB
+
+
+def cursor() -> duckdb.DuckDBPyConnection:
+    """A new cursor on the shared in-memory database. close() it when done."""
+    return _database().cursor()
+
+
+# read_parquet('path') or read_parquet(['a', 'b', ...]), and the quoted strings inside
+_READ_PARQUET_ARG = re.compile(r"read_parquet\(\s*(\[[^\]]*\]|'(?:[^']|'')*')", re.IGNORECASE)
+_SQL_STRING = re.compile(r"'((?:[^']|'')*)'")
+
+
+def _query_files(sql: str) -> list[Path]:
+    """Every live Parquet file a query reads, as far as its SQL shows."""
+    files = []
+    for arg in _READ_PARQUET_ARG.findall(sql):
+        for literal in _SQL_STRING.findall(arg):
+            files.extend(live_files(literal.replace("''", "'")))
+    for name, kind, rel_pattern, _build in _registry():
+        names = [name, table_name(name)] if kind == "VIEW" else [name]
+        if any(re.search(rf"\b{n}\b", sql) for n in names):
+            files.extend(live_files(BASE_DIR / rel_pattern))
+    return files
+
+
+def _fingerprint(files: list[Path]) -> list[tuple[str, int, int]]:
+    out = []
+    for path in sorted(set(files)):
+        try:
+            st = path.stat()
+            out.append((str(path), st.st_size, st.st_mtime_ns))
+        except OSError:
+            out.append((str(path), -1, -1))
+    return out
+
+
+def _evict_query_cache() -> None:
+    """Delete least recently used results until the cache fits QUERY_CACHE_MAX_MB."""
+    entries = []
+    for path in QUERY_CACHE_DIR.glob("*.arrow"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= QUERY_CACHE_MAX_MB * 1024 * 1024:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_query(con: duckdb.DuckDBPyConnection, sql: str, params=None,
+                 depends_on: list[Path] | tuple = ()) -> pa.Table:
+    """Run a query as an Arrow table, or return the stored result if its files are unchanged.
+
+    depends_on: extra files the result depends on that the SQL doesn't name
+    (e.g. the source of a temp table it joins). A query with no files to
+    fingerprint is run uncached. Hits are memory-mapped, not copied.
+    """
+    files = _query_files(sql) + [Path(f) for f in depends_on]
+    if QUERY_CACHE_MAX_MB <= 0 or not files:
+        return con.execute(sql, params).to_arrow_table()
+
+    fingerprint = _fingerprint(files)
+    key = hashlib.sha256(json.dumps(
+        [" ".join(sql.strip().rstrip(";").split()), params, fingerprint], default=str
+    ).encode()).hexdigest()
+    path = QUERY_CACHE_DIR / f"{key}.arrow"
+    try:
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        os.utime(path)  # most recently used
+        return table
+    except (FileNotFoundError, pa.ArrowInvalid):
+        pass
+
+    table = con.execute(sql, params).to_arrow_table()
+    if _fingerprint(files) != fingerprint:
+        return table  # a file changed mid-query: don't store a result under the old key
+    QUERY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = QUERY_CACHE_DIR / f".{key}.{uuid.uuid4().hex[:8]}.tmp"
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+    _evict_query_cache()
+    return table
+
+
+def clear_query_cache() -> int:
+    """Delete every stored query result. Returns how many were removed."""
+    removed = 0
+    for path in QUERY_CACHE_DIR.glob("*.arrow"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def published_db() -> Path | None:
+    """Database file of the current published version (None before the first publish)."""
+    try:
+        current = json.loads((DB_VERSIONS_DIR / "CURRENT.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return DB_VERSIONS_DIR / current["database"]
+
+
+def get_connection() -> duckdb.DuckDBPyConnection:
+    """Return a read-only DuckDB connection with all data-lake views registered.
+
+    Opens the current published version, falling back to the working
+    database before anything has been published. Changes go through
+    writer.submit().
+    """
+    return duckdb.connect(str(published_db() or DB_PATH), read_only=True)
+
+
+def writer_connection() -> duckdb.DuckDBPyConnection:
+    """The working database, read-write, with views and materialized tables refreshed.
+
+    For the single writer (writer.py) only: while it is open no other
+    process can open the file.
+    """
+    con = duckdb.connect(str(DB_PATH))
+    refresh_lake(con)
     return con
 
 
 def get_views() -> None:
     """Print all registered views and their row counts. Useful for sanity checks."""
-    con = duckdb.connect(str(DB_PATH), read_only=True)
-    register_views(con)
+    con = get_connection()
 
     print(f"\n{'View':<25} {'Rows':>10}  Pattern")
     print("-" * 70)
@@ -91,53 +554,128 @@ def get_views() -> None:
     con.close()
 
 
-def append_to_table(df, table_name: str) -> None:
+def _as_arrow(data, dataset: str | None = None) -> list[pa.Table | pa.RecordBatch]:
+    """Arrow batches of an append's input, without copying Arrow data."""
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        return [data]
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        return [rows_to_table(data, dataset)]
+    if hasattr(data, "iloc"):  # pandas DataFrame
+        return [pa.Table.from_pandas(data, preserve_index=False)]
+    return list(data)  # RecordBatchReader, or any iterable of tables/batches
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def append_batches(con: duckdb.DuckDBPyConnection, table_name: str,
+                   batches: list[pa.Table | pa.RecordBatch], fetch_ts: datetime) -> int:
+    """Writer job behind append_to_table(): add missing columns, then insert every batch.
+
+    The columns come from the union of the batches' schemas, so every
+    CREATE/ALTER runs before the first INSERT (DuckDB won't ALTER a table
+    that the same transaction has already inserted into). DDL and inserts
+    are one transaction: a failed append leaves no new table or column.
+    """
+    table = _quote(table_name)
+    schema = pa.unify_schemas([b.schema for b in batches], promote_options="permissive")
+    names = [f"_append_{i}" for i in range(len(batches))]
+    con.register("_append_schema", schema.empty_table())
+    for name, batch in zip(names, batches):
+        con.register(name, batch)
+    try:
+        con.begin()
+        try:
+            exists = con.execute(
+                "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ? AND NOT temporary",
+                [table_name],
+            ).fetchone()[0]
+            if not exists:
+                con.execute(f"CREATE TABLE {table} AS SELECT * FROM _append_schema")
+            columns = {r[0] for r in con.execute(f"DESCRIBE {table}").fetchall()}
+            if "fetch_timestamp" not in columns:
+                con.execute(f"ALTER TABLE {table} ADD COLUMN fetch_timestamp TIMESTAMPTZ")
+                columns.add("fetch_timestamp")
+            for col, col_type, *_ in con.execute("DESCRIBE SELECT * FROM _append_schema").fetchall():
+                if col not in columns:
+                    con.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(col)} {col_type}")
+
+            for name, batch in zip(names, batches):
+                stamped = ("* REPLACE (CAST($ts AS TIMESTAMPTZ) AS fetch_timestamp)"
+                           if "fetch_timestamp" in batch.schema.names
+                           else "*, CAST($ts AS TIMESTAMPTZ) AS fetch_timestamp")
+                con.execute(f"INSERT INTO {table} BY NAME SELECT {stamped} FROM {name}",
+                            {"ts": fetch_ts})
+            con.commit()
+        except duckdb.Error:
+            con.rollback()
+            raise
+    finally:
+        for name in ["_append_schema", *names]:
+            con.unregister(name)
+    return sum(b.num_rows for b in batches)
+
+
+def append_to_table(data, table_name: str, dataset: str | None = None) -> int:
     """
-    Schema-evolving append to a DuckDB table.
-    Creates the table on first run, adds new columns automatically.
-    Always stamps a fetch_timestamp.
+    Typed, schema-evolving append to a DuckDB table. Returns the rows appended.
+
+    data: a pyarrow Table or RecordBatch, a RecordBatchReader or any iterable
+    of them, row dicts (typed from `dataset` in data_schemas.yaml if given),
+    or a pandas DataFrame. Arrow input is scanned in place (no copy) when the
+    writer runs in this process, and pickled to it otherwise.
+
+    Creates the table on first run and adds new columns with their Arrow
+    type, so numeric columns stay numeric. The new table or columns and every
+    batch's rows are written in one transaction: either the whole append
+    lands or nothing does. Every row is stamped with the same fetch_timestamp.
 
     NOTE: For odds/lineups, prefer appending to Parquet files directly
     (the views will pick up new data automatically). Use this for small
     reference tables or debug data that doesn't have a Parquet home.
     """
-    if df is None or df.empty:
+    from src.database.writer import submit  # writer.py imports this module
+
+    batches = [b for b in _as_arrow(data, dataset) if b is not None and b.num_rows]
+    if not batches:
         print(f"⚠️  No data to append to {table_name}")
-        return
+        return 0
 
-    import pandas as pd  # only needed here; pandas may not always be available
+    n = submit("append_to_table", table_name, batches, datetime.now(timezone.utc))
+    print(f"✅ Appended {n:,} rows to '{table_name}' ({len(batches)} batch(es))")
+    return n
 
-    df = df.copy()
-    con = get_connection()
 
-    table_exists = con.execute(
-        f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'"
-    ).fetchone() is not None
+def main():
+    from src.database.writer import submit  # writer.py imports this module
 
-    if not table_exists:
-        con.execute(f"CREATE TABLE {table_name} AS SELECT * FROM df LIMIT 0")
+    parser = argparse.ArgumentParser(description="Inspect the DuckDB data-lake views")
+    parser.add_argument("--materialize", nargs="+", metavar="VIEW",
+                        help="Create/refresh the t_* tables of these views ('all' for every view)")
+    parser.add_argument("--full", action="store_true",
+                        help="With --materialize: rebuild the tables from scratch")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Delete every cached query result (cached_query)")
+    args = parser.parse_args()
 
-    existing_cols = [row[0] for row in con.execute(f"PRAGMA table_info({table_name})").fetchall()]
+    if args.clear_cache:
+        print(f"✅ Removed {clear_query_cache():,} cached query result(s)")
+        return
 
-    if "fetch_timestamp" not in existing_cols:
-        try:
-            con.execute(f"ALTER TABLE {table_name} ADD COLUMN fetch_timestamp TIMESTAMP")
-        except Exception:
-            pass
+    if not args.materialize:
+        get_views()
+        return
+    views = None if "all" in args.materialize else args.materialize
+    unknown = [v for v in views or () if v not in dict(_VIEWS)]
+    if unknown:
+        parser.error(f"unknown view(s): {', '.join(unknown)}")
 
-    for col in df.columns:
-        if col not in existing_cols and col != "fetch_timestamp":
-            try:
-                con.execute(f'ALTER TABLE {table_name} ADD COLUMN "{col}" VARCHAR')
-            except Exception:
-                pass
-
-    df["fetch_timestamp"] = datetime.now(timezone.utc)
-    con.register("_append_df", df)
-    con.execute(f"INSERT INTO {table_name} BY NAME SELECT * FROM _append_df")
-    print(f"✅ Appended {len(df)} rows to '{table_name}'")
-    con.close()
+    changed = submit("refresh_materialized", views, args.full)
+    for table, (loaded, dropped) in changed.items():
+        print(f"   🔁 {table}: {loaded} file(s) loaded, {dropped} dropped")
+    print(f"✅ {len(changed)} materialized table(s) refreshed")
 
 
 if __name__ == "__main__":
-    get_views()
+    main()
@@ -0,0 +1,243 @@
+"""
+Canonical game keys — every source's notion of "a game" resolved to MLB's game_pk.
+
+Each source names games its own way: The Odds API uses full team names and a
+UTC commence_time, Kalshi packs its own team codes into the ticker, Polymarket
+uses "Away vs. Home" titles and Rotowire uses its abbreviations. Matching
+those on (away, home) tuples breaks on alias mismatches and can't tell the
+two halves of a doubleheader apart.
+
+Instead rows are stamped at ingest with the integer game_pk from the MLB
+schedule (data/schedules/games_YYYY.parquet, written by schedule_fetcher.py):
+
+    team names/codes → canonical abbreviation (TEAM_ABBREV_TO_FULL + aliases)
+    (game_date, away, home) → scheduled games on that date
+    doubleheader → the game whose scheduled start is closest to the source's
+
+Rows that can't be resolved (futures, win totals, a missing schedule file,
+an ambiguous doubleheader with no start time) get game_pk = None.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pyarrow.parquet as pq
+
+from config.settings import RAW_DIR, SCHEDULES_DIR
+
+_ET = ZoneInfo("America/New_York")
+
+# ========================= TEAMS =========================
+
+TEAM_ABBREV_TO_FULL: dict[str, str] = {
+    "ARI": "Arizona Diamondbacks",
+    "ATL": "Atlanta Braves",
+    "BAL": "Baltimore Orioles",
+    "BOS": "Boston Red Sox",
+    "CHC": "Chicago Cubs",
+    "CWS": "Chicago White Sox",
+    "CIN": "Cincinnati Reds",
+    "CLE": "Cleveland Guardians",
+    "COL": "Colorado Rockies",
+    "DET": "Detroit Tigers",
+    "HOU": "Houston Astros",
+    "KC":  "Kansas City Royals",
+    "LAA": "Los Angeles Angels",
+    "LAD": "Los Angeles Dodgers",
+    "MIA": "Miami Marlins",
+    "MIL": "Milwaukee Brewers",
+    "MIN": "Minnesota Twins",
+    "NYM": "New York Mets",
+    "NYY": "New York Yankees",
+    "OAK": "Athletics",
+    "PHI": "Philadelphia Phillies",
+    "PIT": "Pittsburgh Pirates",
+    "SD":  "San Diego Padres",
+    "SF":  "San Francisco Giants",
+    "SEA": "Seattle Mariners",
+    "STL": "St. Louis Cardinals",
+    "TB":  "Tampa Bay Rays",
+    "TEX": "Texas Rangers",
+    "TOR": "Toronto Blue Jays",
+    "WSH": "Washington Nationals",
+}
+
+TEAM_FULL_TO_ABBREV: dict[str, str] = {v: k for k, v in TEAM_ABBREV_TO_FULL.items()}
+
+# Other spellings seen in the sources and in older schedules
+_TEAM_ALIASES: dict[str, str] = {
+    "AZ": "ARI", "ATH": "OAK", "CHW": "CWS", "KCR": "KC", "SDP": "SD", "SFG": "SF",
+    "TBR": "TB", "WSN": "WSH", "WAS": "WSH", "ANA": "LAA", "FLA": "MIA",
+    "Oakland Athletics": "OAK", "Cleveland Indians": "CLE",
+    "Los Angeles Angels of Anaheim": "LAA", "Florida Marlins": "MIA",
+    "Tampa Bay Devil Rays": "TB",
+}
+
+
+def _nickname(full: str) -> str:
+    """'Boston Red Sox' → 'Red Sox', 'Atlanta Braves' → 'Braves'."""
+    words = full.split()
+    return " ".join(words[-2:]) if words[-1] in ("Sox", "Jays") else words[-1]
+
+
+_TEAM_LOOKUP: dict[str, str] = {}
+for _abbr, _full in TEAM_ABBREV_TO_FULL.items():
+    for _name in (_abbr, _full, _nickname(_full)):
+        _TEAM_LOOKUP[_name.upper()] = _abbr
+for _alias, _abbr in _TEAM_ALIASES.items():
+    _TEAM_LOOKUP[_alias.upper()] = _abbr
+
+
+def team_code(name) -> str | None:
+    """Canonical abbreviation for a team name, nickname or any source's code."""
+    if not name:
+        return None
+    return _TEAM_LOOKUP.get(str(name).strip().upper())
+
+
+# ========================= SCHEDULE INDEX =========================
+
+# year → (schedule file mtime, {(game_date, away, home): [(game_pk, start_utc, postponed)]})
+_INDEX_CACHE: dict[int, tuple[float, dict]] = {}
+
+
+def _schedule_path(year: int) -> Path | None:
+    for path in (SCHEDULES_DIR / f"games_{year}.parquet",
+                 RAW_DIR / "schedules" / f"games_{year}.parquet"):
+        if path.exists():
+            return path
+    return None
+
+
+def _schedule_index(year: int) -> dict:
+    """Games of one season keyed by (game_date, away, home); reloaded when the file changes."""
+    path = _schedule_path(year)
+    if path is None:
+        return {}
+    mtime = path.stat().st_mtime
+    cached = _INDEX_CACHE.get(year)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    table = pq.read_table(path)
+    cols = table.column_names
+    index: dict[tuple, list] = {}
+    for g in table.to_pylist():
+        away, home = team_code(g.get("away_team")), team_code(g.get("home_team"))
+        if g.get("game_id") is None or away is None or home is None:
+            continue
+        start = _to_utc(g.get("game_datetime")) if "game_datetime" in cols else None
+        postponed = str(g.get("status") or "").startswith(("Postponed", "Cancelled"))
+        key = (str(g["game_date"])[:10], away, home)
+        index.setdefault(key, []).append((int(g["game_id"]), start, postponed))
+    _INDEX_CACHE[year] = (mtime, index)
+    return index
+
+
+def _to_utc(value) -> datetime | None:
+    if value is None or value == "":
+        return None
+    ts = value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def resolve_game_pk(game_date, away, home, start: datetime | None = None) -> int | None:
+    """game_pk for a game, or None if it isn't on the schedule (or is ambiguous).
+
+    away/home may be any spelling team_code() knows. start (any tz) picks
+    between the games of a doubleheader; without it a doubleheader is None.
+    """
+    if not game_date:
+        return None
+    away, home = team_code(away), team_code(home)
+    if away is None or home is None:
+        return None
+    game_date = str(game_date)[:10]
+    games = _schedule_index(int(game_date[:4])).get((game_date, away, home), [])
+    played = [g for g in games if not g[2]] or games
+    if len(played) == 1:
+        return played[0][0]
+    if not played or start is None or any(g[1] is None for g in played):
+        return None
+    start = _to_utc(start)
+    return min(played, key=lambda g: abs(g[1] - start))[0]
+
+
+# ========================= STAMPING =========================
+
+
+def _et_time(game_date: str, clock: str | None) -> datetime | None:
+    """'2026-04-10' + '19:05' / '7:05 PM ET' → aware datetime (Eastern)."""
+    if not clock:
+        return None
+    m = re.search(r"(\d{1,2}):(\d{2})\s*([AaPp][Mm])?", clock)
+    if not m:
+        return None
+    hour, minute = int(m.group(1)), int(m.group(2))
+    if m.group(3):
+        hour = hour % 12 + (12 if m.group(3).upper() == "PM" else 0)
+    day = date.fromisoformat(str(game_date)[:10])
+    return datetime(day.year, day.month, day.day, tzinfo=_ET) + timedelta(hours=hour, minutes=minute)
+
+
+def _odds_api_game(r: dict):
+    commence = _to_utc(r.get("commence_time"))
+    if commence is None:
+        return None
+    return (commence.astimezone(_ET).date().isoformat(), r.get("away_team"), r.get("home_team"), commence)
+
+
+def _kalshi_game(r: dict):
+    if r.get("market_type") != "game_winner" or not r.get("game_date"):
+        return None
+    return (r["game_date"], r.get("away_team"), r.get("home_team"),
+            _et_time(r["game_date"], r.get("game_time")))
+
+
+def _polymarket_game(r: dict):
+    if r.get("market_type") != "game_winner" or not r.get("event_date"):
+        return None
+    return (r["event_date"], r.get("away_team"), r.get("home_team"), None)
+
+
+def _lineup_game(r: dict):
+    if not r.get("game_date"):
+        return None
+    game_date = str(r["game_date"])[:10]
+    return (game_date, r.get("away_team"), r.get("home_team"), _et_time(game_date, r.get("game_time")))
+
+
+_GAMES = {
+    "the_odds_api": _odds_api_game,
+    "kalshi":       _kalshi_game,
+    "polymarket":   _polymarket_game,
+    "lineups":      _lineup_game,
+}
+
+
+def stamp_game_pk(source: str, rows: list[dict]) -> int:
+    """Set game_pk on every row in place (None if unresolved). Returns rows resolved.
+
+    Rows of one game share their identifying fields, so each distinct game is
+    resolved once per call.
+    """
+    to_game = _GAMES.get(source)
+    resolved = 0
+    memo: dict[tuple, int | None] = {}
+    for r in rows:
+        game = to_game(r) if to_game else None
+        if game is None:
+            r["game_pk"] = None
+            continue
+        if game not in memo:
+            memo[game] = resolve_game_pk(*game)
+        r["game_pk"] = memo[game]
+        resolved += r["game_pk"] is not None
+    return resolved
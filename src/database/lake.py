@@ -0,0 +1,227 @@
+"""
+Bronze lake layout — Hive-partitioned, append-only odds snapshots.
+
+Each scrape lands one new small file; existing files are never rewritten:
+
+    data/bronze/odds/source=the_odds_api/snapshot_date=2026-03-26/part-141502123456-3f9a1c2e.parquet
+
+The partition columns (source, snapshot_date) live only in the directory
+names. DuckDB re-attaches them at read time (hive_partitioning=true) and skips
+whole directories when a query filters on them, so a single-day lookup reads
+one day of files no matter how far into the season we are.
+
+With ODDS_INGEST_MODE=delta the same layout lives under data/bronze/odds_delta/
+and only changed prices are written (see odds_delta.py). Every helper below
+follows the configured mode, so readers don't need to know which one is on.
+
+Compaction (compaction.py) replaces a partition's part files with one
+part-compacted-*.parquet file that lists the names it replaced in its footer.
+The replaced files stay on disk until no published database version still
+reads them (writer.py), so readers list files with live_files(), not a bare
+glob. live_files() drops every file that a compacted file has superseded.
+
+The player-log date partitions (cumulative snapshots, daily game logs) use
+the same protocol: a rewrite of a date is a new compacted file superseding
+the old one, and a delete is a tombstone, an empty
+part-compacted-tombstone-*.parquet that supersedes the date's files without
+adding rows. Readers see the delete at once; the space is reclaimed by the
+writer's garbage collection, which also removes a tombstone (and its
+directory) once nothing it hid is left. live_files() never lists tombstones.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import glob
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config.settings import BASE_DIR, BRONZE_ODDS_DIR, BRONZE_ODDS_DELTA_DIR, ODDS_INGEST_MODE
+from src.database.odds_delta import DELTA_KEYS, get_tracker
+from src.database.parquet_writer import write_rows
+
+ODDS_SOURCES = ("the_odds_api", "kalshi", "polymarket", "rundown")
+
+# Partition columns are stripped from the part files and rebuilt from the path
+PARTITION_COLS = ("source", "snapshot_date")
+
+DELTA_MODE = ODDS_INGEST_MODE == "delta"
+
+COMPACTED_PREFIX = "part-compacted-"
+COMPACTED_FROM_KEY = b"compacted_from"
+TOMBSTONE_PREFIX = f"{COMPACTED_PREFIX}tombstone-"
+
+# Date partitions outside the odds lake that follow the same protocol
+# (written by player_logs_fetcher.py), relative to BASE_DIR
+DATE_PARTITION_GLOBS = (
+    "data/bronze/player_logs/cumulative/*/snapshot_date=*",
+    "data/player_logs/game_by_game/*/game_date=*",
+    "data/raw/player_logs/game_by_game/*/game_date=*",
+)
+
+# part_dir → (directory mtime, names superseded there)
+_superseded: dict[Path, tuple[int, frozenset[str]]] = {}
+
+
+def odds_root(delta: bool = DELTA_MODE) -> Path:
+    """data/bronze/odds/ (full snapshots) or data/bronze/odds_delta/ (changes only)."""
+    return BRONZE_ODDS_DELTA_DIR if delta else BRONZE_ODDS_DIR
+
+
+def odds_source_dir(source: str, delta: bool = DELTA_MODE) -> Path:
+    """Root directory for one odds source: data/bronze/odds/source=NAME/."""
+    return odds_root(delta) / f"source={source}"
+
+
+def odds_partition_dir(source: str, snapshot_date: str, delta: bool = DELTA_MODE) -> Path:
+    """Directory holding every part file for one (source, snapshot_date)."""
+    return odds_source_dir(source, delta) / f"snapshot_date={snapshot_date}"
+
+
+def odds_glob(source: str, delta: bool = DELTA_MODE) -> str:
+    """Absolute glob matching every part file for a source."""
+    return str(odds_source_dir(source, delta) / "snapshot_date=*" / "*.parquet")
+
+
+def has_odds_files(source: str, delta: bool = DELTA_MODE) -> bool:
+    """True if at least one part file exists for the source."""
+    return any(odds_source_dir(source, delta).glob("snapshot_date=*/*.parquet"))
+
+
+def partition_dirs() -> list[Path]:
+    """Every partition directory on the compaction protocol: odds (both modes) and date partitions."""
+    dirs = [d for delta in (False, True) for source in ODDS_SOURCES
+            for d in sorted(odds_source_dir(source, delta).glob("snapshot_date=*"))]
+    for pattern in DATE_PARTITION_GLOBS:
+        dirs.extend(sorted(d for d in BASE_DIR.glob(pattern) if d.is_dir()))
+    return dirs
+
+
+def compacted_from(path: Path) -> list[str]:
+    """File names a compacted file replaced (from its footer metadata)."""
+    meta = pq.read_metadata(path).metadata or {}
+    return json.loads(meta.get(COMPACTED_FROM_KEY, b"[]"))
+
+
+def superseded_files(part_dir: Path) -> frozenset[str]:
+    """Names of the files in a directory that a compacted file there has replaced."""
+    try:
+        mtime = part_dir.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _superseded.get(part_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    names = set()
+    for compacted in part_dir.glob(f"{COMPACTED_PREFIX}*.parquet"):
+        try:
+            names.update(compacted_from(compacted))
+        except (OSError, pa.ArrowException):  # removed since the glob
+            continue
+    _superseded[part_dir] = (mtime, frozenset(names))
+    return _superseded[part_dir][1]
+
+
+def live_files(pattern: str | Path) -> list[Path]:
+    """Files matching an absolute glob, minus those superseded by compaction and tombstones.
+
+    A tombstone holds no rows, so leaving it out changes nothing a reader
+    sees, and no published version ever pins one.
+    """
+    files = [Path(p) for p in sorted(glob.glob(str(pattern)))]
+    return [f for f in files
+            if f.name not in superseded_files(f.parent) and not f.name.startswith(TOMBSTONE_PREFIX)]
+
+
+def parquet_list_sql(files: list[Path]) -> str:
+    """SQL list literal of file paths, for read_parquet([...])."""
+    return "[" + ", ".join("'{}'".format(str(f).replace("'", "''")) for f in files) + "]"
+
+
+def _read_parquet_sql(source: str, delta: bool, files: list[Path] | None = None) -> str:
+    if files is None:
+        files = live_files(odds_glob(source, delta))
+    return (
+        f"read_parquet({parquet_list_sql(files)}, hive_partitioning=true, "
+        f"hive_types={{'snapshot_date': DATE}}, union_by_name=true)"
+    )
+
+
+def read_odds_sql(source: str, delta: bool = DELTA_MODE) -> str:
+    """Table expression over the live files of one source, with partition pruning enabled.
+
+    The file list is fixed when this is called; check has_odds_files() first.
+
+    In delta mode this is the 'set' rows only: thanks to the daily keyframe,
+    the latest row per key within any snapshot_date filter matches what the
+    full layout returns for the same filter.
+    """
+    if not delta:
+        return _read_parquet_sql(source, delta)
+    return (f"(SELECT * EXCLUDE (delta_op) FROM {_read_parquet_sql(source, delta)} "
+            f"WHERE delta_op = 'set')")
+
+
+def odds_asof_sql(source: str, ts_sql: str, files: list[Path] | None = None) -> str:
+    """Full snapshot of a delta-encoded source as of a timestamp.
+
+    ts_sql is a SQL expression (a TIMESTAMPTZ literal, or a macro parameter).
+    Returns the latest row per price key at or before it, minus keys removed
+    by then. Keyframes mean only the timestamp's day and the day before need
+    scanning (±1 more for session time zones that shift the date cast).
+    files defaults to the source's live delta files.
+    """
+    keys = ", ".join(f'"{c}"' for c in DELTA_KEYS[source][0])
+    return f"""(
+        SELECT * EXCLUDE (delta_op, _rn) FROM (
+            SELECT *, row_number() OVER (
+                PARTITION BY {keys} ORDER BY snapshot_timestamp DESC
+            ) AS _rn
+            FROM {_read_parquet_sql(source, delta=True, files=files)}
+            WHERE snapshot_timestamp <= {ts_sql}
+              AND snapshot_date BETWEEN CAST({ts_sql} AS DATE) - 2
+                                    AND CAST({ts_sql} AS DATE) + 1
+        )
+        WHERE _rn = 1 AND delta_op = 'set'
+    )"""
+
+
+def new_part_path(source: str, snapshot_date: str, delta: bool = DELTA_MODE) -> Path:
+    """Unique path for a new part file inside the (source, snapshot_date) partition."""
+    part_dir = odds_partition_dir(source, snapshot_date, delta)
+    part_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%H%M%S%f")
+    return part_dir / f"part-{stamp}-{uuid.uuid4().hex[:8]}.parquet"
+
+
+def write_odds_part(rows: list[dict], source: str, stream: str | None = None) -> Path | None:
+    """Write one scrape's rows as a new part file and return its path.
+
+    All rows share the scrape's snapshot_date, which picks the partition.
+    Partition columns are dropped from the file; column types come from the
+    odds_SOURCE entry in config/data_schemas.yaml. The write is atomic, so
+    readers never see a half-written part.
+
+    In delta mode only changed rows are written (stream names the poll loop,
+    see odds_delta.py); returns None if nothing changed.
+    """
+    if DELTA_MODE:
+        if source in DELTA_KEYS:
+            tracker = get_tracker(source, stream)
+            rows = tracker.diff(rows)
+        else:
+            tracker = None
+            rows = [{**r, "delta_op": "set"} for r in rows]
+        if not rows:
+            return None
+
+    target = new_part_path(source, str(rows[0]["snapshot_date"]))
+    write_rows(rows, target, f"odds_{source}", exclude=PARTITION_COLS)
+    if DELTA_MODE and tracker is not None:
+        tracker.commit()
+    return target
@@ -0,0 +1,301 @@
+"""
+latest_odds — newest quote per game/book/market/outcome, kept in mlb_betting.duckdb.
+
+The bronze lake keeps every snapshot; answering "what is the price right now"
+from it means a row_number() window over every snapshot in range, which gets
+slower with every poll. Instead each odds fetcher upserts its scrape here
+right after writing the part file, and edge detection reads the current
+board with a plain filter on (source, game_date).
+
+Rows are keyed by the canonical game_pk stamped at ingest (game_keys.py), so
+both games of a doubleheader are kept and edge detection joins sources on an
+integer. Quotes that don't resolve to a scheduled game stay in the lake only.
+
+A row is only replaced by a quote with a newer snapshot_timestamp, so
+re-running an old scrape or a rebuild can never roll prices back.
+
+Writes run as jobs of the single database writer (writer.py). Readers see
+them in the version published after each batch.
+
+Schema: central_db.tables.latest_odds in config/data_schemas.yaml.
+
+Usage:
+    python src/database/latest_odds.py --rebuild    # repopulate from the bronze lake
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import argparse
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import duckdb
+import pyarrow as pa
+
+from config.settings import DATA_SCHEMAS
+from src.database.db_manager import get_connection
+from src.database.game_keys import stamp_game_pk
+from src.database.lake import ODDS_SOURCES, has_odds_files, read_odds_sql
+from src.database.odds_delta import DELTA_KEYS
+from src.database.parquet_writer import arrow_type
+from src.database.writer import submit
+
+TABLE = "latest_odds"
+_SPEC = DATA_SCHEMAS["central_db"]["tables"][TABLE]
+_COLUMNS: dict[str, str] = {c: meta["type"] for c, meta in _SPEC["columns"].items()}
+_KEY: list[str] = _SPEC["primary_key"]
+
+_ET = ZoneInfo("America/New_York")
+
+
+# ========================= NORMALIZATION =========================
+
+
+def _to_utc(value) -> datetime | None:
+    if value is None or value == "":
+        return None
+    ts = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def _to_date(value) -> date | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _to_float(value) -> float | None:
+    return None if value is None else float(value)
+
+
+def _odds_api_rows(rows: list[dict]) -> list[dict]:
+    out = []
+    for r in rows:
+        commence = _to_utc(r.get("commence_time"))
+        if commence is None or r.get("game_pk") is None:
+            continue  # futures/outrights have no game
+        out.append({
+            "source":      "the_odds_api",
+            "game_pk":     r["game_pk"],
+            "game_date":   commence.astimezone(_ET).date(),
+            "away_team":   r["away_team"],
+            "home_team":   r["home_team"],
+            "book":        r["bookmaker"],
+            "market":      r["market"],
+            "outcome":     r.get("outcome_name") or "",
+            "price":       _to_float(r.get("odds")),
+            "point":       _to_float(r.get("point")),
+            "snapshot_timestamp": _to_utc(r["snapshot_timestamp"]),
+        })
+    return out
+
+
+def _kalshi_rows(rows: list[dict]) -> list[dict]:
+    out = []
+    for r in rows:
+        if r.get("market_type") != "game_winner" or r.get("game_pk") is None:
+            continue
+        out.append({
+            "source":      "kalshi",
+            "game_pk":     r["game_pk"],
+            "game_date":   _to_date(r["game_date"]),
+            "away_team":   r.get("away_team") or "",
+            "home_team":   r.get("home_team") or "",
+            "book":        "kalshi",
+            "market":      "game_winner",
+            "outcome":     r.get("winner_side") or "",
+            "yes_bid":     _to_float(r.get("yes_bid")),
+            "yes_ask":     _to_float(r.get("yes_ask")),
+            "status":      r.get("status"),
+            "snapshot_timestamp": _to_utc(r["snapshot_timestamp"]),
+        })
+    return out
+
+
+def _polymarket_rows(rows: list[dict]) -> list[dict]:
+    out = []
+    for r in rows:
+        if r.get("market_type") != "game_winner" or r.get("game_pk") is None:
+            continue
+        out.append({
+            "source":      "polymarket",
+            "game_pk":     r["game_pk"],
+            "game_date":   _to_date(r["event_date"]),
+            "away_team":   r.get("away_team") or "",
+            "home_team":   r.get("home_team") or "",
+            "book":        "polymarket",
+            "market":      r.get("group_item_title") or "moneyline",
+            "outcome":     "",
+            "price":       _to_float(r.get("yes_price")),
+            "no_price":    _to_float(r.get("no_price")),
+            "accepting_orders": r.get("accepting_orders"),
+            "snapshot_timestamp": _to_utc(r["snapshot_timestamp"]),
+        })
+    return out
+
+
+_NORMALIZERS = {
+    "the_odds_api": _odds_api_rows,
+    "kalshi":       _kalshi_rows,
+    "polymarket":   _polymarket_rows,
+}
+
+
+# ========================= TABLE =========================
+
+
+def _create_table(con: duckdb.DuckDBPyConnection) -> None:
+    cols = []
+    for col, meta in _SPEC["columns"].items():
+        not_null = " NOT NULL" if meta.get("required") else ""
+        cols.append(f'"{col}" {meta["type"]}{not_null}')
+    cols.append(f"PRIMARY KEY ({', '.join(_KEY)})")
+    con.execute(f"CREATE TABLE IF NOT EXISTS {TABLE} (\n    " + ",\n    ".join(cols) + "\n)")
+
+
+def ensure_table(con: duckdb.DuckDBPyConnection) -> dict[str, int] | None:
+    """Create latest_odds from its data_schemas.yaml spec if it doesn't exist.
+
+    A table from before game_pk keys only caches the lake, so it is dropped,
+    recreated and refilled from bronze right here, in one transaction.
+    Returns the per-source key counts of that refill (None otherwise).
+    """
+    existing = {r[0] for r in con.execute(
+        f"SELECT column_name FROM duckdb_columns() WHERE table_name = '{TABLE}'"
+    ).fetchall()}
+    if not existing or "game_pk" in existing:
+        _create_table(con)
+        return None
+    con.begin()
+    try:
+        con.execute(f"DROP TABLE {TABLE}")
+        _create_table(con)
+        counts = _load_lake(con)
+        con.commit()
+    except BaseException:
+        con.rollback()
+        raise
+    print(f"   🔁 {TABLE} re-keyed on game_pk: {sum(counts.values()):,} keys rebuilt from the lake")
+    return counts
+
+
+def _newest_per_key(rows: list[dict]) -> list[dict]:
+    """One row per primary key (ON CONFLICT can't touch a row twice per statement)."""
+    best: dict[tuple, dict] = {}
+    for r in rows:
+        k = tuple(r[c] for c in _KEY)
+        if k not in best or r["snapshot_timestamp"] >= best[k]["snapshot_timestamp"]:
+            best[k] = r
+    return list(best.values())
+
+
+def _upsert(con: duckdb.DuckDBPyConnection, rows: list[dict]) -> int:
+    rows = _newest_per_key(rows)
+    schema = pa.schema([(c, arrow_type(t)) for c, t in _COLUMNS.items()])
+    table = pa.Table.from_pylist(rows, schema=schema)
+
+    cols = ", ".join(f'"{c}"' for c in _COLUMNS)
+    updates = ", ".join(f'"{c}" = excluded."{c}"' for c in _COLUMNS if c not in _KEY)
+    con.register("_latest_new", table)
+    try:
+        con.execute(f"""
+            INSERT INTO {TABLE} ({cols})
+            SELECT {cols} FROM _latest_new
+            ON CONFLICT ({', '.join(_KEY)}) DO UPDATE SET {updates}
+            WHERE excluded.snapshot_timestamp >= {TABLE}.snapshot_timestamp
+        """)
+    finally:
+        con.unregister("_latest_new")
+    return len(rows)
+
+
+def upsert_rows(con: duckdb.DuckDBPyConnection, rows: list[dict]) -> int:
+    """Writer job: upsert normalized rows."""
+    ensure_table(con)
+    return _upsert(con, rows)
+
+
+def upsert_latest_odds(source: str, rows: list[dict]) -> int:
+    """Upsert one scrape's raw fetcher rows. Returns the number of keys written.
+
+    Called by the fetchers after the bronze write. Rows are normalized here
+    and upserted by the single writer (writer.py). A failed upsert raises;
+    the scrape is already in the lake, so --rebuild catches the table up.
+    """
+    normalize = _NORMALIZERS.get(source)
+    if normalize is None or not rows:
+        return 0
+    normalized = normalize(rows)
+    if not normalized:
+        return 0
+    return submit("latest_odds_upsert", normalized)
+
+
+def _load_lake(con: duckdb.DuckDBPyConnection) -> dict[str, int]:
+    """Upsert the newest bronze quote of every key of each source."""
+    counts = {}
+    for source in ODDS_SOURCES:
+        if source not in _NORMALIZERS or not has_odds_files(source):
+            continue
+        keys = ", ".join(f'"{c}"' for c in DELTA_KEYS[source][0])
+        raw = con.execute(f"""
+            SELECT * FROM {read_odds_sql(source)}
+            QUALIFY row_number() OVER (
+                PARTITION BY {keys} ORDER BY snapshot_timestamp DESC
+            ) = 1
+        """).to_arrow_table().to_pylist()
+        unstamped = [r for r in raw if r.get("game_pk") is None]
+        stamp_game_pk(source, unstamped)  # parts written before game_pk existed
+        normalized = _NORMALIZERS[source](raw)
+        counts[source] = _upsert(con, normalized) if normalized else 0
+    return counts
+
+
+def rebuild_rows(con: duckdb.DuckDBPyConnection) -> dict[str, int]:
+    """Writer job: repopulate latest_odds from the full bronze history of each source."""
+    counts = ensure_table(con)
+    return counts if counts is not None else _load_lake(con)
+
+
+def rebuild_latest_odds() -> dict[str, int]:
+    """Repopulate latest_odds from the full bronze history of each source."""
+    return submit("latest_odds_rebuild")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the latest_odds table")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Repopulate from every bronze odds snapshot")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        for source, n in rebuild_latest_odds().items():
+            print(f"   ✅ {source}: {n:,} keys")
+
+    con = get_connection()
+    try:
+        exists = con.execute(
+            f"SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = '{TABLE}'"
+        ).fetchone()[0]
+        if not exists:
+            print(f"⚠️  {TABLE} does not exist yet — run with --rebuild")
+            return
+        for source, n, newest in con.execute(f"""
+            SELECT source, COUNT(*), MAX(snapshot_timestamp)
+            FROM {TABLE} GROUP BY source ORDER BY source
+        """).fetchall():
+            print(f"  {source:<14} {n:>8,} rows   newest {newest}")
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Line-movement store — per-game price time series for every (book, market, outcome).
+
+Studying line movement from bronze means scanning every snapshot file and
+sorting by snapshot_timestamp. This store keeps just the price path, one
+small binary file per game, written incrementally by the fetchers:
+
+    data/gold/line_movement/source=the_odds_api/<game_id>.bin    fixed-width records
+    data/gold/line_movement/source=the_odds_api/<game_id>.json   series dictionary
+
+Each record is (series, ts_ms, price, point, prob) — see RECORD. A series is one
+(book, market, outcome); the JSON maps series ids to those keys. A record is
+only appended when a series' price or point moved, so the file is the movement
+history itself. Readers np.memmap the .bin, so a game loads in well under a
+millisecond without touching the lake.
+
+Records land in arrival order. seal_games() rewrites a finished game's file
+grouped by series (timestamps ascending within each), stores each series'
+offset in the JSON, and from then on every series is a contiguous slice of
+the mapped arrays. Quotes that arrive after sealing are appended as an
+unsorted tail and merged on read. Appending and sealing hold the same
+per-game file lock (.<game_id>.bin.lock), so a scrape can't append between
+the seal's read and its rename and lose quotes; a game is sealed only once
+its last quote is older than the cutoff.
+
+`prob` is the implied probability (American odds converted for sportsbooks,
+the yes price for exchanges), so moves are comparable across sources.
+
+Game keys: The Odds API game_id, Kalshi event_ticker, Polymarket event_id.
+
+Usage:
+    python src/database/line_movement.py the_odds_api <game_id>
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from config.settings import LINE_MOVEMENT_DIR
+
+RECORD = np.dtype([
+    ("series", "<i4"),
+    ("ts",     "<i8"),   # snapshot_timestamp, ms since epoch UTC
+    ("price",  "<f8"),   # as quoted: American odds, or yes price / midpoint
+    ("point",  "<f8"),   # spread/total line, NaN if none
+    ("prob",   "<f8"),   # implied probability
+])
+
+
+# ========================= ROW → QUOTE =========================
+
+
+def _american_to_prob(odds: float) -> float:
+    if odds > 0:
+        return 100.0 / (odds + 100.0)
+    if odds < 0:
+        return -odds / (-odds + 100.0)
+    return 0.5
+
+
+def _odds_api_quote(r: dict):
+    if r.get("odds") is None:
+        return None
+    price = float(r["odds"])
+    return (r["game_id"], (r["bookmaker"], r["market"], r.get("outcome_name") or ""),
+            price, r.get("point"), _american_to_prob(price))
+
+
+def _kalshi_quote(r: dict):
+    if r.get("yes_bid") is None or r.get("yes_ask") is None or not r.get("event_ticker"):
+        return None
+    mid = (float(r["yes_bid"]) + float(r["yes_ask"])) / 2.0
+    outcome = r.get("winner_side") or r.get("team") or r.get("ticker") or ""
+    return (r["event_ticker"], ("kalshi", r.get("market_type") or "", outcome),
+            mid, r.get("win_threshold"), mid)
+
+
+def _polymarket_quote(r: dict):
+    if r.get("yes_price") is None or not r.get("event_id"):
+        return None
+    market = r.get("group_item_title") or r.get("market_type") or ""
+    outcome = r.get("team_name") or r.get("condition_id") or ""
+    price = float(r["yes_price"])
+    return (str(r["event_id"]), ("polymarket", market, outcome),
+            price, r.get("win_threshold"), price)
+
+
+_QUOTES = {
+    "the_odds_api": _odds_api_quote,
+    "kalshi":       _kalshi_quote,
+    "polymarket":   _polymarket_quote,
+}
+
+
+def _ts_ms(value) -> int:
+    ts = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() * 1000)
+
+
+# ========================= FILES =========================
+
+
+def _paths(source: str, game: str) -> tuple[Path, Path]:
+    base = LINE_MOVEMENT_DIR / f"source={source}" / game.replace("/", "_")
+    return base.with_suffix(".bin"), base.with_suffix(".json")
+
+
+def _load_meta(meta_path: Path) -> dict:
+    if not meta_path.exists():
+        return {"series": [], "sealed": None}
+    return json.loads(meta_path.read_text())
+
+
+def _save_meta(meta_path: Path, meta: dict) -> None:
+    tmp = meta_path.with_name(f".{meta_path.name}.tmp")
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, meta_path)
+
+
+@contextmanager
+def _game_lock(bin_path: Path):
+    """Exclusive lock on one game's files, held by every writer of them (released on close)."""
+    with open(bin_path.with_name(f".{bin_path.name}.lock"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _map(bin_path: Path) -> np.ndarray:
+    """Memory-map a game's records (ignores a partially written tail record)."""
+    if not bin_path.exists():
+        return np.empty(0, dtype=RECORD)
+    n = bin_path.stat().st_size // RECORD.itemsize
+    if n == 0:
+        return np.empty(0, dtype=RECORD)
+    return np.memmap(bin_path, dtype=RECORD, mode="r", shape=(n,))
+
+
+def _last_per_series(records: np.ndarray) -> dict[int, tuple[float, float]]:
+    """Latest (price, point) per series id."""
+    if len(records) == 0:
+        return {}
+    order = np.lexsort((records["ts"], records["series"]))
+    s = records["series"][order]
+    last = np.flatnonzero(np.r_[s[1:] != s[:-1], True])
+    rec = records[order][last]
+    return {int(r["series"]): (float(r["price"]), float(r["point"])) for r in rec}
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (np.isnan(a) and np.isnan(b))
+
+
+# ========================= WRITE =========================
+
+
+def append_quotes(source: str, rows: list[dict]) -> int:
+    """Append one scrape's moved prices to the per-game series. Returns records written.
+
+    Called by the fetchers after the bronze write. The series dictionary is
+    saved before the records that reference new ids, so a reader never sees
+    an unknown series.
+    """
+    to_quote = _QUOTES.get(source)
+    if to_quote is None or not rows:
+        return 0
+
+    by_game: dict[str, list] = {}
+    for r in rows:
+        q = to_quote(r)
+        if q is not None:
+            by_game.setdefault(q[0], []).append((q[1], _ts_ms(r["snapshot_timestamp"]), *q[2:]))
+
+    written = 0
+    for game, quotes in by_game.items():
+        bin_path, meta_path = _paths(source, game)
+        bin_path.parent.mkdir(parents=True, exist_ok=True)
+        with _game_lock(bin_path):
+            written += _append_game(bin_path, meta_path, quotes)
+    return written
+
+
+def _append_game(bin_path: Path, meta_path: Path, quotes: list) -> int:
+    """Append one game's moved quotes (caller holds the game's lock). Returns records written."""
+    meta = _load_meta(meta_path)
+    series_ids = {tuple(k): i for i, k in enumerate(meta["series"])}
+    last = _last_per_series(_map(bin_path))
+
+    new_series = False
+    out = []
+    for key, ts, price, point, prob in quotes:
+        point = np.nan if point is None else float(point)
+        sid = series_ids.get(key)
+        if sid is None:
+            sid = series_ids[key] = len(meta["series"])
+            meta["series"].append(list(key))
+            new_series = True
+        prev = last.get(sid)
+        if prev is not None and _same(prev[0], price) and _same(prev[1], point):
+            continue
+        last[sid] = (price, point)
+        out.append((sid, ts, price, point, prob))
+
+    if new_series:
+        _save_meta(meta_path, meta)
+    if out:
+        with open(bin_path, "ab") as f:
+            f.write(np.array(out, dtype=RECORD).tobytes())
+    return len(out)
+
+
+def seal_game(source: str, game: str, cutoff_ms: int | None = None) -> bool:
+    """Rewrite a game's records grouped by series so each series is contiguous.
+
+    Holds the game's lock from the read to the rename, so no appended quote
+    is lost. With cutoff_ms, a game quoted after it is left alone. Returns
+    True if the game was sealed.
+    """
+    bin_path, meta_path = _paths(source, game)
+    if not bin_path.exists():
+        return False
+    with _game_lock(bin_path):
+        records = np.array(_map(bin_path))
+        if len(records) == 0:
+            return False
+        if cutoff_ms is not None and int(records["ts"].max()) > cutoff_ms:
+            return False
+        records = records[np.lexsort((records["ts"], records["series"]))]
+        meta = _load_meta(meta_path)
+        starts = np.searchsorted(records["series"], np.arange(len(meta["series"]) + 1))
+
+        tmp = bin_path.with_name(f".{bin_path.name}.tmp")
+        tmp.write_bytes(records.tobytes())
+        os.replace(tmp, bin_path)
+        meta["sealed"] = {"records": int(len(records)), "offsets": starts.tolist()}
+        _save_meta(meta_path, meta)
+    return True
+
+
+def seal_games(older_than_days: int = 2) -> int:
+    """Seal every unsealed game whose last quote is older than the cutoff."""
+    cutoff = int((datetime.now(timezone.utc) - timedelta(days=older_than_days)).timestamp() * 1000)
+    sealed = 0
+    for meta_path in LINE_MOVEMENT_DIR.glob("source=*/*.json"):
+        meta = _load_meta(meta_path)
+        records = _map(meta_path.with_suffix(".bin"))
+        if len(records) == 0:
+            continue
+        if meta.get("sealed") and meta["sealed"]["records"] == len(records):
+            continue
+        if int(records["ts"].max()) > cutoff:
+            continue
+        # Re-checked under the game's lock: a quote may have landed since
+        sealed += seal_game(meta_path.parent.name.split("=", 1)[1], meta_path.stem, cutoff)
+    return sealed
+
+
+# ========================= READ =========================
+
+
+def history(source: str, game: str) -> dict[tuple[str, str, str], np.ndarray]:
+    """Movement history per (book, market, outcome): records with ts ascending.
+
+    Sealed games return zero-copy slices of the memory-mapped file.
+    """
+    bin_path, meta_path = _paths(source, game)
+    meta = _load_meta(meta_path)
+    records = _map(bin_path)
+    keys = [tuple(k) for k in meta["series"]]
+    if len(records) == 0:
+        return {}
+
+    sealed = meta.get("sealed")
+    if sealed and sealed["records"] <= len(records):
+        n, offsets = sealed["records"], sealed["offsets"]
+        head, tail = records[:n], records[n:]
+        out = {}
+        for sid, key in enumerate(keys):
+            lo, hi = (offsets[sid], offsets[sid + 1]) if sid + 1 < len(offsets) else (n, n)
+            part = head[lo:hi]
+            if len(tail):
+                part = np.concatenate([part, tail[tail["series"] == sid]])
+            if len(part):
+                out[key] = part
+        return out
+
+    grouped = records[np.lexsort((records["ts"], records["series"]))]
+    starts = np.searchsorted(grouped["series"], np.arange(len(keys) + 1))
+    return {key: grouped[starts[sid]:starts[sid + 1]]
+            for sid, key in enumerate(keys) if starts[sid + 1] > starts[sid]}
+
+
+def _as_dict(rec) -> dict:
+    return {
+        "timestamp": datetime.fromtimestamp(int(rec["ts"]) / 1000, tz=timezone.utc),
+        "price": float(rec["price"]),
+        "point": None if np.isnan(rec["point"]) else float(rec["point"]),
+        "prob": float(rec["prob"]),
+    }
+
+
+def opening_lines(source: str, game: str) -> dict[tuple, dict]:
+    """First quote per (book, market, outcome)."""
+    return {k: _as_dict(v[0]) for k, v in history(source, game).items()}
+
+
+def closing_lines(source: str, game: str, first_pitch: datetime | None = None) -> dict[tuple, dict]:
+    """Last quote per (book, market, outcome), at or before first_pitch if given."""
+    cutoff = None if first_pitch is None else _ts_ms(first_pitch)
+    out = {}
+    for k, v in history(source, game).items():
+        if cutoff is not None:
+            v = v[v["ts"] <= cutoff]
+        if len(v):
+            out[k] = _as_dict(v[-1])
+    return out
+
+
+def largest_moves(source: str, game: str) -> dict[tuple, dict]:
+    """Biggest single step in implied probability per (book, market, outcome)."""
+    out = {}
+    for k, v in history(source, game).items():
+        if len(v) < 2:
+            continue
+        steps = np.diff(v["prob"])
+        i = int(np.argmax(np.abs(steps)))
+        out[k] = {"from": _as_dict(v[i]), "to": _as_dict(v[i + 1]), "prob_change": float(steps[i])}
+    return out
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        return
+    source, game = sys.argv[1], sys.argv[2]
+    series = history(source, game)
+    if not series:
+        print(f"⚠️  No line movement stored for {source} {game}")
+        return
+    opens, closes, moves = opening_lines(source, game), closing_lines(source, game), largest_moves(source, game)
+    print(f"\n{'Book':<14} {'Market':<12} {'Outcome':<24} {'Qts':>4} {'Open':>8} {'Close':>8} {'Max Δprob':>10}")
+    print("-" * 86)
+    for key in sorted(series):
+        book, market, outcome = key
+        move = moves.get(key)
+        move_str = f"{move['prob_change']:+.3f}" if move else "-"
+        print(f"{book:<14} {market:<12} {outcome[:24]:<24} {len(series[key]):>4} "
+              f"{opens[key]['price']:>8.3g} {closes[key]['price']:>8.3g} {move_str:>10}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
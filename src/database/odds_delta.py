@@ -0,0 +1,113 @@
+"""
+Delta encoding for odds snapshots (ODDS_INGEST_MODE=delta).
+
+Most outcome rows do not move between two polls ten minutes apart. In delta
+mode each fetcher's rows pass through an OddsDeltaTracker, which remembers the
+last row written per price key and only lets through:
+
+  - rows whose tracked values changed                    delta_op = 'set'
+  - the first row per key each UTC day (daily keyframe)  delta_op = 'set'
+  - keys that vanished since the previous poll           delta_op = 'removed'
+
+Removal rows are a copy of the key's last row, stamped with the new snapshot.
+The keyframe makes every (source, snapshot_date) partition self-contained: the
+latest 'set' row per key within a day is exactly what a full snapshot would
+have shown last that day, so the edge-detection loaders work unchanged, and
+lake.odds_asof_sql() rebuilds a full snapshot at any timestamp by reading two
+days of partitions.
+
+Tracker state lives in memory for the life of the process and is checkpointed
+to data/bronze/odds_delta/_checkpoints/STREAM.parquet after every write, so a
+restarted scraper picks up where it stopped instead of re-emitting everything.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import pyarrow.parquet as pq
+
+from config.settings import BRONZE_ODDS_DELTA_DIR
+from src.database.parquet_writer import write_rows
+
+CHECKPOINT_DIR = BRONZE_ODDS_DELTA_DIR / "_checkpoints"
+
+# source → (key columns, tracked value columns)
+DELTA_KEYS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "the_odds_api": (("game_id", "bookmaker", "market", "outcome_name", "point"), ("odds", "point")),
+    "kalshi":       (("ticker",), ("yes_bid", "yes_ask", "status")),
+    "polymarket":   (("condition_id",), ("yes_price",)),
+}
+
+
+class OddsDeltaTracker:
+    """Last-seen row per price key for one stream of scrapes.
+
+    A stream is one independent poll loop (e.g. The Odds API per sport_key):
+    a key missing from a poll is only treated as removed within its own stream.
+    """
+
+    def __init__(self, source: str, stream: str):
+        self.source = source
+        self.stream = stream
+        self.key_cols, self.value_cols = DELTA_KEYS[source]
+        self.checkpoint_path = CHECKPOINT_DIR / f"{stream}.parquet"
+        self.last: dict[tuple, dict] = {}
+        self._pending: dict[tuple, dict] | None = None
+        if self.checkpoint_path.exists():
+            for row in pq.read_table(self.checkpoint_path).to_pylist():
+                self.last[self._key(row)] = row
+
+    def _key(self, row: dict) -> tuple:
+        return tuple(row.get(c) for c in self.key_cols)
+
+    def _changed(self, prev: dict, row: dict) -> bool:
+        if str(prev.get("snapshot_date")) != str(row.get("snapshot_date")):
+            return True  # daily keyframe
+        return any(prev.get(c) != row.get(c) for c in self.value_cols)
+
+    def diff(self, rows: list[dict]) -> list[dict]:
+        """Rows to write for this poll. Does not update state — call commit()
+        once the rows are safely on disk."""
+        if not rows:
+            return []
+        snapshot = {"snapshot_timestamp": rows[0]["snapshot_timestamp"],
+                    "snapshot_date": rows[0]["snapshot_date"]}
+
+        current: dict[tuple, dict] = {}
+        out = []
+        for row in rows:
+            key = self._key(row)
+            current[key] = row
+            prev = self.last.get(key)
+            if prev is None or self._changed(prev, row):
+                out.append({**row, "delta_op": "set"})
+
+        for key, prev in self.last.items():
+            if key not in current:
+                out.append({**prev, **snapshot, "delta_op": "removed"})
+
+        self._pending = current
+        return out
+
+    def commit(self) -> None:
+        """Adopt the last diff()'s poll as current state and checkpoint it."""
+        if self._pending is None:
+            return
+        self.last, self._pending = self._pending, None
+        rows = [{k: v for k, v in r.items() if k != "delta_op"} for r in self.last.values()]
+        if rows:
+            write_rows(rows, self.checkpoint_path, f"odds_{self.source}")
+        elif self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+
+
+_trackers: dict[str, OddsDeltaTracker] = {}
+
+
+def get_tracker(source: str, stream: str | None = None) -> OddsDeltaTracker:
+    """Process-wide tracker for a stream (defaults to one stream per source)."""
+    stream = stream or source
+    if stream not in _trackers:
+        _trackers[stream] = OddsDeltaTracker(source, stream)
+    return _trackers[stream]
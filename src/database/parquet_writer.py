@@ -0,0 +1,226 @@
+"""
+Arrow-native Parquet writer shared by every lake writer.
+
+Rows (list of dicts) go straight into a pyarrow.Table and out to Parquet — no
+JSON tempfile, no read_json_auto type inference on every write. Column types
+come from the `lake_datasets` section of config/data_schemas.yaml; columns a
+dataset does not declare (dynamic API fields, BR stat columns) are inferred by
+Arrow from the Python values.
+
+Usage:
+    from src.database.parquet_writer import rows_to_table, write_rows
+
+    write_rows(rows, target_path, "simulation_results")
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import json
+import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import date, datetime, timezone
+
+from config.settings import DATA_SCHEMAS
+
+# DuckDB type names used in data_schemas.yaml → Arrow types
+_ARROW_TYPES: dict[str, pa.DataType] = {
+    "VARCHAR":       pa.string(),
+    "DOUBLE":        pa.float64(),
+    "BIGINT":        pa.int64(),
+    "INTEGER":       pa.int32(),
+    "BOOLEAN":       pa.bool_(),
+    "DATE":          pa.date32(),
+    "TIMESTAMP":     pa.timestamp("us"),
+    "TIMESTAMPTZ":   pa.timestamp("us", tz="UTC"),
+    "LIST(VARCHAR)": pa.list_(pa.string()),
+}
+
+
+def arrow_type(duck_type: str) -> pa.DataType:
+    """Arrow type for a DuckDB type name used in data_schemas.yaml."""
+    return _ARROW_TYPES[duck_type]
+
+
+def dataset_columns(dataset: str) -> dict[str, str]:
+    """Declared {column: duckdb_type} for a lake dataset (empty if undeclared)."""
+    return {col: meta["type"] for col, meta in (_spec(dataset).get("columns") or {}).items()}
+
+
+def _spec(dataset: str | None) -> dict:
+    if not dataset:
+        return {}
+    return DATA_SCHEMAS.get("lake_datasets", {}).get(dataset) or {}
+
+
+def dataset_sort_keys(dataset: str) -> list[str]:
+    """Declared sort_by columns for a lake dataset (empty if none)."""
+    return list(_spec(dataset).get("sort_by") or [])
+
+
+def dataset_row_group_rows(dataset: str) -> int | None:
+    """Declared rows per row group for a lake dataset (None = writer default)."""
+    return _spec(dataset).get("row_group_rows")
+
+
+def dataset_bloom_columns(dataset: str) -> list[str]:
+    """Columns that get a Parquet bloom filter for a lake dataset."""
+    return list(_spec(dataset).get("bloom_filter") or [])
+
+
+def arrow_schema(dataset: str) -> pa.Schema:
+    """Arrow schema of a dataset's declared columns."""
+    return pa.schema([(col, _ARROW_TYPES[t]) for col, t in dataset_columns(dataset).items()])
+
+
+# ========================= VALUE COERCION =========================
+
+
+def _coerce(value, duck_type: str):
+    """Convert one Python value to the declared type. Returns None if it can't
+    be converted (TRY_CAST semantics)."""
+    if value is None:
+        return None
+    if duck_type == "VARCHAR":
+        return value if isinstance(value, str) else str(value)
+    if value == "":
+        return None
+    try:
+        if duck_type == "DOUBLE":
+            return float(value)
+        if duck_type in ("BIGINT", "INTEGER"):
+            return int(value)
+        if duck_type == "BOOLEAN":
+            if isinstance(value, str):
+                return value.strip().lower() in ("true", "t", "1", "yes")
+            return bool(value)
+        if duck_type == "DATE":
+            if isinstance(value, datetime):
+                return value.date()
+            if isinstance(value, date):
+                return value
+            return date.fromisoformat(str(value)[:10])
+        if duck_type in ("TIMESTAMP", "TIMESTAMPTZ"):
+            ts = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            ts = ts.astimezone(timezone.utc)
+            return ts if duck_type == "TIMESTAMPTZ" else ts.replace(tzinfo=None)
+        if duck_type == "LIST(VARCHAR)":
+            return [None if v is None else str(v) for v in value]
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return value
+
+
+def _typed_array(values: list, duck_type: str) -> pa.Array:
+    """Build an Arrow array of the declared type, converting in C when possible."""
+    target = _ARROW_TYPES[duck_type]
+    try:
+        return pa.array(values, type=target)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        pass
+    # Slow path — strings that need parsing (timestamps, dates, numeric text).
+    # Scrapes repeat the same snapshot_timestamp on every row, so memoize.
+    memo: dict = {}
+    out = []
+    for v in values:
+        if isinstance(v, str):
+            if v not in memo:
+                memo[v] = _coerce(v, duck_type)
+            out.append(memo[v])
+        else:
+            out.append(_coerce(v, duck_type))
+    return pa.array(out, type=target)
+
+
+def _inferred_array(values: list) -> pa.Array:
+    """Arrow-inferred array for an undeclared column.
+
+    Mixed or unconvertible values (e.g. nested API payloads that change shape)
+    are stored as JSON text rather than failing the write.
+    """
+    try:
+        arr = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        arr = pa.array(
+            [v if v is None or isinstance(v, str) else json.dumps(v, default=str) for v in values],
+            type=pa.string(),
+        )
+    if pa.types.is_null(arr.type):
+        arr = arr.cast(pa.string())
+    return arr
+
+
+# ========================= TABLE BUILD + WRITE =========================
+
+
+def rows_to_table(rows: list[dict], dataset: str | None = None,
+                  exclude: tuple[str, ...] = ()) -> pa.Table:
+    """Build a pyarrow.Table from row dicts.
+
+    Columns appear in first-seen order across all rows (rows may carry
+    different keys). Declared columns of `dataset` get their declared type.
+    """
+    declared = dataset_columns(dataset) if dataset else {}
+
+    columns: dict[str, None] = {}
+    for r in rows:
+        for k in r:
+            if k not in columns and k not in exclude:
+                columns[k] = None
+
+    arrays, names = [], []
+    for col in columns:
+        values = [r.get(col) for r in rows]
+        if col in declared:
+            arrays.append(_typed_array(values, declared[col]))
+        else:
+            arrays.append(_inferred_array(values))
+        names.append(col)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def write_table(table: pa.Table, target: Path, dataset: str | None = None) -> None:
+    """Write a table to Parquet (ZSTD) atomically: temp file, then rename.
+
+    With a dataset, rows are sorted by its sort_by keys, row groups get its
+    row_group_rows, and its bloom_filter columns get bloom filters. Sorting is
+    what makes the row-group min/max statistics selective: a filter on the
+    leading sort key only touches the row groups that hold that value.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    kwargs = {}
+    sort_keys = [c for c in dataset_sort_keys(dataset) if c in table.column_names] if dataset else []
+    if sort_keys:
+        table = table.sort_by([(c, "ascending") for c in sort_keys])
+        kwargs["sorting_columns"] = [pq.SortingColumn(table.column_names.index(c)) for c in sort_keys]
+    if dataset and dataset_row_group_rows(dataset):
+        kwargs["row_group_size"] = dataset_row_group_rows(dataset)
+    bloom = [c for c in dataset_bloom_columns(dataset) if c in table.column_names] if dataset else []
+    if bloom:
+        ndv = max(table.num_rows, 1)
+        kwargs["bloom_filter_options"] = {c: {"ndv": ndv, "fpp": 0.05} for c in bloom}
+
+    tmp = target.with_name(f".{target.name}.tmp")
+    try:
+        try:
+            pq.write_table(table, tmp, compression="zstd", **kwargs)
+        except TypeError:
+            # Older pyarrow has no bloom_filter_options; sorting and stats still apply
+            kwargs.pop("bloom_filter_options", None)
+            pq.write_table(table, tmp, compression="zstd", **kwargs)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_rows(rows: list[dict], target: Path, dataset: str | None = None,
+               exclude: tuple[str, ...] = ()) -> int:
+    """rows_to_table + write_table. Returns the number of rows written."""
+    table = rows_to_table(rows, dataset, exclude)
+    write_table(table, target, dataset)
+    return table.num_rows
@@ -0,0 +1,221 @@
+"""
+Named, prepared queries for the reads the pipeline repeats.
+
+Every query here is a fixed SQL text with $named parameters. It is prepared
+(PREPARE) once per connection and run with EXECUTE, so DuckDB parses, binds
+and plans it once per connection and reuses that plan for every date in a
+backtest. Values never go through ad-hoc string formatting in the callers.
+Each parameter has a declared type and is rendered as a typed SQL literal
+(DATE '...', a quoted and escaped string, a list, ...). DuckDB's EXECUTE
+accepts only literals, not bound ? placeholders.
+
+Connections are kept per thread (and re-created after a fork):
+  * lake queries (files via read_parquet) run on a cursor() of the shared
+    in-memory database (db_manager);
+  * database queries (latest_odds) run on the current published version of
+    mlb_betting.duckdb, reopened when a newer version is published (writer.py).
+
+Usage:
+    from src.database import queries
+    games = queries.lineups_for_date(SILVER_LINEUPS_DIR / "lineups_2026.parquet", "2026-04-01")
+    rows = queries.market_probs("2026-04-01", [746125, 746126])
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import os
+import threading
+from datetime import date, datetime
+
+import duckdb
+
+from src.database.db_manager import cursor, published_db
+
+# ========================= QUERIES =========================
+
+# One row per (game_pk, book) with both sides' implied probability, per source.
+# latest_odds holds only the newest quote per game/book/outcome (upserted by
+# the fetchers), so these are key lookups rather than windows over snapshots.
+MARKET_SQL = {
+    # American odds → probability; outcome_name is the team's full name
+    "the_odds_api": """
+        SELECT game_pk, book,
+               max(p) FILTER (WHERE outcome = away_team) AS away_prob,
+               max(p) FILTER (WHERE outcome = home_team) AS home_prob
+        FROM (SELECT *, CASE WHEN price > 0 THEN 100.0 / (price + 100.0)
+                             WHEN price < 0 THEN -price / (-price + 100.0)
+                             ELSE 0.5 END AS p
+              FROM latest_odds
+              WHERE source = 'the_odds_api' AND game_date = $game_date AND market = 'h2h')
+        GROUP BY game_pk, book
+    """,
+    # yes_bid/yes_ask midpoint; one market per side (winner_side = team code)
+    "kalshi": """
+        SELECT game_pk, 'kalshi' AS book,
+               max(p) FILTER (WHERE outcome = away_team) AS away_prob,
+               max(p) FILTER (WHERE outcome = home_team) AS home_prob
+        FROM (SELECT *, (yes_bid + yes_ask) / 2.0 AS p
+              FROM latest_odds
+              WHERE source = 'kalshi' AND game_date = $game_date AND market = 'game_winner'
+                AND status = 'active'
+                AND (yes_ask - yes_bid) < 0.40)
+        WHERE p BETWEEN 0.10 AND 0.90
+        GROUP BY game_pk
+    """,
+    # yes_price = outcomePrices[0] = away team, no_price = outcomePrices[1] = home team
+    "polymarket": """
+        SELECT game_pk, 'polymarket' AS book,
+               any_value(nullif(price, 0)) AS away_prob,
+               any_value(nullif(no_price, 0)) AS home_prob
+        FROM latest_odds
+        WHERE source = 'polymarket' AND game_date = $game_date AND market = 'moneyline'
+          AND accepting_orders = TRUE
+          AND price > 0.05 AND price < 0.95
+        GROUP BY game_pk
+    """,
+}
+
+# name → (SQL with $params, {param: type}). Lake queries take the file(s) as $path.
+LAKE_QUERIES = {
+    "lineups_for_date": ("""
+        SELECT * FROM read_parquet($path)
+        WHERE game_date = $game_date
+    """, {"path": str, "game_date": date}),
+    "sim_results_for_date": ("""
+        SELECT * FROM read_parquet($path)
+        WHERE game_date = $game_date
+    """, {"path": str, "game_date": date}),
+    "schedule_game_dates": ("""
+        SELECT DISTINCT game_date::DATE AS gd
+        FROM read_parquet($path)
+        WHERE game_type = 'R'
+          AND ($after_date IS NULL OR game_date::DATE > $after_date)
+          AND game_date::DATE <= $through_date
+        ORDER BY gd
+    """, {"path": str, "after_date": date, "through_date": date}),
+}
+
+DB_QUERIES = {
+    "market_probs": ("SELECT m.source, m.game_pk, m.book, m.away_prob, m.home_prob FROM ("
+                     + " UNION ALL ".join(f"SELECT '{source}' AS source, * FROM ({sql})"
+                                          for source, sql in MARKET_SQL.items())
+                     + ") m WHERE m.game_pk IN (SELECT unnest($game_pks))",
+                     {"game_date": date, "game_pks": list}),
+}
+
+
+# ========================= PREPARED STATEMENTS =========================
+
+
+def _literal(value, kind: type) -> str:
+    """SQL literal of a parameter value of the declared type."""
+    if value is None:
+        return "NULL"
+    if kind is list:
+        return "[" + ", ".join(_literal(v, type(v)) for v in value) + "]"
+    if kind is date and not isinstance(value, date):
+        value = date.fromisoformat(str(value)[:10])
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return f"CAST('{value!r}' AS DOUBLE)"
+    if isinstance(value, datetime):
+        return f"TIMESTAMPTZ '{value.isoformat()}'"
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, (str, Path)):
+        return "'" + str(value).replace("'", "''") + "'"
+    raise TypeError(f"Unsupported query parameter: {value!r}")
+
+
+class Queries:
+    """Named queries on one connection, each prepared on first use."""
+
+    def __init__(self, con: duckdb.DuckDBPyConnection, queries: dict):
+        self.con = con
+        self._queries = queries
+        self._prepared: set[str] = set()
+
+    def execute(self, name: str, **params) -> duckdb.DuckDBPyConnection:
+        sql, types = self._queries[name]
+        if params.keys() != types.keys():
+            raise TypeError(f"{name}() takes {sorted(types)}, got {sorted(params)}")
+        if name not in self._prepared:
+            self.con.execute(f"PREPARE {name} AS {sql}")
+            self._prepared.add(name)
+        args = ", ".join(f"{p} := {_literal(params[p], kind)}" for p, kind in types.items())
+        return self.con.execute(f"EXECUTE {name}({args})")
+
+    def fetch_dicts(self, name: str, **params) -> list[dict]:
+        result = self.execute(name, **params)
+        rows = result.fetchall()
+        cols = [d[0] for d in result.description]
+        return [dict(zip(cols, row)) for row in rows]
+
+    def close(self) -> None:
+        self.con.close()
+
+
+_local = threading.local()
+
+
+def _lake() -> Queries:
+    """This thread's lake queries, on a cursor of the shared in-memory database."""
+    q = getattr(_local, "lake", None)
+    if q is None or _local.lake_pid != os.getpid():
+        _local.lake = q = Queries(cursor(), LAKE_QUERIES)
+        _local.lake_pid = os.getpid()
+    return q
+
+
+def _published() -> Queries | None:
+    """This thread's database queries, on the current published version (None if there is none)."""
+    db = published_db()
+    if db is None:
+        return None
+    q = getattr(_local, "db", None)
+    if q is None or _local.db_key != (db, os.getpid()):
+        if q is not None:
+            q.close()
+        _local.db = q = Queries(duckdb.connect(str(db), read_only=True), DB_QUERIES)
+        _local.db_key = (db, os.getpid())
+    return q
+
+
+# ========================= READS =========================
+
+
+def lineups_for_date(path: Path, game_date: str | date) -> list[dict]:
+    """Silver lineup rows of one date."""
+    return _lake().fetch_dicts("lineups_for_date", path=path, game_date=game_date)
+
+
+def sim_results_for_date(path: Path, game_date: str | date) -> list[dict]:
+    """Rows of one date from a simulation results file."""
+    return _lake().fetch_dicts("sim_results_for_date", path=path, game_date=game_date)
+
+
+def schedule_game_dates(path: Path, through_date: str | date,
+                        after_date: str | date | None = None) -> list[date]:
+    """Regular-season game dates in (after_date, through_date]."""
+    rows = _lake().execute("schedule_game_dates", path=path, after_date=after_date,
+                           through_date=through_date).fetchall()
+    return [r[0] for r in rows]
+
+
+def market_probs(game_date: str | date, game_pks: list[int]) -> list[tuple] | None:
+    """(source, game_pk, book, away_prob, home_prob) from latest_odds for the given games.
+
+    Returns None if the published version has no latest_odds table (nothing
+    published yet, or the table was never built).
+    """
+    q = _published()
+    if q is None or not q.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'latest_odds'").fetchone()[0]:
+        return None
+    return q.execute("market_probs", game_date=game_date,
+                     game_pks=[int(pk) for pk in game_pks if pk is not None]).fetchall()
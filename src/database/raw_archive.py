@@ -0,0 +1,109 @@
+"""
+Raw response archive — every HTTP payload the fetchers parse, kept verbatim.
+
+Bronze only holds the flattened rows, so a fix to a parser (_normalize_response,
+_market_to_row, _build_game_rows, ...) can't be applied to past scrapes. The
+fetchers therefore also archive the response body they parsed:
+
+    data/raw/archive/blobs/3f/3f9a1c...e2.json.zst            zstd, named by sha256 of the body
+    data/raw/archive/index/source=kalshi/2026-04-10.jsonl     one line per archived response
+
+Blobs are content-addressed, so an unchanged response (win-total pages, a
+quiet board) is stored once however often it is fetched. Each index line
+records the scrape's snapshot_timestamp, the blob hash and the request
+parameters the parser needs (sport_key, series_ticker, page, ...). All
+responses of one scrape share its snapshot_timestamp, which is also the
+snapshot_timestamp of the bronze rows parsed from them.
+
+Archiving never fails a scrape: an I/O error is reported and the scrape
+continues.
+
+Re-parse the archive into bronze with src/scripts/reparse_archive.py.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import hashlib
+import json
+import os
+import uuid
+
+import pyarrow as pa
+
+from config.settings import RAW_ARCHIVE_DIR
+
+BLOBS_DIR = RAW_ARCHIVE_DIR / "blobs"
+INDEX_DIR = RAW_ARCHIVE_DIR / "index"
+
+
+def _blob_path(sha: str, ext: str) -> Path:
+    return BLOBS_DIR / sha[:2] / f"{sha}.{ext}.zst"
+
+
+def _index_path(source: str, snapshot_date: str) -> Path:
+    return INDEX_DIR / f"source={source}" / f"{snapshot_date}.jsonl"
+
+
+def archive_response(source: str, body: bytes, snapshot_ts: str, params: dict | None = None,
+                     ext: str = "json") -> str | None:
+    """Store one response body and index it under its scrape. Returns the sha256.
+
+    params are whatever the parser needs besides the body (kept in the index).
+    """
+    try:
+        sha = hashlib.sha256(body).hexdigest()
+        blob = _blob_path(sha, ext)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f".{blob.name}.{uuid.uuid4().hex[:8]}.tmp")
+            with pa.CompressedOutputStream(str(tmp), "zstd") as out:
+                out.write(body)
+            os.replace(tmp, blob)
+
+        entry = {"snapshot_timestamp": snapshot_ts, "sha256": sha, "ext": ext,
+                 "bytes": len(body), "params": params or {}}
+        index = _index_path(source, snapshot_ts[:10])
+        index.parent.mkdir(parents=True, exist_ok=True)
+        # One short line per O_APPEND write, so concurrent fetchers don't interleave
+        with open(index, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        return sha
+    except OSError as e:
+        print(f"   ⚠️  raw response not archived for {source}: {e}")
+        return None
+
+
+def read_blob(sha: str, ext: str = "json") -> bytes:
+    """Decompressed body of an archived response."""
+    with pa.input_stream(str(_blob_path(sha, ext)), compression="zstd") as f:
+        return f.read()
+
+
+def archived_sources() -> list[str]:
+    return sorted(p.name.split("=", 1)[1] for p in INDEX_DIR.glob("source=*") if p.is_dir())
+
+
+def archived_dates(source: str) -> list[str]:
+    """snapshot_dates with at least one archived response for the source."""
+    return sorted(p.stem for p in (INDEX_DIR / f"source={source}").glob("*.jsonl"))
+
+
+def read_index(source: str, snapshot_date: str) -> dict[str, list[dict]]:
+    """Index entries of one day, grouped by scrape (snapshot_timestamp), in fetch order.
+
+    A truncated last line (process killed mid-write) is skipped.
+    """
+    path = _index_path(source, snapshot_date)
+    scrapes: dict[str, list[dict]] = {}
+    if not path.exists():
+        return scrapes
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            scrapes.setdefault(entry["snapshot_timestamp"], []).append(entry)
+    return scrapes
@@ -0,0 +1,402 @@
+"""
+Write coordinator — one writer for mlb_betting.duckdb, many readers.
+
+DuckDB lets a single process open a database file read-write, and while it
+does, no other process can open the file at all. The scraper bot, notebooks
+and scripts used to open data/db/mlb_betting.duckdb directly, so whoever came
+second got a lock error. Instead:
+
+  * Every change to the database is a named job (JOBS below) run by the one
+    writer, on the only read-write connection. The scraper bot hosts it
+    (start_writer()); its own jobs go through an in-process queue, and other
+    processes send theirs over a local Unix socket (data/db/writer.sock).
+    With no writer running, submit() runs the job in-process under an
+    exclusive file lock, so two scripts queue up instead of failing.
+  * After each batch of queued jobs the writer publishes a version. It
+    refreshes the views (pinned to the live Parquet files, see db_manager),
+    checkpoints, and copies the database to
+    data/db/versions/mlb_betting.vNNNNNN.duckdb. It writes a manifest of the
+    Parquet files that version's views read, then swaps
+    data/db/versions/CURRENT.json to point at the new version (temp file +
+    os.replace, atomic). A publish with no job changes and no view changes
+    copies nothing (it only collects garbage).
+  * The per-scrape latest_odds upserts (COALESCED_JOBS) don't publish one
+    by one. Their submitters get the result once the change is committed,
+    and the writer publishes them together at most
+    DB_PUBLISH_INTERVAL_SECONDS later, so a scrape cycle costs one database
+    copy per interval rather than one per fetcher. Any other job is answered
+    only after its change is published, and a failed publish is raised to
+    its submitter.
+  * Readers (db_manager.get_connection()) open the CURRENT
+    version read-only. It's a different file from the writer's, so readers
+    never block the writer, never see a half-applied batch and never retry.
+    A connection reads one version for its whole life; open a new one to see
+    newer data.
+  * Nothing a retained version reads is deleted. A version is kept for
+    LAKE_GRACE_SECONDS after a newer one replaces it. Part files superseded by
+    compaction (or hidden by a tombstone) are deleted at publish time, once
+    no retained version's manifest lists them.
+
+Usage:
+    from src.database.writer import submit
+    submit("publish")                       # publish the lake's current files
+
+    python src/database/writer.py           # run a standalone writer
+    python src/database/writer.py --status  # current version, retained versions
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import argparse
+import fcntl
+import importlib
+import json
+import os
+import queue
+import secrets
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from multiprocessing.connection import Client, Listener
+
+import duckdb
+
+from config.settings import (DB_PATH, DB_PUBLISH_INTERVAL_SECONDS, DB_VERSIONS_DIR, DB_WRITER_SOCKET,
+                             LAKE_GRACE_SECONDS)
+from src.database.db_manager import pinned_files, refresh_lake, writer_connection
+from src.database.lake import (COMPACTED_PREFIX, TOMBSTONE_PREFIX, compacted_from, partition_dirs,
+                               superseded_files)
+
+# Job name → "module:function". The function gets the writer's connection first.
+JOBS = {
+    "publish":              None,  # nothing to run: publish the lake as it is
+    "latest_odds_upsert":   "src.database.latest_odds:upsert_rows",
+    "latest_odds_rebuild":  "src.database.latest_odds:rebuild_rows",
+    "append_to_table":      "src.database.db_manager:append_batches",
+    "refresh_materialized": "src.database.db_manager:refresh_materialized",
+}
+
+# Jobs answered as soon as they commit; the writer publishes them on a timer
+COALESCED_JOBS = {"latest_odds_upsert"}
+
+CURRENT = DB_VERSIONS_DIR / "CURRENT.json"
+_LOCK_PATH = DB_PATH.parent / "writer.lock"
+_KEY_PATH = DB_PATH.parent / "writer.key"
+
+_writer: "Writer | None" = None
+
+
+# ========================= JOBS + PUBLISH =========================
+
+
+def _run_job(con: duckdb.DuckDBPyConnection, job: str, args: tuple):
+    target = JOBS[job]
+    if target is None:
+        return None
+    module, func = target.split(":")
+    return getattr(importlib.import_module(module), func)(con, *args)
+
+
+def _write_json(path: Path, obj: dict) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(obj), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _manifests() -> list[dict]:
+    out = []
+    for path in sorted(DB_VERSIONS_DIR.glob("v*.json")):
+        try:
+            out.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return out
+
+
+def publish(con: duckdb.DuckDBPyConnection, changed: bool = True) -> int:
+    """Publish the working database as a new read-only version. Returns its number.
+
+    changed=False: no job has changed the database since the last publish,
+    so a new version is written only if the lake views changed (or nothing
+    is published yet); otherwise the current version number is returned.
+    """
+    lake_changed = refresh_lake(con)
+    manifests = _manifests()
+    if manifests and not changed and not lake_changed:
+        _collect_garbage()
+        return manifests[-1]["version"]
+
+    files = pinned_files(con)
+    con.execute("CHECKPOINT")
+
+    DB_VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
+    version = manifests[-1]["version"] + 1 if manifests else 1
+    database = f"mlb_betting.v{version:06d}.duckdb"
+    tmp = DB_VERSIONS_DIR / f".{database}.tmp"
+    shutil.copyfile(DB_PATH, tmp)  # checkpointed, and only this thread writes
+    os.replace(tmp, DB_VERSIONS_DIR / database)
+
+    entry = {"version": version, "database": database,
+             "published_at": datetime.now(timezone.utc).isoformat()}
+    _write_json(DB_VERSIONS_DIR / f"v{version:06d}.json", {**entry, "files": files})
+    _write_json(CURRENT, entry)
+    _collect_garbage()
+    return version
+
+
+def _collect_garbage() -> None:
+    """Drop versions replaced more than LAKE_GRACE_SECONDS ago, then superseded
+    part files that no remaining version reads."""
+    now = datetime.now(timezone.utc)
+    manifests = _manifests()
+    retained = []
+    for m, successor in zip(manifests, manifests[1:] + [None]):
+        if successor is None or (
+                now - datetime.fromisoformat(successor["published_at"])
+        ).total_seconds() < LAKE_GRACE_SECONDS:
+            retained.append(m)
+            continue
+        (DB_VERSIONS_DIR / m["database"]).unlink(missing_ok=True)
+        (DB_VERSIONS_DIR / f"v{m['version']:06d}.json").unlink(missing_ok=True)
+
+    referenced = {f for m in retained for f in m["files"]}
+    for part_dir in partition_dirs():
+        doomed = {n for n in superseded_files(part_dir)
+                  if str(part_dir / n) not in referenced and (part_dir / n).exists()}
+        # Plain parts first; a compacted file only once every file it
+        # replaced is gone, or those would become live again
+        for name in sorted(doomed, key=lambda n: n.startswith(COMPACTED_PREFIX)):
+            path = part_dir / name
+            if name.startswith(COMPACTED_PREFIX) and any(
+                    (part_dir / n).exists() for n in compacted_from(path)):
+                continue
+            path.unlink(missing_ok=True)
+
+        # A tombstone hides nothing once the files it replaced are gone (and
+        # live_files() never lists one, so no version reads it)
+        spent = [t for t in part_dir.glob(f"{TOMBSTONE_PREFIX}*.parquet")
+                 if not any((part_dir / n).exists() for n in compacted_from(t))]
+        for tombstone in spent:
+            tombstone.unlink(missing_ok=True)
+        if spent:
+            try:
+                part_dir.rmdir()
+            except OSError:  # the date has been written again
+                pass
+
+
+# ========================= WRITER =========================
+
+
+def _authkey() -> bytes:
+    """Shared secret for the socket (owner-only file), so only this user's processes can submit."""
+    if not _KEY_PATH.exists():
+        _KEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(32))
+    return _KEY_PATH.read_bytes()
+
+
+def _try_lock():
+    """The exclusive writer lock, or None if another process holds it."""
+    _LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    f = open(_LOCK_PATH, "a")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        return None
+    return f
+
+
+def _resolve(future: Future, result, error: Exception | None) -> None:
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
+
+class Writer:
+    """The single writer: a job queue drained by one thread on one connection."""
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._lock = None
+
+    def start(self, listen: bool = True) -> "Writer":
+        self._lock = _try_lock()
+        if self._lock is None:
+            raise RuntimeError(f"another writer holds {_LOCK_PATH}")
+        threading.Thread(target=self._run, name="db-writer", daemon=True).start()
+        if listen:
+            authkey = _authkey()
+            DB_WRITER_SOCKET.unlink(missing_ok=True)  # left by a writer that died
+            listener = Listener(str(DB_WRITER_SOCKET), family="AF_UNIX", authkey=authkey)
+            threading.Thread(target=self._listen, args=(listener,),
+                             name="db-writer-listener", daemon=True).start()
+        return self
+
+    def submit(self, job: str, *args) -> Future:
+        future = Future()
+        self._jobs.put((job, args, future))
+        return future
+
+    def _run(self) -> None:
+        con = writer_connection()
+        try:
+            publish(con)  # changes a previous writer committed but never published
+        except Exception as e:
+            print(f"   ⚠️  publish failed: {e}")
+        pending_since = None  # monotonic time of the oldest unpublished coalesced change
+        while True:
+            timeout = (None if pending_since is None else
+                       max(0.0, pending_since + DB_PUBLISH_INTERVAL_SECONDS - time.monotonic()))
+            try:
+                batch = [self._jobs.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+
+            waiting, changed = [], False
+            for job, args, future in batch:
+                try:
+                    result, error = _run_job(con, job, args), None
+                except Exception as e:
+                    result, error = None, e
+                if job in COALESCED_JOBS:
+                    if error is None and pending_since is None:
+                        pending_since = time.monotonic()
+                    _resolve(future, result, error)
+                else:
+                    changed |= error is None and job != "publish"
+                    waiting.append((future, result, error))
+
+            due = (pending_since is not None
+                   and time.monotonic() - pending_since >= DB_PUBLISH_INTERVAL_SECONDS)
+            if not waiting and not due:
+                continue
+            publish_error = None
+            try:
+                publish(con, changed=changed or pending_since is not None)
+                pending_since = None
+            except Exception as e:
+                print(f"   ⚠️  publish failed: {e}")
+                publish_error = RuntimeError(f"committed, but publish failed: {e}")
+                publish_error.__cause__ = e
+                if pending_since is not None:
+                    pending_since = time.monotonic()  # retry after another interval
+            # Answer after publishing, so a submitter reads its own change
+            for future, result, error in waiting:
+                _resolve(future, result, error or publish_error)
+
+    def _listen(self, listener: Listener) -> None:
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception:  # failed handshake (wrong key) or a dropped client
+                continue
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        with conn:
+            try:
+                job, args = conn.recv()
+            except EOFError:
+                return
+            try:
+                conn.send(("ok", self.submit(job, *args).result()))
+            except Exception as e:
+                try:
+                    conn.send(("error", e))
+                except Exception:
+                    conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+def start_writer(listen: bool = True) -> Writer:
+    """Make this process the writer. submit() calls from here go straight to its queue."""
+    global _writer
+    _writer = Writer().start(listen)
+    return _writer
+
+
+def _send(job: str, args: tuple):
+    with Client(str(DB_WRITER_SOCKET), family="AF_UNIX", authkey=_authkey()) as conn:
+        conn.send((job, args))
+        status, value = conn.recv()
+    if status == "error":
+        raise value
+    return value
+
+
+def submit(job: str, *args):
+    """Run a write job through the single writer. Returns its result.
+
+    The change is published before this returns, except for COALESCED_JOBS
+    sent to a running writer: those are committed, and published within
+    DB_PUBLISH_INTERVAL_SECONDS.
+    """
+    if job not in JOBS:
+        raise ValueError(f"Unknown writer job: {job}")
+    if _writer is not None:
+        return _writer.submit(job, *args).result()
+    while True:
+        try:
+            return _send(job, args)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass  # no writer process: run it here
+        lock = _try_lock()
+        if lock is not None:
+            break
+        time.sleep(0.2)  # another script is writing, or a writer is starting up
+
+    try:
+        con = writer_connection()
+        try:
+            result = _run_job(con, job, args)
+            # No writer to publish on a timer: even a coalesced job publishes here
+            publish(con, changed=job != "publish")
+        finally:
+            con.close()
+    finally:
+        lock.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the mlb_betting.duckdb writer")
+    parser.add_argument("--status", action="store_true",
+                        help="Show the published versions and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        manifests = _manifests()
+        if not manifests:
+            print("⚠️  Nothing published yet")
+            return
+        current = json.loads(CURRENT.read_text())["version"] if CURRENT.exists() else None
+        for m in manifests:
+            flag = "  ← current" if m["version"] == current else ""
+            print(f"  v{m['version']:06d}  {m['published_at']}  {len(m['files']):>6,} files{flag}")
+        return
+
+    start_writer()
+    print(f"✅ Writer listening on {DB_WRITER_SOCKET}")
+    submit("publish")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
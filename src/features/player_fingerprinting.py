@@ -16,9 +16,6 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-import json
-import os
-import tempfile
 import numpy as np
 import duckdb
 from sklearn.neighbors import NearestNeighbors
@@ -27,6 +24,8 @@ import warnings
 warnings.filterwarnings("ignore")
 
 from config.settings import FANGRAPHS_DIR, REFERENCE_DIR, RAW_DIR
+from src.database.db_manager import cursor
+from src.database.parquet_writer import write_rows
 
 
 # ========================= FEATURE DEFINITIONS =========================
@@ -128,11 +127,11 @@ class PlayerComps:
         try:
             rows = con.execute(f"""
                 SELECT {select_clause}
-                FROM read_parquet('{pattern}')
-                WHERE Season >= {start_year}
-                  AND Season <= {end_year}
+                FROM read_parquet($pattern)
+                WHERE Season >= $start_year
+                  AND Season <= $end_year
                   AND {qual_filter}
-            """).fetchall()
+            """, {"pattern": pattern, "start_year": start_year, "end_year": end_year}).fetchall()
             col_names = [d[0] for d in con.description]
         except Exception as e:
             print(f"   ⚠️  Error reading local FG data: {e}")
@@ -192,7 +191,7 @@ class PlayerComps:
         Saves separate caches for batters and pitchers.
         """
         print("📥 Building historical comps database...")
-        con = duckdb.connect()
+        con = cursor()
 
         for is_batter in [True, False]:
             label = "batter" if is_batter else "pitcher"
@@ -217,27 +216,16 @@ class PlayerComps:
                 r["service_time"] = r.get("season", end_year) - r["debut_year"]
                 r["is_batter"] = is_batter
 
-            # Save cache via DuckDB
-            self._save_cache(rows, cache_path, con)
+            # Save cache via the Arrow writer
+            self._save_cache(rows, cache_path)
             print(f"   ✅ Cached {len(rows)} {label} player-seasons → {cache_path.name}")
 
         con.close()
         print("✅ Historical comps database ready.")
 
-    def _save_cache(self, rows: list[dict], cache_path: Path,
-                    con: duckdb.DuckDBPyConnection) -> None:
-        """Write rows to parquet via DuckDB temp JSON pattern."""
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-        try:
-            with os.fdopen(tmp_fd, "w") as f:
-                json.dump(rows, f)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            con.execute(
-                f"COPY (SELECT * FROM read_json_auto('{tmp_path}')) "
-                f"TO '{cache_path}' (FORMAT PARQUET, COMPRESSION ZSTD)"
-            )
-        finally:
-            os.unlink(tmp_path)
+    def _save_cache(self, rows: list[dict], cache_path: Path) -> None:
+        """Write rows to the comps cache parquet via the shared Arrow writer."""
+        write_rows(rows, cache_path, "comps_cache")
 
     def _load_cache(self, is_batter: bool, con: duckdb.DuckDBPyConnection) -> list[dict] | None:
         """Load cached data for given player type."""
@@ -334,14 +322,14 @@ class PlayerComps:
             self.feature_cols = PITCHER_FEATURE_COLS
             self.target_cols = PITCHER_TARGET_COLS
 
-        con = duckdb.connect()
+        con = cursor()
 
         # Try cache first, then build if missing
         rows = self._load_cache(is_batter, con)
         if rows is None:
             con.close()
             self.build_historical_data()
-            con = duckdb.connect()
+            con = cursor()
             rows = self._load_cache(is_batter, con)
             if rows is None:
                 con.close()
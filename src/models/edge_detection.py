@@ -8,6 +8,10 @@ Normalizes all odds sources to implied win probability:
 
 Flags +EV opportunities where model disagrees with market.
 
+Every source's rows carry the canonical game_pk stamped at ingest
+(src/database/game_keys.py), so model results and market prices are joined
+on that integer in DuckDB — no team-name mapping, and doubleheaders stay apart.
+
 Usage:
   python src/models/edge_detection.py               # today's edges
   python src/models/edge_detection.py 2026-03-17     # specific date
@@ -18,48 +22,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import glob
-import duckdb
 from datetime import datetime, timezone
 
-from config.settings import BRONZE_ODDS_DIR, SIMULATIONS_DIR
-
-
-# ========================= TEAM NAME MAP =========================
-
-TEAM_ABBREV_TO_FULL: dict[str, str] = {
-    "ARI": "Arizona Diamondbacks",
-    "ATL": "Atlanta Braves",
-    "BAL": "Baltimore Orioles",
-    "BOS": "Boston Red Sox",
-    "CHC": "Chicago Cubs",
-    "CWS": "Chicago White Sox",
-    "CIN": "Cincinnati Reds",
-    "CLE": "Cleveland Guardians",
-    "COL": "Colorado Rockies",
-    "DET": "Detroit Tigers",
-    "HOU": "Houston Astros",
-    "KC":  "Kansas City Royals",
-    "LAA": "Los Angeles Angels",
-    "LAD": "Los Angeles Dodgers",
-    "MIA": "Miami Marlins",
-    "MIL": "Milwaukee Brewers",
-    "MIN": "Minnesota Twins",
-    "NYM": "New York Mets",
-    "NYY": "New York Yankees",
-    "OAK": "Athletics",
-    "PHI": "Philadelphia Phillies",
-    "PIT": "Pittsburgh Pirates",
-    "SD":  "San Diego Padres",
-    "SF":  "San Francisco Giants",
-    "SEA": "Seattle Mariners",
-    "STL": "St. Louis Cardinals",
-    "TB":  "Tampa Bay Rays",
-    "TEX": "Texas Rangers",
-    "TOR": "Toronto Blue Jays",
-    "WSH": "Washington Nationals",
-}
-
-TEAM_FULL_TO_ABBREV: dict[str, str] = {v: k for k, v in TEAM_ABBREV_TO_FULL.items()}
+from config.settings import SIMULATIONS_DIR
+from src.database import queries
+from src.database.game_keys import resolve_game_pk
 
 
 # ========================= CONVERSIONS =========================
@@ -93,153 +60,30 @@ def _load_sim_results(game_date: str) -> list[dict]:
     if not files:
         return []
 
-    con = duckdb.connect()
-    rows = con.execute(f"""
-        SELECT * FROM read_parquet('{files[0]}')
-        WHERE game_date = '{game_date}'
-    """).fetchall()
-    cols = [d[0] for d in con.description]
-    con.close()
-    return [dict(zip(cols, row)) for row in rows]
-
-
-def _load_odds_api(game_date: str, year: str) -> dict:
-    """Load h2h odds → {(away_abbrev, home_abbrev): {book: {away_prob, home_prob}}}."""
-    path = BRONZE_ODDS_DIR / f"the_odds_api_{year}.parquet"
-    if not path.exists():
-        return {}
-
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT home_team, away_team, bookmaker, outcome_name, odds
-            FROM (
-                SELECT *, row_number() OVER (
-                    PARTITION BY home_team, away_team, bookmaker, outcome_name
-                    ORDER BY snapshot_timestamp DESC
-                ) AS rn
-                FROM read_parquet('{path}')
-                WHERE market = 'h2h'
-                  AND snapshot_date = '{game_date}'
-            )
-            WHERE rn = 1
-        """).fetchall()
-    except Exception:
-        rows = []
-    finally:
-        con.close()
-
-    games: dict = {}
-    for home_full, away_full, bookmaker, outcome_name, odds_val in rows:
-        if not home_full or not away_full:
-            continue
-        away_abbr = TEAM_FULL_TO_ABBREV.get(away_full, away_full)
-        home_abbr = TEAM_FULL_TO_ABBREV.get(home_full, home_full)
-        key = (away_abbr, home_abbr)
-
-        if key not in games:
-            games[key] = {}
-        if bookmaker not in games[key]:
-            games[key][bookmaker] = {}
-
-        implied = american_to_implied(odds_val)
-        team_abbr = TEAM_FULL_TO_ABBREV.get(outcome_name, outcome_name)
-        if team_abbr == away_abbr:
-            games[key][bookmaker]["away_prob"] = implied
-        elif team_abbr == home_abbr:
-            games[key][bookmaker]["home_prob"] = implied
-
-    return games
-
-
-def _load_kalshi(game_date: str, year: str) -> dict:
-    """Load Kalshi game_winner → {(away, home): {away_prob, home_prob}}."""
-    path = BRONZE_ODDS_DIR / f"kalshi_{year}.parquet"
-    if not path.exists():
-        return {}
-
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT away_team, home_team, winner_side, yes_bid, yes_ask
-            FROM (
-                SELECT *, row_number() OVER (
-                    PARTITION BY away_team, home_team, winner_side
-                    ORDER BY snapshot_timestamp DESC
-                ) AS rn
-                FROM read_parquet('{path}')
-                WHERE market_type = 'game_winner'
-                  AND game_date = '{game_date}'
-                  AND status = 'active'
-                  AND (yes_ask - yes_bid) < 0.40
-            )
-            WHERE rn = 1
-        """).fetchall()
-    except Exception:
-        rows = []
-    finally:
-        con.close()
-
-    games: dict = {}
-    for away, home, winner_side, yes_bid, yes_ask in rows:
-        key = (away, home)
-        if key not in games:
-            games[key] = {}
-        implied = kalshi_to_implied(yes_bid, yes_ask)
-        if implied is None or implied < 0.10 or implied > 0.90:
-            continue
-        if winner_side == away:
-            games[key]["away_prob"] = implied
-        elif winner_side == home:
-            games[key]["home_prob"] = implied
-
-    return games
-
-
-def _load_polymarket(game_date: str, year: str) -> dict:
-    """Load Polymarket moneyline → {(away_abbrev, home_abbrev): {away_prob, home_prob}}."""
-    path = BRONZE_ODDS_DIR / f"polymarket_{year}.parquet"
-    if not path.exists():
-        return {}
-
-    con = duckdb.connect()
-    try:
-        rows = con.execute(f"""
-            SELECT away_team, home_team, yes_price, no_price
-            FROM (
-                SELECT *, row_number() OVER (
-                    PARTITION BY away_team, home_team
-                    ORDER BY snapshot_timestamp DESC
-                ) AS rn
-                FROM read_parquet('{path}')
-                WHERE market_type = 'game_winner'
-                  AND group_item_title = 'moneyline'
-                  AND event_date = '{game_date}'
-                  AND accepting_orders = TRUE
-                  AND yes_price > 0.05 AND yes_price < 0.95
-            )
-            WHERE rn = 1
-        """).fetchall()
-    except Exception:
-        rows = []
-    finally:
-        con.close()
-
-    games: dict = {}
-    for away_full, home_full, yes_price, no_price in rows:
-        if not away_full or not home_full:
-            continue
-        away_abbr = TEAM_FULL_TO_ABBREV.get(away_full, away_full)
-        home_abbr = TEAM_FULL_TO_ABBREV.get(home_full, home_full)
-        key = (away_abbr, home_abbr)
-        # yes_price = outcomePrices[0] = away team probability
-        # no_price  = outcomePrices[1] = home team probability
-        games[key] = {
-            "away_prob": yes_price if yes_price else None,
-            "home_prob": no_price if no_price else None,
-        }
+    sims = queries.sim_results_for_date(files[0], game_date)
+    for sim in sims:
+        if sim.get("game_pk") is None:  # results saved before game_pk was carried through
+            sim["game_pk"] = resolve_game_pk(game_date, sim["away_team"], sim["home_team"])
+    return sims
+
+
+def _load_market_probs(game_date: str, sims: list[dict]) -> dict[str, dict]:
+    """Join model results to every source on game_pk.
+
+    Returns {source: {game_pk: {book: {away_prob, home_prob}}}} for the
+    simulated games (empty, with a warning, if latest_odds doesn't exist
+    yet). The per-source SQL is queries.MARKET_SQL.
+    """
+    out: dict[str, dict] = {source: {} for source in queries.MARKET_SQL}
+    rows = queries.market_probs(game_date, [s.get("game_pk") for s in sims])
+    if rows is None:
+        print("⚠️  No latest_odds table in the published database — no market prices to compare.\n"
+              "   Build it with: python src/database/latest_odds.py --rebuild")
+        return out
 
-    return games
+    for source, game_pk, book, away_prob, home_prob in rows:
+        out[source].setdefault(game_pk, {})[book] = {"away_prob": away_prob, "home_prob": home_prob}
+    return out
 
 
 # ========================= EDGE DETECTION =========================
@@ -255,16 +99,16 @@ def find_edges(game_date: str | None = None, min_edge: float = 0.03) -> list[dic
     """
     if game_date is None:
         game_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    year = game_date[:4]
 
     sim_results = _load_sim_results(game_date)
     if not sim_results:
         print(f"⚠️  No simulation results for {game_date}")
         return []
 
-    odds_api = _load_odds_api(game_date, year)
-    kalshi = _load_kalshi(game_date, year)
-    polymarket = _load_polymarket(game_date, year)
+    markets = _load_market_probs(game_date, sim_results)
+    odds_api = markets["the_odds_api"]
+    kalshi = {pk: books["kalshi"] for pk, books in markets["kalshi"].items()}
+    polymarket = {pk: books["polymarket"] for pk, books in markets["polymarket"].items()}
 
     print(f"\n📊 Edge detection for {game_date}")
     print(f"   Model: {len(sim_results)} games")
@@ -280,7 +124,7 @@ def find_edges(game_date: str | None = None, min_edge: float = 0.03) -> list[dic
         home = sim["home_team"]
         model_away = sim["away_win_prob"]
         model_home = sim["home_win_prob"]
-        key = (away, home)
+        key = sim["game_pk"]
 
         row = {
             "away_team": away,
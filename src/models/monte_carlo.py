@@ -17,14 +17,12 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-import json
-import os
-import tempfile
 import numpy as np
-import duckdb
 from datetime import datetime, timezone
 
 from config.settings import SILVER_LINEUPS_DIR, SIMULATIONS_DIR
+from src.database import queries
+from src.database.parquet_writer import write_rows
 from src.models.projections import ProjectionEngine
 
 
@@ -69,16 +67,7 @@ class MonteCarloSimulator:
             print(f"⚠️  No lineup file: {silver_path}")
             return []
 
-        con = duckdb.connect()
-        rows = con.execute(f"""
-            SELECT *
-            FROM read_parquet('{silver_path}')
-            WHERE game_date = '{game_date}'
-        """).fetchall()
-        cols = [d[0] for d in con.description]
-        con.close()
-
-        games = [dict(zip(cols, row)) for row in rows]
+        games = queries.lineups_for_date(silver_path, game_date)
         confirmed = [g for g in games if g.get("is_confirmed")]
         print(f"📋 {len(games)} games for {game_date} ({len(confirmed)} confirmed)")
         return games
@@ -118,6 +107,7 @@ class MonteCarloSimulator:
 
         return {
             "game_date": str(game.get("game_date", ""))[:10],
+            "game_pk": game.get("game_pk"),
             "away_team": away,
             "home_team": home,
             "away_runs_proj": round(float(away_rs.mean()), 2),
@@ -171,26 +161,10 @@ class MonteCarloSimulator:
     def _save_results(self, results: list[dict]) -> None:
         if not results:
             return
-        SIMULATIONS_DIR.mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M")
         target = SIMULATIONS_DIR / f"simulation_results_{ts}.parquet"
-
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".json")
-        try:
-            with os.fdopen(tmp_fd, "w") as f:
-                json.dump(results, f)
-            con = duckdb.connect()
-            con.execute(
-                f"COPY (SELECT * FROM read_json_auto('{tmp_path}')) "
-                f"TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)"
-            )
-            n = con.execute(
-                f"SELECT COUNT(*) FROM read_parquet('{target}')"
-            ).fetchone()[0]
-            con.close()
-            print(f"💾 Saved {target.name}: {n} rows")
-        finally:
-            os.unlink(tmp_path)
+        n = write_rows(results, target, "simulation_results")
+        print(f"💾 Saved {target.name}: {n} rows")
 
 
 if __name__ == "__main__":
@@ -8,6 +8,11 @@ Layer 2 (Kalman Blend):   Placeholder — will blend KNN prior with in-season ac
 
 The get_player_woba() interface stays the same regardless of active layer.
 
+Game logs are read from the materialized t_game_logs_batting table when it is
+current (DB_MATERIALIZE, see src/database/db_manager.py), else from Parquet.
+The career wOBA and FanGraphs aggregations go through db_manager.cached_query,
+so re-building the engine over unchanged files skips the scans.
+
 Usage:
   python src/models/projections.py
 """
@@ -16,8 +21,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-import duckdb
 from config.settings import GAME_BY_GAME_DIR, REFERENCE_DIR, FANGRAPHS_DIR
+from src.database.db_manager import analytics_connection, cached_query
+from src.database.lake import live_files, parquet_list_sql
 
 
 # Fallback if no data is available
@@ -31,7 +37,7 @@ _DEFAULT_LEAGUE_AVG_WOBA = 0.315
 class ProjectionEngine:
     def __init__(self):
         print("📊 Building player projections...")
-        con = duckdb.connect()
+        con, self._materialized = analytics_connection(["v_game_logs_batting"])
 
         self._load_linear_weights(con)
         self._build_woba_lookup(con)
@@ -77,7 +83,13 @@ class ProjectionEngine:
 
     def _build_woba_lookup(self, con):
         """Calculate PA-weighted career wOBA per player from game logs + linear weights."""
-        bat_pattern = str(GAME_BY_GAME_DIR / "batting_*.parquet")
+        if "v_game_logs_batting" in self._materialized:
+            bat_source = "t_game_logs_batting"
+        else:
+            # Live files only: superseded and tombstoned partitions stay on disk until the next publish
+            files = live_files(GAME_BY_GAME_DIR / "batting_game_logs_*" / "game_date=*" / "*.parquet")
+            bat_source = (f"read_parquet({parquet_list_sql(files)}, "
+                          "union_by_name=true, hive_partitioning=true)")
 
         # Insert cleaned linear weights into a temp table for the join
         con.execute("""
@@ -93,7 +105,8 @@ class ProjectionEngine:
                  w["w2B"], w["w3B"], w["wHR"]],
             )
 
-        results = con.execute(f"""
+        # _lw comes from the linear weights file, so its fingerprint covers the temp table
+        results = cached_query(con, f"""
             SELECT
                 b.mlbID,
                 SUM(
@@ -106,16 +119,16 @@ class ProjectionEngine:
                     lw.wHR  * COALESCE(b.HR,  0)
                 ) / NULLIF(SUM(b.PA), 0) AS woba,
                 SUM(b.PA) AS total_pa
-            FROM read_parquet('{bat_pattern}') b
+            FROM {bat_source} b
             JOIN _lw lw ON b.game_year = lw.season
             WHERE b.PA > 0 AND b.mlbID IS NOT NULL
             GROUP BY b.mlbID
-        """).fetchall()
+        """, depends_on=[REFERENCE_DIR / "linear_weights.parquet"])
 
         self._player_woba: dict[int, float] = {}
         total_woba_num = 0.0
         total_pa = 0
-        for mlb_id, woba, pa in results:
+        for mlb_id, woba, pa in zip(*results.to_pydict().values()):
             if woba is not None:
                 self._player_woba[int(mlb_id)] = woba
                 total_woba_num += woba * pa
@@ -160,7 +173,7 @@ class ProjectionEngine:
         """
         bat_pattern = str(FANGRAPHS_DIR / "batting_game_logs_*.parquet")
 
-        rows = con.execute(f"""
+        rows = cached_query(con, f"""
             SELECT
                 CAST("IDfg" AS VARCHAR) AS idfg,
                 "Season" AS season,
@@ -188,23 +201,21 @@ class ProjectionEngine:
                   AND "Barrel%" IS NOT NULL
             )
             WHERE rn = 1
-        """).fetchall()
-        col_names = [d[0] for d in con.description]
+        """).to_pylist()
 
         self._fg_stats: dict[str, dict] = {}
-        for row in rows:
-            d = dict(zip(col_names, row))
+        for d in rows:
             idfg = d.pop("idfg")
             self._fg_stats[idfg] = d
 
         # Compute debut_year per player from all FG data
-        debut_rows = con.execute(f"""
+        debut = cached_query(con, f"""
             SELECT CAST("IDfg" AS VARCHAR) AS idfg, MIN("Season") AS debut_year
             FROM read_parquet('{bat_pattern}')
             WHERE "PA" >= 50
             GROUP BY "IDfg"
-        """).fetchall()
-        debut_map = {r[0]: r[1] for r in debut_rows}
+        """)
+        debut_map = dict(zip(debut["idfg"].to_pylist(), debut["debut_year"].to_pylist()))
 
         for idfg, stats in self._fg_stats.items():
             debut = debut_map.get(idfg, stats.get("season", 2020))
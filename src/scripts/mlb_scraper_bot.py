@@ -19,6 +19,9 @@ from src.data_ingestion.odds.the_odds_api_fetcher import fetch_odds, fetch_futur
 from src.data_ingestion.odds.rundown_fetcher import fetch_rundown_mlb
 from src.data_ingestion.odds.kalshi_fetcher import fetch_kalshi_mlb
 from src.data_ingestion.odds.polymarket_fetcher import fetch_polymarket_mlb
+from src.database.compaction import compact_lake
+from src.database.line_movement import seal_games
+from src.database.writer import start_writer
 
 scheduler = BackgroundScheduler()
 current_interval = 30
@@ -64,9 +67,22 @@ def scrape_all():
         print(f"⏰ Switching to every {new_interval} minutes")
         scheduler.reschedule_job('scrape_job', trigger=IntervalTrigger(minutes=new_interval))
 
+def compact_all():
+    """Merge yesterday's (and older) per-scrape odds part files. Runs off the
+    scrape thread; today's partition is never touched, so it can't race a scrape."""
+    print(f"\n🗜️  Compaction started @ {datetime.now():%H:%M:%S} ET")
+    results = compact_lake()
+    for r in results:
+        print(f"   {r['partition']}: {r['files_before']} → {r['files_after']} files")
+    print(f"✅ Compacted {len(results)} partition(s)")
+    print(f"✅ Sealed line-movement series for {seal_games()} finished game(s)")
+
 def main():
     print("Starting MLB Scraper Bot (+ Kalshi & Polymarket)")
+    # Sole writer of mlb_betting.duckdb; scripts and notebooks submit to it over a local socket
+    start_writer()
     scheduler.add_job(scrape_all, trigger=IntervalTrigger(minutes=30), id='scrape_job', next_run_time=datetime.now())
+    scheduler.add_job(compact_all, trigger=IntervalTrigger(hours=6), id='compact_job')
     scheduler.start()
     try:
         while True:
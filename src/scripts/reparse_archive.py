@@ -0,0 +1,196 @@
+"""
+Rebuild bronze odds partitions (and lineups) from the raw response archive.
+
+After changing a fetcher's parser (_normalize_response, _market_to_row,
+_build_game_rows, parse_rotowire, ...) run this to re-derive past scrapes
+from the archived payloads (src/database/raw_archive.py) instead of
+re-scraping.
+
+Every (source, snapshot_date) partition is rebuilt by one worker process, in
+parallel across cores:
+  1. Each archived scrape of the day is decompressed and run through the
+     fetcher's current parse_archived(), then stamped with game_pk.
+  2. Rows already in the partition from scrapes that were never archived
+     (before the archive existed) are kept as they are.
+  3. The result replaces the partition's part files with one sorted file,
+     atomically, using the compactor's commit protocol.
+Rotowire lineups live in one bronze and one silver file per year, so each
+year is one task: its archived pages are re-parsed (lineups.parse_archived)
+and lineups.replace_scrapes() swaps those scrapes' rows in both files.
+Once every partition is done, one new database version is published
+(writer.py), so readers switch to the rebuilt files together.
+
+Only closed days (before today, UTC) are rebuilt unless --include-today is
+given. The rebuild writes the full-snapshot layout (data/bronze/odds/).
+Run `python src/database/latest_odds.py --rebuild` afterwards to refresh
+latest_odds.
+
+Usage:
+    python src/scripts/reparse_archive.py                              # everything archived
+    python src/scripts/reparse_archive.py --source kalshi --start 2026-04-01 --end 2026-04-30
+    python src/scripts/reparse_archive.py --dry-run
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import argparse
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from src.database.compaction import replace_partition
+from src.database.db_manager import cursor
+from src.database.game_keys import stamp_game_pk
+from src.database.lake import DELTA_MODE, PARTITION_COLS, live_files, odds_partition_dir
+from src.database.parquet_writer import rows_to_table
+from src.database.raw_archive import archived_dates, archived_sources, read_blob, read_index
+from src.database.writer import submit
+
+# Fetcher module whose parse_archived() turns one scrape's responses into rows
+PARSERS = {
+    "the_odds_api": "src.data_ingestion.odds.the_odds_api_fetcher",
+    "kalshi":       "src.data_ingestion.odds.kalshi_fetcher",
+    "polymarket":   "src.data_ingestion.odds.polymarket_fetcher",
+    "rundown":      "src.data_ingestion.odds.rundown_fetcher",
+    "rotowire_lineups": "src.data_ingestion.lineups",
+}
+
+# Not an odds source: rebuilt per year by reparse_lineups()
+LINEUPS = "rotowire_lineups"
+
+
+def reparse_partition(source: str, snapshot_date: str, dry_run: bool = False) -> dict:
+    """Rebuild one (source, snapshot_date) partition from the archive. Runs in a worker."""
+    parse = importlib.import_module(PARSERS[source]).parse_archived
+    scrapes = read_index(source, snapshot_date)
+
+    rows: list[dict] = []
+    for snapshot_ts, entries in scrapes.items():
+        pages = [(e["params"], read_blob(e["sha256"], e["ext"])) for e in entries]
+        scrape_rows = parse(pages, snapshot_ts)
+        stamp_game_pk(source, scrape_rows)
+        rows.extend(scrape_rows)
+
+    dataset = f"odds_{source}"
+    part_dir = odds_partition_dir(source, snapshot_date, delta=False)
+    inputs = live_files(part_dir / "*.parquet")
+    stats = {"partition": f"source={source}/snapshot_date={snapshot_date}",
+             "scrapes": len(scrapes), "rows_parsed": len(rows), "files_before": len(inputs)}
+    if dry_run:
+        return stats
+
+    table = rows_to_table(rows, dataset, exclude=PARTITION_COLS)
+    if inputs:
+        # Keep rows of scrapes that predate the archive
+        con = cursor()
+        try:
+            con.register("_new", table)
+            con.register("_archived", pa.table({"ts": list(scrapes)}))
+            file_list = ", ".join("'{}'".format(str(p).replace("'", "''")) for p in inputs)
+            table = con.execute(f"""
+                SELECT * FROM read_parquet([{file_list}], union_by_name=true, hive_partitioning=false)
+                WHERE snapshot_timestamp NOT IN (SELECT CAST(ts AS TIMESTAMPTZ) FROM _archived)
+                UNION ALL BY NAME
+                SELECT * FROM _new
+            """).to_arrow_table()
+        finally:
+            con.close()
+    stats["rows_kept"] = table.num_rows - len(rows)
+
+    if table.num_rows:
+        part_dir.mkdir(parents=True, exist_ok=True)
+        replace_partition(part_dir, table, dataset, inputs)
+    stats["rows"] = table.num_rows
+    return stats
+
+
+def reparse_lineups(year: str, dates: list[str], dry_run: bool = False) -> dict:
+    """Rebuild one year's lineup files from the archived Rotowire pages of `dates`. Runs in a worker."""
+    lineups = importlib.import_module(PARSERS[LINEUPS])
+    rows: list[dict] = []
+    scrape_ts: list[str] = []
+    for snapshot_date in dates:
+        for snapshot_ts, entries in read_index(LINEUPS, snapshot_date).items():
+            pages = [(e["params"], read_blob(e["sha256"], e["ext"])) for e in entries]
+            rows.extend(lineups.parse_archived(pages, snapshot_ts))
+            scrape_ts.append(snapshot_ts)
+
+    stats = {"partition": f"source={LINEUPS}/year={year}",
+             "scrapes": len(scrape_ts), "rows_parsed": len(rows)}
+    if dry_run:
+        return stats
+    stats.update(lineups.replace_scrapes(rows, scrape_ts, int(year)))
+    return stats
+
+
+def reparse_archive(sources: tuple[str, ...], start: str | None = None, end: str | None = None,
+                    include_open: bool = False, workers: int | None = None,
+                    dry_run: bool = False) -> list[dict]:
+    """Rebuild every archived partition of the given sources, one process per partition
+    (per year for lineups)."""
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    tasks = []  # (function, args, label)
+    for source in sources:
+        dates = [d for d in archived_dates(source)
+                 if not ((start and d < start) or (end and d > end))
+                 and (d < today or include_open)]
+        if source == LINEUPS:
+            years: dict[str, list[str]] = {}
+            for d in dates:
+                years.setdefault(d[:4], []).append(d)
+            tasks += [(reparse_lineups, (year, ds), f"{source} {year}") for year, ds in years.items()]
+        else:
+            tasks += [(reparse_partition, (source, d), f"{source} {d}") for d in dates]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {pool.submit(fn, *args, dry_run): label for fn, args, label in tasks}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"   ❌ {futures[future]}: {e}")
+    if results and not dry_run:
+        submit("publish")
+    return sorted(results, key=lambda r: r["partition"])
+
+
+def main():
+    sources = tuple(s for s in archived_sources() if s in PARSERS)
+    parser = argparse.ArgumentParser(description="Rebuild bronze odds and lineups from the raw response archive")
+    parser.add_argument("--source", choices=tuple(PARSERS), action="append",
+                        help="Source to rebuild (repeatable; default: every archived source)")
+    parser.add_argument("--start", help="First snapshot_date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last snapshot_date (YYYY-MM-DD)")
+    parser.add_argument("--include-today", action="store_true",
+                        help="Also rebuild today's partition")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Parse the archive and report, without writing")
+    args = parser.parse_args()
+
+    if DELTA_MODE:
+        print("⚠️  ODDS_INGEST_MODE=delta: the rebuild writes the full layout under data/bronze/odds/")
+
+    t0 = time.perf_counter()
+    results = reparse_archive(tuple(args.source) if args.source else sources,
+                              start=args.start, end=args.end, include_open=args.include_today,
+                              workers=args.workers, dry_run=args.dry_run)
+    if not results:
+        print("✅ Nothing archived to re-parse")
+        return
+    for r in results:
+        detail = "(dry run)" if args.dry_run else f"→ {r['rows']:,} rows ({r['rows_kept']:,} unarchived kept)"
+        print(f"   🔁 {r['partition']}: {r['scrapes']} scrapes, {r['rows_parsed']:,} rows parsed {detail}")
+    print(f"✅ {'Would rebuild' if args.dry_run else 'Rebuilt'} {len(results)} partition(s) "
+          f"in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()